@@ -0,0 +1,109 @@
+import json
+import platform
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# The benchmarks are started from any folder, the modules of the program and the json
+# databases are in the main folder of the project
+REPO_FOLDER = Path(__file__).resolve().parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.insert(0, str(REPO_FOLDER))
+
+from campaign import load_campaign
+from spec_cache import load_spec_bundle
+from test_builder import build_test, find_macro_type
+
+# Campaign used for the vehicle information and dimensions of the synthetic campaigns
+EXAMPLE_CAMPAIGN = REPO_FOLDER / "campaigns" / "example.json"
+
+
+def load_database() -> dict:
+    return load_spec_bundle(REPO_FOLDER)
+
+
+def example_vehicle(database: dict):
+    info, dimensions, _ = load_campaign(
+        EXAMPLE_CAMPAIGN,
+        database["specs"],
+        database["robustness"],
+        database["test_types"],
+    )
+    return info, dimensions
+
+
+# A campaign of "count" tests with random options (always the same with the same seed)
+# picked from all the specs in test_json/, like a user that adds the tests by hand.
+# With many tests the same test comes out more than once, like the repeated runs
+def synthetic_tests(database: dict, count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    specs = [database["specs"][name] for name in sorted(database["specs"])]
+    robustness_spec = database["robustness"]
+
+    tests = []
+    for _ in range(count):
+        spec = rng.choice(specs)
+        parameters = {
+            variable["key"]: rng.choice(variable["options"])["value"]
+            for variable in spec["test_variables"]
+            if variable["user_input"]
+        }
+        tests.append(
+            build_test(
+                spec,
+                robustness_spec,
+                find_macro_type(database["test_types"], spec["name"]),
+                parameters,
+                random_robustness(rng, robustness_spec),
+            )
+        )
+
+    return tests
+
+
+def random_robustness(rng: random.Random, robustness_spec: dict) -> dict:
+    robustness_type = rng.choice(robustness_spec["robustness"])
+    robustness = {"type": robustness_type["key"]}
+    if not robustness_type["layers"]:
+        return robustness
+
+    layer = rng.choice(robustness_type["layers"])
+    robustness["layer"] = layer["key"]
+    if layer["options"]:
+        robustness["parameter"] = rng.choice(layer["options"])["value"]
+
+    return robustness
+
+
+# Percentile with linear interpolation of a list of values
+def percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    if not values:
+        return 0.0
+
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+# Appending the results as one json line to the log, so the different versions can be
+# compared on the same PC (like the log of startup_timing.py)
+def write_log(log_path: Path, results: list, **details):
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        **details,
+        "results": results,
+    }
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+# Last record of a log written by write_log
+def read_last_record(log_path: Path) -> dict | None:
+    with open(log_path, "r", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    return json.loads(lines[-1]) if lines else None
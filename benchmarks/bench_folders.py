@@ -0,0 +1,318 @@
+import argparse
+import builtins
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from bench_common import (
+    example_vehicle,
+    load_database,
+    read_last_record,
+    synthetic_tests,
+    write_log,
+)
+
+import file_folder_manager
+import test_record
+
+# Number of tests of the synthetic campaigns
+SIZES = (10, 1000, 50000)
+# Functions of os that touch the file system, counted during the instrumented run
+COUNTED_CALLS = (
+    "mkdir",
+    "open",
+    "write",
+    "close",
+    "stat",
+    "lstat",
+    "scandir",
+    "replace",
+    "rename",
+    "unlink",
+    "rmdir",
+)
+# Number of folders with the same name created in the create_unique_folder benchmark
+SAME_NAME_FOLDERS = 200
+DEFAULT_LOG = "benchmark_folders.jsonl"
+
+
+# Benchmark of the creation of the campaign folders, for every size of the synthetic
+# campaign and every target folder (a tmpfs to measure the program and a disk to see the
+# cost of the file system) it measures:
+# - the time of folder_creations and the tests created every second
+# - the calls to the file system done for every test
+# - the memory peak during the creation
+# - the time of the single functions used for every test
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measures the creation of the folders of synthetic campaigns."
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(SIZES),
+        help="Number of tests of the synthetic campaigns (default: 10 1000 50000)",
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        metavar="NAME=PATH",
+        help="Folder where the campaigns are created, can be repeated "
+        "(default: tmpfs=/dev/shm if present and disk=the temporary folder)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of threads passed to folder_creations (default: 1)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="Times the timed creation is repeated, the best time is used (default: 1)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random tests")
+    parser.add_argument(
+        "--log",
+        type=Path,
+        nargs="?",
+        const=Path(DEFAULT_LOG),
+        help=f"Appends the results as a json line to the file (default: {DEFAULT_LOG})",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Log of a previous version, fails if the throughput is lower than its "
+        "last record by more than the tolerance",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown compared to the baseline (default: 0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    targets = parse_targets(args.target) if args.target else default_targets()
+
+    database = load_database()
+    info, dimensions = example_vehicle(database)
+
+    results = []
+    for size in args.sizes:
+        tests = synthetic_tests(database, size, args.seed)
+
+        functions = bench_functions(tests, dimensions, info)
+        print(f"\n{size} tests, time of every call:")
+        for name, seconds in functions.items():
+            print(f"  {name:<28} {seconds * 1e6:10.2f} us")
+
+        for target_name, target in targets.items():
+            result = bench_campaign(
+                target, tests, dimensions, info, args.workers, args.repeat
+            )
+            result.update(target=target_name, tests=size, functions=functions)
+            results.append(result)
+            print_result(result)
+
+    if args.log:
+        write_log(args.log, results, workers=args.workers)
+
+    if args.baseline:
+        return compare_baseline(args.baseline, results, args.tolerance)
+
+    return 0
+
+
+def parse_targets(values: list) -> dict:
+    targets = {}
+    for value in values:
+        name, separator, path = value.partition("=")
+        if not separator:
+            name, path = Path(value).name, value
+        targets[name] = Path(path)
+    return targets
+
+
+def default_targets() -> dict:
+    targets = {}
+    # On some Linux also the temporary folder is a tmpfs, in that case the disk has to
+    # be passed with --target
+    if Path("/dev/shm").is_dir():
+        targets["tmpfs"] = Path("/dev/shm")
+    targets["disk"] = Path(tempfile.gettempdir())
+    return targets
+
+
+# Creating the campaign in a new folder of the target: first only measuring the time
+# (the best of "repeat" times) and then counting the calls and the memory (which slows
+# everything down)
+def bench_campaign(
+    target: Path, tests: list, dimensions, info, workers: int, repeat: int = 1
+) -> dict:
+    folder = Path(tempfile.mkdtemp(prefix="bench-", dir=target))
+    try:
+        seconds = None
+        for index in range(max(repeat, 1)):
+            start = time.perf_counter()
+            file_folder_manager.folder_creations(
+                folder / f"timed{index}", tests, dimensions, info, workers=workers
+            )
+            elapsed = time.perf_counter() - start
+            seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+        calls = {}
+        tracemalloc.start()
+        try:
+            with count_calls(calls):
+                file_folder_manager.folder_creations(
+                    folder / "counted", tests, dimensions, info, workers=workers
+                )
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    return {
+        "seconds": round(seconds, 4),
+        "tests_per_second": round(len(tests) / seconds, 1),
+        "calls_per_test": round(sum(calls.values()) / len(tests), 2),
+        "calls": calls,
+        "peak_memory_bytes": peak,
+    }
+
+
+# Replacing the functions of os (and the open of python) with a version that counts the
+# calls, the original ones are restored at the end
+@contextmanager
+def count_calls(calls: dict):
+    lock = threading.Lock()
+    originals = []
+
+    def replace(module, name, label):
+        original = getattr(module, name)
+
+        def counted(*args, **kwargs):
+            with lock:
+                calls[label] = calls.get(label, 0) + 1
+            return original(*args, **kwargs)
+
+        originals.append((module, name, original))
+        setattr(module, name, counted)
+
+    for name in COUNTED_CALLS:
+        replace(os, name, f"os.{name}")
+    replace(builtins, "open", "open")
+
+    try:
+        yield calls
+    finally:
+        for module, name, original in originals:
+            setattr(module, name, original)
+
+
+# Average time of the functions called for every test, without touching the disk
+def bench_functions(tests: list, dimensions, info) -> dict:
+    mme_template = file_folder_manager.MmeTemplate.compile(dimensions, info)
+    labels = [label for test in tests for _, label in test.columns]
+
+    timings = {
+        "mme_processor": time_calls(
+            lambda: [file_folder_manager.mme_processor(t, dimensions, info) for t in tests],
+            len(tests),
+        ),
+        "MmeTemplate.render": time_calls(
+            lambda: [mme_template.render(t) for t in tests], len(tests)
+        ),
+        "build_test_name": time_calls(
+            lambda: [file_folder_manager.build_test_name(t, info) for t in tests],
+            len(tests),
+        ),
+        "sanitize_folder_name": time_calls(
+            lambda: [test_record.sanitize_folder_name(x, "") for x in labels],
+            len(labels),
+        ),
+        "label_folder_name": time_calls(
+            lambda: [test_record.label_folder_name(x) for x in labels],
+            len(labels),
+        ),
+    }
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as folder:
+        same_name = Path(folder) / "0001-CCRs-AEB-20kph-100"
+        timings["create_unique_folder"] = time_calls(
+            lambda: [
+                file_folder_manager.create_unique_folder(same_name)
+                for _ in range(SAME_NAME_FOLDERS)
+            ],
+            SAME_NAME_FOLDERS,
+        )
+
+    return {name: round(seconds, 9) for name, seconds in timings.items()}
+
+
+def time_calls(function, count: int) -> float:
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) / max(count, 1)
+
+
+def print_result(result: dict):
+    print(
+        f"  {result['target']:<8} {result['seconds']:8.3f} s"
+        f" {result['tests_per_second']:10.1f} tests/s"
+        f" {result['calls_per_test']:7.2f} calls/test"
+        f" {result['peak_memory_bytes'] / 2**20:8.2f} MB peak"
+    )
+    calls = ", ".join(
+        f"{name} {count / result['tests']:.2f}"
+        for name, count in sorted(result["calls"].items())
+    )
+    print(f"           calls per test: {calls}")
+
+
+# Comparing the throughput with the last record of a log written with --log, only the
+# same target and size are compared
+def compare_baseline(log_path: Path, results: list, tolerance: float) -> int:
+    record = read_last_record(log_path)
+    if record is None:
+        print(f"{log_path}: the baseline is empty", file=sys.stderr)
+        return 1
+
+    baseline = {
+        (result["target"], result["tests"]): result for result in record["results"]
+    }
+
+    failed = False
+    print("\nCompared to the baseline:")
+    for result in results:
+        previous = baseline.get((result["target"], result["tests"]))
+        if previous is None:
+            continue
+
+        ratio = result["tests_per_second"] / previous["tests_per_second"]
+        slower = ratio < 1 - tolerance
+        failed = failed or slower
+        print(
+            f"  {result['target']:<8} {result['tests']:>6} tests {ratio:6.2f}x"
+            + ("  SLOWER" if slower else "")
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Without a screen, must be set before creating the QApplication
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from bench_common import (
+    REPO_FOLDER,
+    load_database,
+    percentile,
+    read_last_record,
+    synthetic_tests,
+    write_log,
+)
+
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+import main
+from test_store import TestStore
+
+# Number of tests in the table of the synthetic campaigns
+SIZES = (1000, 5000)
+# How many times the table is repainted and how many tests are deleted for every size
+REFRESHES = 200
+DELETES = 200
+PERCENTILES = (0.5, 0.9, 0.99)
+DEFAULT_LOG = "benchmark_gui.jsonl"
+
+
+# Benchmark of the test table of the main window, without a screen. For every size the
+# tests are added one at a time (like the "Add a new test" dialog), then the table is
+# repainted, then some random tests are deleted, measuring every single operation.
+# The bulk insertion (templates and matrix mode) is measured with a second window
+def main_benchmark(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measures the latency of the test table with many tests."
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(SIZES),
+        help="Number of tests added to the table (default: 1000 5000)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random tests")
+    parser.add_argument(
+        "--log",
+        type=Path,
+        nargs="?",
+        const=Path(DEFAULT_LOG),
+        help=f"Appends the results as a json line to the file (default: {DEFAULT_LOG})",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Log of a previous version, fails if the 90th percentile of an operation "
+        "is higher than its last record by more than the tolerance",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown compared to the baseline (default: 0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    # The window reads the json databases from the current folder
+    log_path = args.log.resolve() if args.log else None
+    os.chdir(REPO_FOLDER)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    database = load_database()
+
+    results = []
+    for size in args.sizes:
+        tests = synthetic_tests(database, size, args.seed)
+        result = bench_table(app, tests, args.seed)
+        result["tests"] = size
+        results.append(result)
+        print_result(result)
+
+    if log_path:
+        write_log(log_path, results, platform=app.platformName())
+
+    if args.baseline:
+        return compare_baseline(args.baseline, results, args.tolerance)
+
+    return 0
+
+
+def bench_table(app: QApplication, tests: list, seed: int) -> dict:
+    rng = random.Random(seed)
+    # The synthetic campaigns have duplicated tests, the question of the window is always
+    # answered "No" so every test gets its own row (the search of the duplicate is
+    # still measured)
+    QMessageBox.question = staticmethod(lambda *args: QMessageBox.StandardButton.No)
+    window = new_window(app)
+    table = window.ui.tableView
+
+    add = []
+    for test in tests:
+        add.append(timed(app, window.on_test_created, test))
+
+    refresh = []
+    for _ in range(REFRESHES):
+        refresh.append(timed(app, table.viewport().repaint))
+
+    delete = []
+    for _ in range(min(DELETES, len(tests))):
+        row = rng.randrange(window.test_model.rowCount())
+        delete.append(timed(app, window.delete_test, row))
+
+    window.close()
+
+    # Adding all the tests together, like a template
+    window = new_window(app)
+    bulk = timed(app, window.add_tests, iter(tests))
+    window.close()
+
+    return {
+        "add": latency_summary(add),
+        "refresh": latency_summary(refresh),
+        "delete": latency_summary(delete),
+        "bulk_add_ms": round(bulk * 1000, 3),
+    }
+
+
+# Every window gets an empty list of tests, the main window uses the one of main.py
+def new_window(app: QApplication) -> main.MainWindow:
+    main.test_store = TestStore()
+    window = main.MainWindow()
+    window.show()
+    app.processEvents()
+    return window
+
+
+# Time of the operation including the events that it generates (the update of the table)
+def timed(app: QApplication, function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    app.processEvents()
+    return time.perf_counter() - start
+
+
+def latency_summary(samples: list) -> dict:
+    summary = {
+        f"p{round(fraction * 100)}_ms": round(percentile(samples, fraction) * 1000, 4)
+        for fraction in PERCENTILES
+    }
+    summary["max_ms"] = round(max(samples, default=0) * 1000, 4)
+    return summary
+
+
+def print_result(result: dict):
+    print(f"\n{result['tests']} tests:")
+    for operation in ("add", "refresh", "delete"):
+        values = "  ".join(
+            f"{name[:-3]} {value:8.3f} ms" for name, value in result[operation].items()
+        )
+        print(f"  {operation:<8} {values}")
+    print(f"  bulk add {result['bulk_add_ms']:8.3f} ms")
+
+
+# Comparing the 90th percentile of every operation with the last record of a log written
+# with --log, only the same sizes are compared
+def compare_baseline(log_path: Path, results: list, tolerance: float) -> int:
+    record = read_last_record(log_path)
+    if record is None:
+        print(f"{log_path}: the baseline is empty", file=sys.stderr)
+        return 1
+
+    baseline = {result["tests"]: result for result in record["results"]}
+
+    failed = False
+    print("\nCompared to the baseline (90th percentile):")
+    for result in results:
+        previous = baseline.get(result["tests"])
+        if previous is None:
+            continue
+
+        for operation in ("add", "refresh", "delete"):
+            before = previous[operation]["p90_ms"]
+            ratio = result[operation]["p90_ms"] / before if before else 1.0
+            slower = ratio > 1 + tolerance
+            failed = failed or slower
+            print(
+                f"  {result['tests']:>6} tests {operation:<8} {ratio:6.2f}x"
+                + ("  SLOWER" if slower else "")
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_benchmark())
@@ -0,0 +1,167 @@
+import argparse
+import sys
+from pathlib import Path
+
+import file_folder_manager
+from car_data import CarDimensions, CarInfo, build_car_dimensions
+from spec_cache import load_spec_bundle
+from test_builder import (
+    build_test,
+    expand_template,
+    find_macro_type,
+    find_spec,
+    load_json,
+)
+
+# Folder with the json databases (test_types.json, robustness.json and test_json/)
+DATA_FOLDER = Path(__file__).resolve().parent
+
+
+# Loading a campaign file, a json with the same information that are inserted in the GUI:
+# {
+#   "info": {"year": "2026", "number": "...", "make": "...", "model": "...",
+#            "oem": "...", "vin": "...", "sw_version": "..."},
+#   "dimensions": {"length": 4.5, "width": 1.8, "overhang": 0.9,
+#                  "front": [[x1, y1], ... 7 points], "side": [... 5 points],
+#                  "back": [... 7 points]},
+#   "tests": [{"name": "CCRs", "parameters": {"long_speed_VUT": 20.0},
+#              "robustness": {"type": "VUT", "layer": "IL", "parameter": 10}}],
+#   "templates": ["../templates/example.json"]
+# }
+# Dimensions are in meters like in the dimension tab. "tests" and "templates" are both
+# optional, the paths of the templates are relative to the campaign file and the
+# templates in "extra_templates" are added to every campaign
+def load_campaign(
+    path: Path,
+    specs: dict,
+    robustness_spec: dict,
+    test_types: dict,
+    extra_templates=(),
+) -> tuple[CarInfo, CarDimensions, list]:
+    campaign = load_json(path)
+
+    info = CarInfo(**{key: str(value) for key, value in campaign["info"].items()})
+
+    dimensions = campaign["dimensions"]
+    car_dimensions = build_car_dimensions(
+        dimensions["length"],
+        dimensions["width"],
+        dimensions["overhang"],
+        dimensions["front"],
+        dimensions["side"],
+        dimensions["back"],
+    )
+
+    test_list = []
+    for entry in campaign.get("tests", []):
+        name = entry["name"]
+        test_list.append(
+            build_test(
+                find_spec(specs, name),
+                robustness_spec,
+                find_macro_type(test_types, name),
+                entry.get("parameters"),
+                entry.get("robustness"),
+                entry.get("repetitions", 1),
+            )
+        )
+
+    template_paths = [path.parent / item for item in campaign.get("templates", [])]
+    for template_path in [*template_paths, *extra_templates]:
+        template = load_json(template_path)
+        test_list.extend(expand_template(template, specs, robustness_spec, test_types))
+
+    return info, car_dimensions, test_list
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Creates the test folders of one or more campaigns without the GUI."
+    )
+    parser.add_argument("campaigns", nargs="+", type=Path, help="Campaign json files")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        required=True,
+        help="Folder where the campaign folders are created",
+    )
+    parser.add_argument(
+        "--data",
+        type=Path,
+        default=DATA_FOLDER,
+        help="Folder with test_types.json, robustness.json and test_json/",
+    )
+    parser.add_argument(
+        "-t",
+        "--template",
+        type=Path,
+        action="append",
+        default=[],
+        help="Campaign template added to every campaign (can be repeated)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of threads that create the test folders (default: 1)",
+    )
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Create each campaign in a temporary folder and rename it at the end "
+        "(only for campaigns whose folder doesn't exist yet)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the folders already created for the same tests and rewrite "
+        "only the .mme files that changed",
+    )
+    args = parser.parse_args(argv)
+
+    database = load_spec_bundle(args.data)
+    test_types = database["test_types"]
+    robustness_spec = database["robustness"]
+    specs = database["specs"]
+
+    # A campaign with an error is reported and skipped, the other ones are created anyway
+    failed = 0
+    for campaign_path in args.campaigns:
+        try:
+            info, dimensions, test_list = load_campaign(
+                campaign_path, specs, robustness_spec, test_types, args.template
+            )
+        except (OSError, KeyError, TypeError, ValueError) as error:
+            print(f"{campaign_path}: invalid campaign ({error})", file=sys.stderr)
+            failed += 1
+            continue
+
+        try:
+            written = file_folder_manager.folder_creations(
+                args.output,
+                test_list,
+                dimensions,
+                info,
+                workers=args.workers,
+                staged=args.staged,
+                incremental=args.incremental,
+            )
+        except (OSError, KeyError, ValueError) as error:
+            # Existing staged campaign, permissions, full disk, broken manifest...
+            print(f"{campaign_path}: folders not created ({error})", file=sys.stderr)
+            failed += 1
+            continue
+        # Every run of a test has its own folder
+        runs = sum(test.get("repetitions", 1) for test in test_list)
+        print(f"{campaign_path}: {written} of {runs} test folders written")
+
+    if failed:
+        print(f"{failed} of {len(args.campaigns)} campaigns failed", file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
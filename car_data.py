@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+# Data structure definition for easier management of the car dimensions to create the .mme file
+# They are kept in their own file (without any Qt import) so they can be used both by the
+# GUI and by the headless campaign engine
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+@dataclass
+class CarProfile:
+    front: List[Point] = field(default_factory=list)
+    left: List[Point] = field(default_factory=list)
+    back: List[Point] = field(default_factory=list)
+    right: List[Point] = field(default_factory=list)
+
+
+@dataclass
+class CarDimensions:
+    length: float
+    width: float
+    overhang: float
+    profile: CarProfile
+
+
+@dataclass
+class CarInfo:
+    year: str
+    number: str
+    make: str
+    model: str
+    oem: str
+    vin: str
+    sw_version: str
+
+
+# Building the CarDimensions from the values in meters, in the same form they are
+# written in the dimension tab (front and back with 7 points, the side with 5 points)
+def build_car_dimensions(
+    length: float, width: float, overhang: float, front, side, back
+) -> CarDimensions:
+    profile = CarProfile()
+
+    # Front
+    front_profile = [Point(float(x) * 1000.0, float(y) * 1000.0) for x, y in front]
+    front_profile.reverse()
+    profile.front = front_profile
+
+    # Right
+    right_profile = [Point(float(x) * 1000.0, float(y) * 1000.0) for x, y in side]
+    right_profile.reverse()
+    profile.right = right_profile
+
+    # Left, it's the right one mirrored
+    left_profile = []
+    for point in profile.right:
+        left_profile.append(Point(point.x, -point.y))
+
+    left_profile.reverse()
+    profile.left = left_profile
+
+    # Back
+    profile.back = [Point(float(x) * 1000.0, float(y) * 1000.0) for x, y in back]
+
+    return CarDimensions(
+        length=float(length) * 1000.0,
+        width=float(width) * 1000.0,
+        overhang=float(overhang) * 1000.0,
+        profile=profile,
+    )
@@ -1,152 +1,547 @@
-import re
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from uuid import uuid4
 
-from main import CarDimensions, CarInfo
+from car_data import CarDimensions, CarInfo
 
 
+# Name of the file, in the main folder of the campaign, where the created tests are recorded
+MANIFEST_NAME = "campaign_manifest.json"
+# Folders created inside every test folder
+DATA_FOLDERS = ("Channel", "Movie")
+# Max size of a single write call when writing the .mme files
+MME_BUFFER_SIZE = 64 * 1024
+
+
+# A test folder that has to be created (new=True) or updated, decided before starting
+# to write anything
+@dataclass
+class TestFolderJob:
+    key: str
+    test_folder: Path
+    test_name: str
+    test: dict
+    new: bool
+    old_hash: str | None = None
+    # Run number written in the .mme
+    run: int = 1
+
+
+# Raised when the creation is stopped by the "cancel" function passed to folder_creations
+class CreationCancelled(Exception):
+    pass
+
+
+# "progress" is called after every test with the number of tests done and the total,
+# "cancel" is called before every test and the creation stops (raising
+# CreationCancelled) as soon as it returns True
 def folder_creations(
-    parent_folder: Path, test_list, dimentions: CarDimensions, info: CarInfo
-):
+    parent_folder: Path,
+    test_list,
+    dimentions: CarDimensions,
+    info: CarInfo,
+    workers: int = 1,
+    staged: bool = False,
+    incremental: bool = False,
+    progress=None,
+    cancel=None,
+) -> int:
     # Construct the prefix with the main information
     folder_prefix = f"{info.year[-2:]}-{info.oem}-{info.number}"
 
-    main_folder = parent_folder / f"{folder_prefix}-{info.make}_{info.model}"
+    main_folder = campaign_folder(parent_folder, info)
+
+    if staged:
+        return staged_folder_creations(
+            main_folder,
+            folder_prefix,
+            test_list,
+            dimentions,
+            info,
+            workers,
+            progress=progress,
+            cancel=cancel,
+        )
+
     main_folder.mkdir(exist_ok=True, parents=True)
+    return populate_main_folder(
+        main_folder,
+        folder_prefix,
+        test_list,
+        dimentions,
+        info,
+        workers,
+        incremental,
+        progress=progress,
+        cancel=cancel,
+    )
 
-    for test in test_list:
-        test_name = f"{info.number}"
 
-        # Construct the folder name from the info that are displayed in the QTable
-        # assuming they are the important ones
-        for item in test["_ui"]["columns"]:
-            if item[1] == "N/A":
+def campaign_folder(parent_folder: Path, info: CarInfo) -> Path:
+    folder_prefix = f"{info.year[-2:]}-{info.oem}-{info.number}"
+    return parent_folder / f"{folder_prefix}-{info.make}_{info.model}"
+
+
+# Creates the test folders inside the main folder and returns how many .mme files were
+# written. Every test is recorded in the manifest of the campaign with the hash of its
+# .mme, so with incremental=True the tests already created are matched with their
+# folder and only the ones that changed are written again (without incremental every
+# test gets a new folder, with the _2, _3 suffixes if needed).
+# With more than one worker the mkdir and the .mme writing are done by a pool of threads
+# (the work is mostly waiting for the filesystem, so threads are enough even with the GIL)
+def populate_main_folder(
+    main_folder: Path,
+    folder_prefix: str,
+    test_list,
+    dimentions: CarDimensions,
+    info: CarInfo,
+    workers: int = 1,
+    incremental: bool = False,
+    progress=None,
+    cancel=None,
+) -> int:
+    manifest = load_manifest(main_folder)
+    entries = manifest["tests"]
+
+    # The folders are decided before writing anything, in the order of the list,
+    # so the _2, _3 suffixes are always the same even when using the threads
+    occurrences = {}
+    allocator = FolderAllocator()
+    jobs = []
+    for test in test_list:
+        test_name = build_test_name(test, info)
+        base_folder = main_folder / f"{folder_prefix}-{test['macro_type']}" / test_name
+        relative_folder = base_folder.relative_to(main_folder).as_posix()
+
+        # Every run of the test gets its own folder (the name is computed only once)
+        for _ in range(test.get("repetitions", 1)):
+            # The same test can be in the list more than once, the occurrence number is
+            # used to tell them apart in the manifest and is the run number in the .mme
+            occurrence = occurrences.get(relative_folder, 0) + 1
+            if not incremental:
+                while f"{relative_folder}#{occurrence}" in entries:
+                    occurrence += 1
+            occurrences[relative_folder] = occurrence
+            key = f"{relative_folder}#{occurrence}"
+
+            entry = entries.get(key)
+            if incremental and entry and (main_folder / entry["folder"]).is_dir():
+                jobs.append(
+                    TestFolderJob(
+                        key,
+                        main_folder / entry["folder"],
+                        test_name,
+                        test,
+                        new=False,
+                        old_hash=entry["hash"],
+                        run=occurrence,
+                    )
+                )
                 continue
 
-            test_name = f"{test_name}-{sanitize_folder_name(item[1], '')}"
+            test_folder = allocator.reserve(base_folder)
+            jobs.append(
+                TestFolderJob(
+                    key, test_folder, test_name, test, new=True, run=occurrence
+                )
+            )
+
+    # The new tests are recorded in the manifest before their folders are created, with
+    # an empty hash so their .mme is always written. If the creation is cancelled or
+    # fails before a .mme is written, the next incremental run reuses the empty folder
+    # instead of creating a _2 next to it
+    for job in jobs:
+        if job.new:
+            entries[job.key] = manifest_entry(job.test_folder, main_folder, "")
+
+    # The vehicle part of the .mme files is the same for all the tests
+    mme_template = MmeTemplate.compile(dimentions, info)
+
+    def run_job(job: TestFolderJob):
+        # Stopping between one test and the other if the creation was cancelled
+        if cancel is not None and cancel():
+            raise CreationCancelled()
+
+        return run_test_folder_job(job, main_folder, mme_template, allocator)
+
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    written = 0
+    try:
+        # The folders shared by many tests (like the macro type ones) are created first,
+        # once each, then every job creates its own test folder (also in the threads)
+        plan = DirectoryPlan(main_folder)
+        for job in jobs:
+            if job.new:
+                plan.add(job.test_folder.parent)
+        plan.create(cancel)
+
+        results = executor.map(run_job, jobs) if executor else map(run_job, jobs)
+        for done, (key, entry, was_written) in enumerate(results, 1):
+            entries[key] = entry
+            written += was_written
+            if progress is not None:
+                progress(done, len(jobs))
+    finally:
+        # The tests not started yet are dropped if something failed
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+        # Saving also when something failed, so the folders already created are known
+        # by the next incremental run
+        save_manifest(main_folder, manifest)
+
+    return written
+
+
+def run_test_folder_job(
+    job: TestFolderJob,
+    main_folder: Path,
+    mme_template: "MmeTemplate",
+    allocator: "FolderAllocator | None" = None,
+):
+    # Generating the mme file
+    mme_file_lines = mme_template.render(job.test, job.run)
+    mme_hash = hash_mme_lines(mme_file_lines)
+
+    test_folder = job.test_folder
+    # Nothing to do if the test was already created and it didn't change
+    written = job.new or mme_hash != job.old_hash
+
+    if written:
+        # The folders created before could have been removed by hand
+        if job.new:
+            test_folder = create_test_folder(job, allocator)
+        else:
+            make_data_folders(test_folder)
+
+        # The new folders were just created, so the .mme can't be there
+        write_mme_file(
+            test_folder / f"{job.test_name}.mme", mme_file_lines, exclusive=job.new
+        )
+
+    return job.key, manifest_entry(test_folder, main_folder, mme_hash), written
+
+
+# The whole campaign is created in a hidden folder next to the final one and then
+# renamed in one go, so if something fails halfway there is nothing to clean up and
+# who is looking at the share never sees a half created campaign.
+# It can only be used for a new campaign, the rename can't merge two folders.
+def staged_folder_creations(
+    main_folder: Path,
+    folder_prefix: str,
+    test_list,
+    dimentions: CarDimensions,
+    info: CarInfo,
+    workers: int,
+    progress=None,
+    cancel=None,
+) -> int:
+    if main_folder.exists():
+        raise FileExistsError(
+            f"The folder {main_folder} already exists, "
+            "a staged creation can only be used for a new campaign."
+        )
+
+    main_folder.parent.mkdir(exist_ok=True, parents=True)
+    staging_folder = main_folder.with_name(f".{main_folder.name}.{uuid4().hex[:8]}.tmp")
+    staging_folder.mkdir()
+
+    try:
+        written = populate_main_folder(
+            staging_folder,
+            folder_prefix,
+            test_list,
+            dimentions,
+            info,
+            workers,
+            progress=progress,
+            cancel=cancel,
+        )
+        staging_folder.rename(main_folder)
+    except BaseException:
+        shutil.rmtree(staging_folder, ignore_errors=True)
+        raise
+
+    return written
+
+
+def load_manifest(main_folder: Path) -> dict:
+    manifest_path = main_folder / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {"version": 1, "tests": {}}
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def manifest_entry(test_folder: Path, main_folder: Path, mme_hash: str) -> dict:
+    return {"folder": test_folder.relative_to(main_folder).as_posix(), "hash": mme_hash}
+
+
+def save_manifest(main_folder: Path, manifest: dict):
+    # Writing a temporary file and replacing the old one, so the manifest is never
+    # left half written
+    manifest_path = main_folder / MANIFEST_NAME
+    temporary_path = manifest_path.with_name(f"{MANIFEST_NAME}.tmp")
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temporary_path, manifest_path)
+
+
+# Hash of the content of the .mme, the timestamp is left out because it changes at
+# every creation even if the test is the same
+def hash_mme_lines(mme_file_lines) -> str:
+    content = "\n".join(
+        line for line in mme_file_lines if not line.startswith("Timestamp:")
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-        # Creating all the folders
-        test_folder = main_folder / f"{folder_prefix}-{test['macro_type']}" / test_name
-        test_folder = create_unique_folder(test_folder)
 
-        (test_folder / "Channel").mkdir(exist_ok=True, parents=True)
-        (test_folder / "Movie").mkdir(exist_ok=True, parents=True)
+# Construct the folder name from the info that are displayed in the QTable
+# assuming they are the important ones
+def build_test_name(test, info: CarInfo) -> str:
+    # The labels are sanitized only once, when the spec is loaded
+    return "-".join([info.number, *test.folder_labels])
 
-        # Generating and creating the mme file
-        mme_file_lines = mme_processor(test, dimentions, info)
 
-        with open(test_folder / (f"{test_name}.mme"), "w", encoding="utf-8") as file:
-            for line in mme_file_lines:
-                file.write(line + "\n")
+# A new test folder with its data folders, one mkdir for each (the parents were already
+# created by populate_main_folder). If somebody else created the folder after it was
+# reserved, the test gets the next free name
+def create_test_folder(job: TestFolderJob, allocator: "FolderAllocator | None" = None) -> Path:
+    try:
+        os.mkdir(job.test_folder)
+    except FileExistsError:
+        allocator = allocator or FolderAllocator()
+        job.test_folder = allocator.create(job.test_folder, job.test_name)
 
+    for data_folder in DATA_FOLDERS:
+        os.mkdir(job.test_folder / data_folder)
+    return job.test_folder
 
-def create_unique_folder(folder_name: Path) -> Path:
-    if not folder_name.exists():
-        folder_name.mkdir(parents=True)
-        return folder_name
-
-    counter = 2
-
-    while True:
-        new_path = folder_name.with_name(f"{folder_name.name}_{counter}")
-        if not new_path.exists():
-            new_path.mkdir(parents=True)
-            return new_path
-
-        counter += 1
-
-
-def sanitize_folder_name(name: str, replacement="_") -> str:
-    # Removes strange characters from the name that could lead to problems
-    # when creating a folder
-    name = re.sub(r"[^a-zA-Z0-9_-]", replacement, name)
-    return name.strip()
-
-
-def mme_processor(test, dimentions: CarDimensions, info: CarInfo):
-    # TODO
-    # the main thing missing right now is a way to have the
-    # info about the target and the impact (like impact location)
-    # to be removed just in the case of a NVT ELK OV, right now the only fast solution
-    # would be to just include the "NVT" option to basically all the parameters in the
-    # selection of the test.
-    # Better approaches are for sure possibile but I dont have time to think and test
-    # them.
-    output = [
-        "Data format edition number:\t1.6",
-        "Laboratory name:\tCSI S.p.A.",
-        "Customer name:\tEuro NCAP",
-    ]
-
-    output.append("Customer project ref. number:\t" + info.number)
-    output.append("Title:\t	Euro NCAP " + info.year)
-    current_date = datetime.now().strftime("%Y/%m/%d,%H:%M")
-    output.append("Timestamp:\t" + current_date)
-
-    # Doing test.get(.......) ensure that you at least have an output of "NOVALUE" if the data is for
-    # some reason missing in the test dictionary
-    output.append("Scenario:\t" + test.get("name", "NOVALUE"))
-    output.append("Type of the test:\t" + test.get("test_type", "NOVALUE"))
-    output.append("Subtype of the test:\t" + test.get("test_condition", "NOVALUE"))
-
-    # TODO I've hardcoded the run repetition to be 1. I dont have an easy fix for this other
-    # than adding another combobox in the test adder to specify the number (and this is still not that easy).
-    output.append("Run repetition:\t1")
-    output.append("Region:\tEU")
-
-    robustness = test.get("robustness_type", "NOVALUE")
-    robustness_layer = test.get("robustness_layer")
-    if robustness_layer is not None:
-        robustness += ";" + str(robustness_layer)
-
-        robustness_parameter = test.get("robustness_parameter")
-        if robustness_parameter is not None:
-            robustness += ";" + str(robustness_parameter)
-
-    output.append("Robustness Layer:\t" + robustness)
-
-    tob1_name = f"{info.make}, {info.model}"
-    output.append("Name TOB 1:\t" + tob1_name)
-
-    output.append("Driver position TOB 1:\t1")
-    output.append("Ref. number of TOB 1:\t" + info.vin)
-    output.append("S/W version of TOB 1:\t" + info.sw_version)
-    output.append(
-        "Dimensions of TOB 1:\t" + str(dimentions.length) + "," + str(dimentions.width)
-    )
 
-    front_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.front)
-    output.append(f"Shape Front TOB 1:\t{front_points_str}")
+def make_data_folders(test_folder: Path):
+    for data_folder in DATA_FOLDERS:
+        (test_folder / data_folder).mkdir(exist_ok=True, parents=True)
 
-    left_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.left)
-    output.append(f"Shape Left Side TOB 1:\t{left_points_str}")
 
-    rear_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.back)
-    output.append(f"Shape Rear TOB 1:\t{rear_points_str}")
+# With exclusive=True the .mme must not exist yet (new test folders), the file is created
+# with O_EXCL so an existing file is never overwritten by mistake.
+# The whole file is joined and encoded in memory and written with as few calls as
+# possible (one for a normal .mme, they are much smaller than MME_BUFFER_SIZE).
+# The lines end with os.linesep like the files written in text mode
+def write_mme_file(
+    path: Path, lines, exclusive: bool = False, buffer_size: int = MME_BUFFER_SIZE
+):
+    data = (os.linesep.join(lines) + os.linesep).encode("utf-8")
 
-    right_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.right)
-    output.append(f"Shape Right Side TOB 1:\t{right_points_str}")
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    flags |= os.O_EXCL if exclusive else os.O_TRUNC
 
-    output.append("Front overhang TOB 1:\t" + str(dimentions.overhang))
-    output.append(
-        "Velocity longitudinal TOB 1:\t" + str(test.get("long_speed_VUT", "NOVALUE"))
-    )
-    output.append(
-        "Lane Departure Velocity TOB 1:\t" + str(test.get("lat_speed_VUT", "NOVALUE"))
-    )
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view[:buffer_size]) :]
+    finally:
+        os.close(fd)
 
-    output.append("Impact side TOB 1:\t" + str(test.get("lat_speed_VUT", "NOVALUE")))
-    output.append("Impact location TOB 1:\t" + str(test.get("overlap", "NOVALUE")))
 
-    output.append("Driver State TOB 1:\tNOVALUE")
+# The folders shared by the tests of a campaign, created in one pass with a single mkdir
+# for each folder. The parents of a folder (up to "root", that must already exist) are
+# added before it, so every folder is created only once and never checked again
+class DirectoryPlan:
+    def __init__(self, root: Path):
+        self.root = root
+        self.directories = {}
 
-    output.append("Name TOB 2:\t" + test.get("target_type", "NOVALUE"))
-    output.append("Velocity TOB 2:\t" + str(test.get("target_speed", "NOVALUE")))
-    output.append(
-        "Acceleration TOB 2:\t" + str(test.get("target_acceleration", "NOVALUE"))
-    )
-    output.append("Heading TOB 2:\t" + str(test.get("target_heading", "NOVALUE")))
+    def add(self, folder: Path):
+        if folder in self.directories or folder == self.root or folder == folder.parent:
+            return
+
+        self.add(folder.parent)
+        self.directories[folder] = None
+
+    def create(self, cancel=None):
+        for folder in self.directories:
+            if cancel is not None and cancel():
+                raise CreationCancelled()
 
-    output.append("Type of data source:\tPhysical Test")
+            try:
+                os.mkdir(folder)
+            except FileExistsError:
+                pass
+
+
+def create_unique_folder(folder_name: Path) -> Path:
+    return FolderAllocator().create(folder_name)
+
+
+# Gives a free name (folder, folder_2, folder_3, ...) to every test folder of a campaign.
+# Every parent folder is read only once and the names found there, together with the
+# ones already given, are kept in memory. For every base name the next suffix to try is
+# remembered, so many tests with the same name don't check all the suffixes again.
+# Can be used by more threads at the same time
+class FolderAllocator:
+    def __init__(self):
+        self._names = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    # Only decides the name, the folder is created later with create()
+    def reserve(self, folder: Path) -> Path:
+        with self._lock:
+            names = self._listing(folder.parent)
+
+            name = folder.name
+            counter = self._counters.get(folder, 2)
+            while name in names:
+                name = f"{folder.name}_{counter}"
+                counter += 1
+
+            self._counters[folder] = counter
+            names.add(name)
+            return folder.with_name(name)
+
+    # Creating the folder, without exist_ok the mkdir fails if somebody else created it
+    # after it was read or reserved, in that case the next free name is used
+    def create(self, folder: Path, base_name: str | None = None) -> Path:
+        base_folder = folder.with_name(base_name or folder.name)
+        if base_name is None:
+            folder = self.reserve(folder)
+
+        while True:
+            try:
+                folder.mkdir(parents=True)
+                return folder
+            except FileExistsError:
+                with self._lock:
+                    self._listing(folder.parent).add(folder.name)
+                folder = self.reserve(base_folder)
+
+    def _listing(self, parent: Path) -> set:
+        names = self._names.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent) as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            self._names[parent] = names
+        return names
+
+
+def mme_processor(test, dimentions: CarDimensions, info: CarInfo, run: int = 1):
+    return MmeTemplate.compile(dimentions, info).render(test, run)
+
+
+# The .mme file of every test of a campaign has the same vehicle lines (TOB 1 info,
+# dimensions and shape points), so they are built only once per campaign by compile()
+# and render() only adds the lines that depend on the test (scenario, robustness, speeds
+# and TOB 2)
+@dataclass
+class MmeTemplate:
+    header: list
+    vehicle: list
+
+    @classmethod
+    def compile(cls, dimentions: CarDimensions, info: CarInfo) -> "MmeTemplate":
+        header = [
+            "Data format edition number:\t1.6",
+            "Laboratory name:\tCSI S.p.A.",
+            "Customer name:\tEuro NCAP",
+        ]
+
+        header.append("Customer project ref. number:\t" + info.number)
+        header.append("Title:\t	Euro NCAP " + info.year)
+        # The same timestamp (the start of the creation) is used for the whole campaign
+        current_date = datetime.now().strftime("%Y/%m/%d,%H:%M")
+        header.append("Timestamp:\t" + current_date)
+
+        tob1_name = f"{info.make}, {info.model}"
+        vehicle = ["Name TOB 1:\t" + tob1_name]
+
+        vehicle.append("Driver position TOB 1:\t1")
+        vehicle.append("Ref. number of TOB 1:\t" + info.vin)
+        vehicle.append("S/W version of TOB 1:\t" + info.sw_version)
+        vehicle.append(
+            "Dimensions of TOB 1:\t" + str(dimentions.length) + "," + str(dimentions.width)
+        )
+
+        front_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.front)
+        vehicle.append(f"Shape Front TOB 1:\t{front_points_str}")
+
+        left_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.left)
+        vehicle.append(f"Shape Left Side TOB 1:\t{left_points_str}")
+
+        rear_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.back)
+        vehicle.append(f"Shape Rear TOB 1:\t{rear_points_str}")
+
+        right_points_str = ", ".join(f"({p.x};{p.y})" for p in dimentions.profile.right)
+        vehicle.append(f"Shape Right Side TOB 1:\t{right_points_str}")
+
+        vehicle.append("Front overhang TOB 1:\t" + str(dimentions.overhang))
+
+        return cls(header, vehicle)
+
+    def render(self, test, run: int = 1) -> list:
+        # TODO
+        # the main thing missing right now is a way to have the
+        # info about the target and the impact (like impact location)
+        # to be removed just in the case of a NVT ELK OV, right now the only fast solution
+        # would be to just include the "NVT" option to basically all the parameters in the
+        # selection of the test.
+        # Better approaches are for sure possibile but I dont have time to think and test
+        # them.
+        output = list(self.header)
+
+        # Doing test.get(.......) ensure that you at least have an output of "NOVALUE" if the data is for
+        # some reason missing in the test dictionary
+        output.append("Scenario:\t" + test.get("name", "NOVALUE"))
+        output.append("Type of the test:\t" + test.get("test_type", "NOVALUE"))
+        output.append("Subtype of the test:\t" + test.get("test_condition", "NOVALUE"))
+
+        output.append("Run repetition:\t" + str(run))
+        output.append("Region:\tEU")
+
+        robustness = test.get("robustness_type", "NOVALUE")
+        robustness_layer = test.get("robustness_layer")
+        if robustness_layer is not None:
+            robustness += ";" + str(robustness_layer)
+
+            robustness_parameter = test.get("robustness_parameter")
+            if robustness_parameter is not None:
+                robustness += ";" + str(robustness_parameter)
+
+        output.append("Robustness Layer:\t" + robustness)
+
+        output.extend(self.vehicle)
+
+        output.append(
+            "Velocity longitudinal TOB 1:\t" + str(test.get("long_speed_VUT", "NOVALUE"))
+        )
+        output.append(
+            "Lane Departure Velocity TOB 1:\t" + str(test.get("lat_speed_VUT", "NOVALUE"))
+        )
+
+        output.append("Impact side TOB 1:\t" + str(test.get("lat_speed_VUT", "NOVALUE")))
+        output.append("Impact location TOB 1:\t" + str(test.get("overlap", "NOVALUE")))
+
+        output.append("Driver State TOB 1:\tNOVALUE")
 
-    return output
+        output.append("Name TOB 2:\t" + test.get("target_type", "NOVALUE"))
+        output.append("Velocity TOB 2:\t" + str(test.get("target_speed", "NOVALUE")))
+        output.append(
+            "Acceleration TOB 2:\t" + str(test.get("target_acceleration", "NOVALUE"))
+        )
+        output.append("Heading TOB 2:\t" + str(test.get("target_heading", "NOVALUE")))
+
+        output.append("Type of data source:\tPhysical Test")
+
+        return output
@@ -0,0 +1,64 @@
+import threading
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+import file_folder_manager
+from car_data import CarDimensions, CarInfo
+
+
+# Runs folder_creations in a QThread so the window keeps working while the folders are
+# written. All the data is prepared by the window before starting, the worker never
+# touches the widgets and talks with the window only through the signals.
+# cancel() can be called from the window, the creation stops before the next test
+class FolderCreationWorker(QObject):
+    # Tests done and total number of tests
+    progress = Signal(int, int)
+    # Number of tests written
+    completed = Signal(int)
+    cancelled = Signal()
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        main_folder: Path,
+        test_list: list,
+        dimentions: CarDimensions,
+        info: CarInfo,
+        staged: bool = False,
+        incremental: bool = False,
+    ):
+        super().__init__()
+        self.main_folder = main_folder
+        self.test_list = test_list
+        self.dimentions = dimentions
+        self.info = info
+        self.staged = staged
+        self.incremental = incremental
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        try:
+            written = file_folder_manager.folder_creations(
+                self.main_folder,
+                self.test_list,
+                self.dimentions,
+                self.info,
+                staged=self.staged,
+                incremental=self.incremental,
+                progress=self.progress.emit,
+                cancel=self._cancel.is_set,
+            )
+        except file_folder_manager.CreationCancelled:
+            self.cancelled.emit()
+        except (OSError, ValueError) as error:
+            self.failed.emit(str(error))
+        except Exception as error:
+            # Any other error (for example a broken manifest) must still end the creation,
+            # otherwise the window would wait forever for one of the signals
+            self.failed.emit(f"{type(error).__name__}: {error}")
+        else:
+            self.completed.emit(written)
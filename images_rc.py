@@ -1,5115 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.10.1
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x87\xe5\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22 standalone=\x22\
-no\x22?>\x0a<!DOCTYPE \
-svg PUBLIC \x22-//W\
-3C//DTD SVG 1.1/\
-/EN\x22 \x22http://www\
-.w3.org/Graphics\
-/SVG/1.1/DTD/svg\
-11.dtd\x22>\x0a<svg wi\
-dth=\x22100%\x22 heigh\
-t=\x22100%\x22 viewBox\
-=\x220 0 958 814\x22 v\
-ersion=\x221.1\x22 xml\
-ns=\x22http://www.w\
-3.org/2000/svg\x22 \
-xmlns:xlink=\x22htt\
-p://www.w3.org/1\
-999/xlink\x22 xml:s\
-pace=\x22preserve\x22 \
-xmlns:serif=\x22htt\
-p://www.serif.co\
-m/\x22 style=\x22fill-\
-rule:evenodd;cli\
-p-rule:evenodd;s\
-troke-linejoin:r\
-ound;stroke-mite\
-rlimit:2;\x22>\x0a    \
-<g>\x0a        <use\
- id=\x22layer1\x22 xli\
-nk:href=\x22#_Image\
-1\x22 x=\x22181.296\x22 y\
-=\x22117.101\x22 width\
-=\x22426px\x22 height=\
-\x22598px\x22/>\x0a    </\
-g>\x0a    <defs>\x0a  \
-      <image id=\
-\x22_Image1\x22 width=\
-\x22426px\x22 height=\x22\
-598px\x22 xlink:hre\
-f=\x22data:image/pn\
-g;base64,iVBORw0\
-KGgoAAAANSUhEUgA\
-AAaoAAAJWCAYAAAA\
-JN8MJAAAACXBIWXM\
-AAA7EAAAOxAGVKw4\
-bAAAgAElEQVR4nOz\
-dd3hUVfoH8O9JgEA\
-QCDXSBKSsgqzKqgg\
-uKCh2UaIoCCIooIJ\
-rwfJjFwVRLLuooFh\
-AxbaiuEovIj2AWBE\
-bIBCa1FADCUP6+/t\
-jMvHeO2cmU+707+d\
-58sA9c+69B5LMO++\
-5pwBlROQ5EdkhkbV\
-DRD4VkZtARETkIiK\
-ZkY1PWuMj/f9CRER\
-RQJyZVLRiZkVElOC\
-SAPSNdCO8iOa2ERF\
-ROFhTGAAR+7rooou\
-szfkmDP8FREQUxZI\
-i3QAiIiJvGKiIiCi\
-qMVAREVFUY6AiIqK\
-oVgnAMQC1XQW1a9f\
-2XFvDOf7CO6WUT9e\
-qWbOmtSjXr8YQEVH\
-8EZEfA53k9M4771Q\
-4kq9jx46BXl5E5O3\
-I/c8QEVE0SALwSaQ\
-b4UU0t42IiMIgSSk\
-1HsCcSDdEY7RSanm\
-kG0FERJFVCQCUUje\
-JyGNwrgTRvIJz/Hu\
-I5e6Yl9d2AlgH4BM\
-GKSIiAsoCFQCUZVZ\
-eF4IVkbsATA3ynpu\
-VUp2CvAYRESUIDk8\
-nIqKoxkBFRERRjYG\
-KiIiiGgMVERFFNQY\
-qIiKKagxUREQU1Ri\
-oiIgoqjFQERFRVGO\
-gIiKiqMZARUREUY2\
-BioiIohoDFRERRTU\
-GKiIiimoMVEREFNU\
-YqIiIKKoxUBERUVR\
-joCIioqjGQEVERFG\
-NgYqIiKJapUg3gIj\
-ii4gkA0gBUMXwZ2X\
-DcSX8+SFZWf6Eh3L\
-Xn57O053vKnMAOAr\
-gkFIqx89/DkUBBio\
-i8pmI1AfQBsBfyv5\
-sA6B52Vc1OINR1Pb\
-UiAgAHC77OmL58yi\
-AQ2XHhwDsUkrtjUx\
-LyYiBiojciMhfAJy\
-LP4NRGwDNAJweyXb\
-ZpF7ZV4VEZD+ALQB\
-+BLAewHql1G8hbBt\
-pMFAREUQkFcDVZV9\
-XAGgR2RZFjYZlX5e\
-6CkQkB8AGAAsAzFV\
-KbYhQ2xIGAxVRghK\
-RDnAGpqsAdLXruiU\
-lJSgoKEBRUZHpq7C\
-wEEVFRSguLnZ1wXn\
-809BGv/40nucqq1q\
-1KmrXro3atWujZs2\
-aUMr6OMtvaQAuKft\
-6TkS2A5gLZ9BaEez\
-FyR0DFVECEZE+AK4\
-F0A1AE3/Pz8vLw/b\
-t27Fjx47yP3fs2IG\
-9e/fi1KlTKC4uRml\
-pqe3ttktycjJq1qy\
-JOnXqIC0trTyAGf9\
-eu3Zt1KlTB61atUK\
-tWrV8ueyZAB4C8JC\
-IHAKwEsAKAMuVUpt\
-D969JHAxURHFORM4\
-H0BfAUAA+vfPm5+f\
-ju+++w++//14ejHb\
-s2IHDhw+HtK2hVlJ\
-SgmPHjuHYsWM+1W/\
-cuDHatWuHdu3aoW3\
-btmjXrh3S09O9nVI\
-fQO+yL4jITgBLAHz\
-CbCtwDFREcUpEesM\
-ZoHr5Uj8rKwuZmZl\
-YtWoVvv/+exQUFIS\
-2gTFg79692Lt3LxY\
-vXlxelp6ejm7duuG\
-KK65A586dkZKS4u0\
-SzQEMATBERLIAvAJ\
-n0DoSynbHGwYqojg\
-iIjUA3AngYTi7pDz\
-Ky8vDV199hVWrVmH\
-VqlXYt29fWNoY67K\
-zszF9+nRMnz4dqam\
-puOSSS3DFFVege/f\
-uqFOnjrdTWwGYBOB\
-FEZkA4FWl1P6wNDr\
-GMVARxQFD9949AGp\
-6qpednY1Zs2YhMzM\
-TP/74I4qLi8PWxnj\
-kcDiwZMkSLFmyBEl\
-JSTjnnHNw8cUXo1O\
-nTrjwwgtRrVo13Wk\
-pAEYCeFBEnlJK/Se\
-8rY49DFREMUxEmgJ\
-4GsBAb/V++OEHfPD\
-BB/jyyy9RUlISlrY\
-lmtLSUvzyyy/45Zd\
-f8NZbb6Fy5cro2LE\
-jbr31Vlx55ZWoXLm\
-y9ZRqAP4tIkMATFB\
-KvRH+VscGBiqiGCU\
-iwwFMgHN5IjcFBQW\
-YN28ePvjgA2zcuDG\
-8jSMUFRVhzZo1WLN\
-mDerUqYOMjAz069c\
-PZ5xxhrVqKwCvi8h\
-flFIPRqCpUY+Biig\
-GicirAP6he+3AgQP\
-46KOPMH36dJ9Ht1F\
-oHT16FO+88w7ef/9\
-93H777XjwwQeRlpZ\
-mrfaAiLQDMFgptTP\
-8rYxeDFREMURE2gB\
-4C4aVElzWrVuH999\
-/32v3XrVq1dC+fXv\
-Ur18f9erVQ35+Pvb\
-v34+9e/di27ZtIW5\
-9/GnWrBkaNWqE9PR\
-01K9fHw6HA4cPH8a\
-WLVuwY8cOt/rFxcX\
-48MMPMXv2bAwbNgw\
-DBw60dgleDmCbiDy\
-olHotXP+OaMdARRQ\
-jROQBOIc3mxQWFmL\
-cuHGYNm2a9jylFK6\
-55hpcf/316Nq1q6c\
-H/Jg4cSImTZpka5v\
-jmVIKCxcuRNWqVbW\
-v79y5E4sXL8bUqVP\
-d5p+dOHECL7zwAub\
-OnYtJkyahefPmxpe\
-TAEwq6wrUZs2JJmp\
-XOSaiP4nIZGiC1I4\
-dO5CRkeExSLVv3x6\
-fffYZJk2ahKuuusp\
-jkAKAzp0729beRHD\
-66ad7DFIA0Lx5cww\
-dOhQrVqzA8OHDtf/\
-3GzduRM+ePTF//nz\
-dJe4XkUwRaW1fq2M\
-TAxVRFBORs0TkOzi\
-HnZvMnj0bPXv2xKZ\
-Nm9zOq1u3Lp5//nn\
-MmjUL559/vk/34jw\
-q//g6ejI1NRUjRoz\
-AsmXL0Lt3byQlmd9\
-2T548iQcffBCjRo3\
-STbLuCmBLWTadsBi\
-oiKKUiNwLYBOAC43\
-lp06dwuOPP45HHnk\
-EDofDdE5ycjIGDhy\
-IZcuW4dZbb/W0AOt\
-OAJ8COGgsXLZsmZ3\
-Nj3sHDx7UPdd7E8B\
-iAEXWF9LT0/HCCy9\
-g3rx56NKli9v1pk+\
-fjoyMDGzfvl13u1d\
-E5HUbmh2TGKiIopC\
-IjIDzTc9ky5YtuOm\
-mmzBjxgy3czp16oQ\
-FCxbgySefRI0aNXS\
-XnQrgbwDaAzgNQAP\
-XC8eOHcOSJUvsan7\
-C+Prrr61F9wGYCaA\
-6nAvVHrBWOOuss/D\
-+++/j7bffdhv59/v\
-vv+PGG2/ErFmzdLc\
-bJiJTbWl4jGGgIoo\
-yIvIkgJes5dOnT0e\
-vXr2QlZVlKk9NTcW\
-LL76Ijz76CK1bax9\
-nbAIwVCk1GEAJgK8\
-AXGesMHPmTBQVuSU\
-BVIFPP/1U1103GcA\
-jSqlXALQE8KTu3O7\
-du2P+/Pk477zzTOU\
-OhwOPPvoo/u///g+\
-nTp2ynnaXiHxgT+t\
-jBwMVURQRkefgXGm\
-iXElJCR577DGMGjU\
-K+fn5pvpt2rTB7Nm\
-z0auXdt3ZkwAeVkq\
-1VUq9LSL3AfgewF+\
-NlTZv3ox33nnH1n9\
-Hoti4cSPGjBmje+l\
-5EXldKeVQSo0D0Br\
-Odf5MGjZsiOnTp2P\
-AgAFuF/j888+RkZG\
-B7Oxs60sDROQjG5o\
-fMxioiKKEiDwP4J/\
-GssLCQgwbNgwzZ85\
-0q9+7d2/MmjULLVu\
-21F1uIoCWSqmJZdd\
-+DsAbsKxisXLlSvT\
-u3RsHDx7UXIJ88dl\
-nn+Hpp5/WDa4YJiI\
-fA4BSKksp9QCc+4C\
-Z+vUqV66MMWPG4JV\
-XXkFqaqrpAlu2bEH\
-fvn2xf7/b2rX9RGS\
-6rf+QKMZARRQFROR\
-BOBcqLedwODB48GA\
-sXbrUVNfV1ffCCy/\
-ohkevBtBDKfWwUiq\
-77NrTYQmAAPDhhx9\
-i6NChOHnypJ3/lIT\
-0wQcfYMiQIcjLy7O\
-+1FdE5olIJQBQSq1\
-USmUAGG+teP3112P\
-WrFlo1aqVqXzXrl3\
-o06cPdu/ebT3ltrJ\
-pC3GPgYoowkRkKJw\
-ZULnc3FwMHDgQX33\
-1laluq1atMGvWLE9\
-dfW8opboqpcojm4j\
-MAHCbsVJxcTFGjx6\
-NsWPHcoFaG2VmZqJ\
-37944cMBt/MT1AJa\
-KSPkif0qpxwEMB2D\
-qy3V9f2+44QbTBfb\
-s2YO+ffti165d1mv\
-fIyIP2fVviFYMVEQ\
-RJCIdALxsLCsoKMB\
-dd92FdevWmeqed95\
-5mDFjhtsn7jIPKKW\
-GW679CYAMY9nBgwd\
-x++23e5wgTMHZsmU\
-LMjIysHmz2w70lwK\
-YVbaWHwCgbLX0lgB\
-M8wJSU1MxceJE/PO\
-f5iR4//796NOnD3b\
-u3Gm99oSyFdjjFgM\
-VUYSISGUAH8I5lBm\
-Ac6uIhx9+GD/++KO\
-p7vnnn48PPvgAp51\
-2mvUyqwG0VkqZHtS\
-LyEQAfYxlGzduxI0\
-33ugWAMle2dnZuPX\
-WW3VD1zvA+f0up5T\
-ap5S6As6RgiaDBw/\
-GqFGjTGUHDx7EPff\
-co+uuHSUibj8c8YK\
-BiihyPgTQzljw7LP\
-P4ssvvzRVOv/88/H\
-+++/rgtTksq4+03j\
-1sonCpu0isrKyMGD\
-AAA6aCJO8vDwMHDg\
-Qs2fPtr7UQURethY\
-qpe6Dcw6WyV133YX\
-HH3/cVJaVlYVHH30\
-UImIsbgbg46AbHqU\
-YqIgiQET+AUvG895\
-77+H999831fMSpMa\
-XvbnpjDAe7N69GwM\
-GDOCWH2FWXFyMRx9\
-9VNfN+nDZhwkTpdR\
-kABcB+N1Yfs899+D\
-hhx821V28eDHeeMN\
-tn8UbROT/gm54FGK\
-gIgqzsudSrxrL1q5\
-di+eee85Uz0uQ+k/\
-Zw3jdtZ+Cc84OAOc\
-crGHDhunm4lAYiAj\
-GjRvnNkkbwP+JiNv\
-7r1LqewD9AZhOuP/\
-++zF8uOkRJCZOnIi\
-VK1daL/GCiHQKtt3\
-RhoGKKPxMQSonJwe\
-PPvooSktLy8saNGi\
-Ad955x1OQ0n5qFpE\
-eAEyzT6dOncrdfSO\
-ssLAQjz76qHWEZXM\
-4d2d2o5RaB2AAgD+\
-M5SNGjMA99/y5NnF\
-paSkeeugh3WLCo6w\
-FsY6BiiiMROSfAC4\
-xlj3xxBOmjEcphfH\
-jx+t2gP23pyBVxrS\
-ixa5du/DKK247g1A\
-E/Prrr5g82W28xAO\
-6LkAAUEp9DWewMo1\
-1f/zxx3H33XeXH+f\
-m5uKpp56ynn5d2So\
-kcYOBiihMRORsAKb\
-+vRkzZuCLL74w1Rs\
-4cCD+/ve/W0//t1J\
-qpLXQcO3HAFxsLPv\
-Xv/7ltuQSRc6kSZN\
-0w9ZHiUgVXX2lVCa\
-cweqIsXzkyJGm9QG\
-XLVumW1D4ORGpE3S\
-jowQDFVH4DDMe7Nu\
-3D2PHjjVVOOuss9x\
-GeQH4XwVBqgOA/5h\
-O+N//8M033wTXWrJ\
-VUVGRrguwCTQLELs\
-opZbAGaxOuMqSkpI\
-wbtw4JCcnl9cbO3a\
-sdcuXNACjbWp6xDF\
-QEYWBiFwK4H5j2cs\
-vv2yaD5OSkoKJEye\
-iShXTB+w8ABVtR26\
-KdocOHcILL7wQXIM\
-pJDZu3IjXX3fbVup\
-+bxN2lVILATxmLDv\
-77LMxaNCg8uP9+/f\
-j1VdftZ76oIj4tmt\
-mlGOgIgoP07OITZs\
-2Yc6cOaYKDzzwgG6\
-bjpFKKY+Tn0RkOJx\
-L9JQbO3Ysjh8/Hlx\
-rKWRef/113a7MD+v\
-quiil3oJlfcAHH3w\
-Q6enp5cfvvvsutmz\
-ZYj21b+AtjR4MVEQ\
-hJiLXwjJn6j//+Y9\
-plF+tWrVwxx13WE9\
-9TSnlcVdXEakL4Fl\
-j2dKlS92eeVF0KS4\
-uxpNPPmmdsHu2iDx\
-Swan/BlD+CSQ1NdU\
-0sKKkpASTJrntJDJ\
-CRJoF2eSIY6AiCj3\
-Tp9q1a9di1apVpgr\
-9+/dH9erVjUXblFI\
-Vdfk9AaCW68DhcGD\
-06Lh5LBHX1q9fj88\
-++8xaPF5EWng6Ryl\
-1BM7vebm+ffuaRoc\
-uWrTIunBtMpzzsmI\
-aAxVRCIlIGiyByjp\
-kvGrVqrjzzjutp06\
-p4LpXwbnVuem6nNg\
-bO/79738jJyfHWKQ\
-A/MvbOUqp1wCUR6L\
-U1FTTz05paSnefvt\
-t62kPi0iNoBscQQx\
-URKHVF85PtQCA7du\
-344cffjBVuOWWW1C\
-3bl1j0WE4Nzn0xrS\
-09tatW/Hee+8F11I\
-Kq5ycHIwf77Yt1WA\
-RuUdX38A0UXjAgAG\
-oVq1a+fHMmTNx+PB\
-hY5W6cI4cjFkMVES\
-hZcp6rN09ycnJGDx\
-4sPWcCUopj7sZisg\
-DcG4bUW7MmDHcWyo\
-Gffrpp/jpp5+sxV4\
-HVgB4E8Ae10FaWhq\
-6dOlS/mJBQYHbmpE\
-+XDOqMVARhYiItAf\
-QxnVcUlKCWbNMu5C\
-jS5cuaNq0qbGoEJa\
-tICzXPB3A88ay2bN\
-n49tvv7WjyRRmIoI\
-nn3zS+iHjL94Wl1V\
-KFQIwfeK58sorTXW\
-mTZuGwsJCY1HLsp/\
-HmMRARRQ6ppF+K1e\
-uxKFDh0wVjCsMlHl\
-RKbXHWmgwCkCq6yA\
-3N5dzpmLcxo0bdSu\
-sv2DcZFHD9Imne/f\
-upgnAJ06cwOrVq63\
-n9A6mnZHEQEUUOqZ\
-1kObPn+9W4ZxzzrE\
-Wua2x41I2KdQ0aXj\
-ChAluwY9iz8svv6z\
-7Pv5TVxcAlFKrAex\
-3HdeqVQsdO3Y01dF\
-MU4jZOVUMVEShc67\
-xwDqIAtAGKm/b75q\
-eM2zatAkfffRRoG2\
-jKJKbm4vnn3/eWty\
-vgsVlFxoPOnToYHp\
-x6dKlKCoqMha1itX\
-uPwYqohAQkQthmOO\
-UnZ3tth1DnTp1UL9\
-+fWPRUaXUBg/Xexj\
-A2YZjDqCIM3PmzNE\
-9axyhq1vGtAyFZR4\
-ecnNz3ebrIUa7/xi\
-oiEKjs/Fg3Tr3RCk\
-lJcValKe7kIg0AWB\
-6EDVz5kztNSm2jR4\
-9GsXFxcaiViLiaX8\
-p08hQ4xB1F0333y3\
-BtC9SGKiIQsO05ca\
-PP/7oViEpye3Xr9S\
-tktO/AJSvVHvixAk\
-OoIhTWVlZmDp1qrV\
-4XFmGbmX6YGPNqAB\
-g+fLlbks1BdvGSGC\
-gIgoN0/MpzVwZnwJ\
-V2QAK03OKl156CUe\
-PHg2+hRSVXnvtNez\
-fv99arNvmxRSodBn\
-V8ePHrUsqQUQucas\
-Y5RioiELD9DxJs2G\
-erxmVaQDFhg0b8PH\
-HH9vRPopSDocDTz/\
-9tLU4Q0TutpRVmFE\
-BwM8//2wt0mVnUY2\
-BishmImIayrdnzx7\
-rpnYAtIHKNDKibDV\
-tU8AbPXq0adV1ik+\
-LFy9GZmamtXisiBg\
-fbJp+qHQZFQD88ss\
-v1qKLgm1fuDFQEdn\
-PNFFz69at2kqaQFX\
-+MEFEmkOza6+uC5H\
-i01NPPYWCggJjUWM\
-AxhUrTA+flFLa62g\
-yqr/Z0LywYqAisp8\
-po/IjUBkzqn/B8Pu\
-Zk5OD//znP9b6FMf\
-++OMPTJ482Vo8VkS\
-6+nOdTZs2WacxtBE\
-RfT9hlGKgIrKfKaP\
-S7LoKwHOgEpGhAEx\
-bk48fP966JQQlgCl\
-TprgNhoCXFSt08vP\
-zsX37dmtxTG2myEB\
-FZD/TEGBPgUrTVeP\
-qyjENoPj555/xv//\
-9z662UQwpKCjAU08\
-9ZS2+WkSGAahsLLS\
-sQmFy8OBBa1FDG5o\
-XNgxURDYSEQXgLNd\
-xaWmp7tMsAODUqVP\
-WouoiMt56/pgxYzi\
-AIoGtWrUKixYtsha\
-PA1DVWGB5nmWiWUe\
-QgYoogZ1hPNi3bx/\
-y8/O1FU+edNty6jQ\
-AjxoL3n33Xfz6669\
-2to9i0DPPPGMdOVo\
-bgGlvD2+ByrKRIgA\
-0sKtt4cBARWQv0+Z\
-SBw4c8FhRE6hqGg+\
-2b9+Ol19+2baGUew\
-6cOAAXn31VWuxaVN\
-OPwMVMyqiBNbYeJC\
-dne2x4qlTp6yjscr\
-3mSopKcHjjz/u9c2\
-HEst7773ncQQp4Hf\
-XX7o9rQoPBioie5k\
-+qXoLVAC0E4EBYOr\
-UqVi/fr19raKYV1x\
-cjDFjxnh83Vug0iy\
-5VV9XL1oxUBHZy5R\
-RaUZbmeTluS+YnpW\
-VhQkTJtjbKooL337\
-7LWbNmqV9zbL1fEW\
-vuS3dH80YqIjs1ch\
-4UFFGZX1O5ery8/a\
-mQ4nthRdeQG5urlu\
-57kOPi2bUaEy998d\
-UY4ligF+Byvrm8vb\
-bb+uWvCEqd/jwYbz\
-00ktu5d6eXzFQEZG\
-R6RlVRV1/xoxq69a\
-teOWVV0LTKoor06Z\
-Nw2+//WYq063Q76L\
-ZCbqS/a0KHQYqInv\
-VMx4cO3bMa2VXF05\
-JSQkee+wxdvmRT0p\
-LSzF8+PDyD0IFBQX\
-YuXOn1/oWMfXeH1O\
-NJYoBpr0WKhpePnv\
-2bIgIXn/9dU7sJb/\
-s2bMHAwcORG5uLr7\
-55htd1lQu1jOqmGo\
-sUQzweVkbAFiyZAk\
-uvPDCCjMvIp3Nmzf\
-jqquu8jjNwSXWMyo\
-GKiKbiEgVGN4Aioq\
-KfFqjj0GKglHRgB0\
-g9gNVTDWWKMr5lU0\
-RhUusd/0xUBHZh4G\
-KopImo0qORDsCxUB\
-FZB/TQApPq6YThZs\
-mo4qp9/6YaixRlGN\
-GRVGJGRURuZgCFTM\
-qihYMVETkwoyKohK\
-7/ojIxRSouMoERQt\
-NRsVRf0QJioMpKCo\
-xoyIiF3b9UVTihF8\
-icmFGRVGJXX9E5MK\
-MiqISu/6IyMW0vTc\
-HU1C00AQqDk8nSlD\
-KeCAikWoHkYnmZ5G\
-BiihBmR4EJCXx14u\
-iA7v+iMiFgYqiEld\
-PJyKXYuNBcnJM9a5\
-QHOMSSkTkwoyKopK\
-IWJ9TKU91oxF/k4j\
-sw0BFUcuaVYlIzPy\
-AxkxDiWIAAxVFrVi\
-e9MvfJCL78BkVRa1\
-YHvkXMw0ligHMqCh\
-qMaMiIgAwfWRloKJ\
-oEsurU/A3icg+pnc\
-Cdv1RNNFkVDEz8i9\
-mUj+iGMCuPy+SkpJ\
-QpUoVpKSklH8Zj11\
-/t9YxlhUVFeHkyZP\
-lXw6HA3l5eXA4HKZ\
-yrrPoLpbnUjFQEdk\
-nYQNVcnIyGjVqhCZ\
-NmqBp06Zo0qRJ+d8\
-bN26MOnXqoHLlymF\
-rT3FxscdgduzYMez\
-du9f0deDAAV3XWFy\
-J5dUpYqahRDEgbkf\
-9JSUloUGDBm5ByPX\
-3008/Par+vZUqVUK\
-tWrVQq1Ytn+qXlJT\
-gwIED2LNnD7Zs2YI\
-NGzZgw4YN2LJlC4q\
-Liyu+QAyI5VF/DFR\
-E9jFP/Vcx8whAq1m\
-zZujSpQu6dOmCTp0\
-6oXr16pFuUsgkJye\
-jcePGaNy4MTp27Fh\
-eXlhYiM2bN2PDhg3\
-4+eefsXr1auzfvz+\
-CLQ1cLK+gzkBFZJ+\
-YzqiqV6+OTp06oWv\
-XrujatSuaNm1q9y1\
-KARQAyDd8WY89fbn\
-qpQCoAaA6gJqaP08\
-r+zJtYhmoKlWqoH3\
-79mjfvj369OkDANi\
-6dSsyMzOxatUqfP/\
-99zHzPCyWR/0xUBH\
-Zx/SLr3l4HVWUUmj\
-Xrh26du2KLl26oEO\
-HDqhUKai3hB0Adpb\
-9af37YaVU2N7RRaQ\
-y9MGsBoC6AJoBaF7\
-2p+vvPmndujVat26\
-NwYMH49SpU/jmm2+\
-watUqZGZmYteuXfb\
-+Q2yk+Xlk1x9RAjL\
-94kdjoGrQoAH+/ve\
-/o0uXLvj73/+OOnX\
-q+HP6bgC7oA9Eu5V\
-SUfMPVkoVAcgp+6q\
-QiCQDaALgHAAdyr7\
-aA2jp7bxq1aqhW7d\
-u6NatGwBg9+7dyMz\
-MxMqVK7FmzRoUFRU\
-F8a+wFwdTEFHUat+\
-+Pa699lp07doVZ51\
-1lj+nFgBYA+BLAF8\
-qpX4JSQOjgFKqBM4\
-gvAvAAle5iNSDM2i\
-1BNAXQBdv12natCn\
-69++P/v37Izc3F0u\
-WLMGCBQuwZs2aiA/\
-K4GAKIgKiKKNKT0/\
-HTTfdhIyMDLRq1cq\
-fU7cCWAhncFpc9ga\
-esJRShwEsLjt8U0S\
-qA7i67OsKeOkyrFG\
-jBjIyMpCRkYHjx49\
-j8eLFWLhwIb766qu\
-IDIXXDKZgoCJKQKZ\
-ffM0bQ0hVrVoVV15\
-5JTIyMnDJJZf4Oo/\
-rEIBVcAamT5RSeSF\
-tZIxTSp0EMKPsCyL\
-SDn8Grr/DwyCOWrV\
-qoXfv3ujduzdycnK\
-waNEiLFiwAN9++23\
-Ygha7/ogIiEBGpZT\
-ChRdeiIyMDFx77bW\
-+DiH/Bs4s4Uul1Nr\
-QtjC+KaU2ANgA4KW\
-y/Z2uBnAtgJsANNa\
-dk5aWhj59+qBPnz4\
-4cuQIZs6ciY8//hh\
-//PFHSNvKrj8iAsK\
-YUTVt2hQZGRno1au\
-Xr8PIPwfwGYBFSqk\
-TIWtYAisbTLKw7Ot\
-+EbkUwK0AegFoqDu\
-nbt26GDJkCAYPHoz\
-Vq1dj2rRpWLFiRUi\
-yLC6hRERu7A5Uqam\
-puOGGG9CrVy9ccME\
-Fvkwo/h3AK3B26R2\
-3tTFUIaVUJoBMAMN\
-FpDucQesmAOmauuX\
-z1/bv349PPvkE//v\
-f/3Do0CHb2hPLXX8\
-xk/oRxYCQdf117Ng\
-RCxcuxHPPPYcLL7z\
-QW5DaDeA5AO2VUmc\
-rpSYzSEWeUmq5Uup\
-epdTpAK4EMBXAYV3\
-dhg0bYsSIEVizZg0\
-mTJhg28TrWF49nYG\
-KyD6mX3w7MqqqVat\
-i9OjRmDZtmrc3rFM\
-APgRwjVLqDKXUKKX\
-Ub0HfnEJCKbVEKTV\
-YKVUfwFAAm3T1KlW\
-qhJ49e2LJkiV45JF\
-Hgl6SK5a7/hioiOx\
-j+8oUI0aMwJ133un\
-pTWoTnG90aUqpO5V\
-Si4K+IYWVUuptpVR\
-bABfD2U2ba61TuXJ\
-lDBs2DNddd11Q92L\
-XHxEBIRhMce655+q\
-KnwbQUinVtuyNLjY\
-WmyOPlFLfKqUeAnA\
-6gGFwzmcz2bt3b1D\
-34BJKROTGjkCVnZ1\
-tLbpfKfV60BemqKS\
-UcsA5sfhTAEdc5cX\
-Fxdi4cWNQ147lQBU\
-zDSWKAbYPpvj111+\
-tRR119SjuXGg82Lx\
-5MwoKCoK6ILv+iAg\
-IQdffTz/9ZC1ioEo\
-MFxkPfvkl+GUWmVE\
-RERCCUX+//fab9ZN\
-wGxFJC/rCFO1MGdX\
-PP/8c9AWZURFRSJw\
-6dQqbN2+2FjOrin9\
-/NR6EKKPi8HQisof\
-m0zQDVRwTkTPg3Mw\
-RAOBwOJCVlRX0dTn\
-hl4hChs+pEo6p20/\
-T/RuQWN6KnoGKKMp\
-pAtVfdfUobtg+kAL\
-QZlR8RkVE9ti+fTv\
-y8kzbRDUREa9bpFN\
-MM2VUdgWqWN7mI2Y\
-aShQDTMP8gl2bzaW\
-0tFT3ZsXuv/jVzng\
-QwkDFjIqI7MPnVIl\
-BRM4G0MB1fOzYMez\
-evduua1uLYub9P2Y\
-aSpTIOPIvYYTk+RT\
-Arj8iCjFNRnVOJNp\
-BIWf7RF8Xdv0RUUg\
-dPnzYunp2dRG5yFN\
-9ilkhGUgBcAklIgo\
-DTVbFQBV/TJkyA5V\
-TzDSUKAaY3gnsGvX\
-nwpF/8U1ELgSQ6jr\
-es2cPjhw54uUM/3A\
-eFRGFHDOquBeygRQ\
-AB1MQURh4WEm9dqT\
-aQ7YL2fMpgEsoEVE\
-Y5OfncyX1+Gb6Xto\
-dqNj1R0RhwYm/8Ul\
-EFICzXMelpaW63Z2\
-DwtXTiSgsGKji1mX\
-Gg23btsHhcNh6A86\
-jIiIgRGv9GWkmgHI\
-l9fgQsom+Ltw4kYj\
-CYtu2bcjNzTUWNRa\
-RVpFqD9kmpCP+AI7\
-6I6IwERHOp4pP5xs\
-PwpRRseuPiEKDz6n\
-ii4g0BXCm67igoAC\
-///677YT1AesAACA\
-ASURBVPfhyhREFDZ\
-cST3udDYe/PLLLyg\
-uLrb9Juz6I6Kw4Ur\
-qcecS48GPP/4Ykpu\
-w64+IwubIkSPYs2e\
-PsShVRDpFqj0UNFN\
-GtW7dupDchCtTEBE\
-QhuHpLuvXr7cWddb\
-Vo+gmIikAzjOWhSp\
-QccIvEYWVpnuIgSo\
-2XQJDZrN9+3bk5OS\
-E5Ebs+iOisNJ86v5\
-bJNpBQQtLtx/Arj8\
-iCrPff//dusROMxF\
-pEan2UMDCMpAC4PB\
-0ooRXNhemZ7juV1J\
-Sopv4y+6/2GOa6Bv\
-mjOoGEbk/ZDe0EQM\
-VUZBE5B8AtgG4PZz\
-31bypMVDFEBE5B0C\
-66zgnJwfbt28P2f0\
-0GVVDAJNEZHLIbmo\
-TBiqiAImIEpEpAF4\
-FUNn4WnFxcUg/HQP\
-abqJuIb0h2c2t209\
-EPNUN2qZNm7Br1y7\
-dS/eISJaIDA3ZzYP\
-EQEUUgLJf6m0A3H6\
-5v/nmG1x33XX48MM\
-PQ9qGn376yfrGdnZ\
-Ib0h2C9tACgDYuHE\
-jrr76akyYMAEFBQX\
-Wl1sCmCIi40LaiAA\
-xUBH5SUSeBTAFgGn\
-wQn5+PkaPHo1+/fo\
-hKysr5O3QdRWJSPe\
-Q35jsYpqkHcqBFC6\
-FhYV47bXX0LNnT2z\
-cuFFXZZSIfCki6bo\
-XI4WBisgPIjIVwL+\
-s5b/99ht69uyJadO\
-mhbU9nE8Vm8oCQWv\
-XcXFxcUi29vAkKys\
-LvXr1wuTJk3XPrq4\
-EMEdE2oStQRVgoCL\
-ykYh8AOAuY1lpaSn\
-eeOMN3Hzzzdi2bVv\
-Y28RAFbNM36fffvs\
-N+fn5YW1AcXExxo8\
-fj9tvvx179+61vtw\
-RwKci0j6sjfKAgYr\
-IByLyEYABxrKDBw+\
-ib9++eOmll0Ky2rU\
-vNIHqPF09ijphmz9\
-Vke+//x7XXnstFi5\
-caH3pPAAfRkNmxUB\
-FVAERGQOgn7Fs//7\
-96NOnD3744YcItcp\
-p27ZtOH78uLGooYi\
-0jVR7yGdhHUhRkby\
-8PDz44IP49NNPrS+\
-dByC0o4J8wEBF5EX\
-Z6L6njGW7d+9Gnz5\
-9PA31DSsR4QK1MUZ\
-EFCyZbyQzKpfS0lK\
-MGjUK//3vf60vdRS\
-R9yLRJhcGKiIPRCQ\
-VwFhj2eHDh9G3b1/\
-rNhsRxedUMecSANV\
-cB7t378bBgwcj2Jw\
-/iQieeuopXWY1UEQ\
-ejUSbAAYqIm9eAXC\
-666C0tBQPPfQQ9u/\
-fH8EmudN0G/09Eu0\
-gn0VVt5/OU089hQ0\
-bNliLx4vIXyLRHgY\
-qIg0RaQVgsLFs4sS\
-J+PrrryPUIs80W5e\
-3FpGqkWoPVShqBlJ\
-4UlhYiOHDh+PEiRP\
-Wl/pGoj0MVER6pl/\
-In376CW+88Uak2uK\
-Vw+HQbU8fkTcU8kk\
-H40E0ZlSAs0vymWe\
-esRYPiURbGKiI9AY\
-ZD6ZPnx7SddiCtWb\
-NGmvRFZFoB3lXNtS\
-7ies4Ly8PW7ZsiWC\
-LvFuwYIE1q2okIte\
-Fux0MVEQWInIpDMs\
-j5efn6+aYRJWvvvr\
-KWtQlEu2gCpm6/da\
-vX69bGSJqFBQU6H7\
-2w56tM1ARuTP9Ii5\
-evBgnT56MVFt88vP\
-PP1vb2DRaVhUgk6g\
-fSGE1c+ZMa9HNIhL\
-W2MFAReTucuPBrFm\
-zQnKTtLQ0265VUlK\
-Cb775xlrM7r/oY8p\
-0o3EghdW6deuwe/d\
-uY1FVAGHt/mOgIjI\
-QkSoAWrmOi4qKdN1\
-qPqlfv77X12fPno1\
-OnTp5reMPTTsZqKK\
-IiNQGUD68u6SkRDd\
-ZOyCpqal4+umnvda\
-pX78+UlJSArr+ihU\
-rrEXNA7pQgBioiMw\
-aGA+OHDmi28Lbq8a\
-NG2PSpEl44oknvNa\
-rW7cuPvzwQ4wcORJ\
-VqlTxv6UWmkDFib/\
-RxfT92Lx5MxwOR9A\
-X7dixIxYuXIh+/fq\
-hcuXKHuv97W9/w+L\
-Fi3HNNdf4fQ/NhOS\
-Gfl8kCAxURGb1jAd\
-Hjx71+cSGDRti7Ni\
-xWLp0Ka699toK65e\
-UlCApKQlDhgzB3Ll\
-z0a5dO/9ba5CVlYX\
-s7GxjUZqIdA3qomQ\
-n00CKYJ9PpaSk4Ik\
-nnsC0adPQtGlTAEC\
-1atW8ntOkSRO89tp\
-rmDlzJrp1831DaM3\
-vgffuApsxUBGZmTa\
-MO3z4cIUnNG7cGOP\
-GjcOKFSvQv39/n7M\
-jY6bWunVrzJo1Cw8\
-88ACSk5P9bPKf1q5\
-day1i91/0sG0gxbn\
-nnot58+Zh0KBBUEq\
-Vl1et6ts873PPPRf\
-vvPMO5syZgyuuqPh\
-H5MiRI9YiBiqiCHL\
-r+vOkZcuWePbZZ7F\
-8+XL07dvXa7eLjnV\
-rkOTkZDz44IOYNWs\
-WWrdu7eEs7zTdf5f\
-r6lF4lS1Ee5GxLJC\
-BFJUqVcKIESPw2We\
-foWXLlm6ve3sGpZs\
-HeM4552DKlCmYN28\
-err76alSqVEl7rub\
-3IKw7AOtbRZS4TL8\
-T1mBSp04d3HDDDej\
-Vqxfatw9u9LenZ1/\
-t2rXD3LlzMWrUKN3\
-QYK80GVVnEUlVSgX\
-/MISCcRMsC9FqNiv\
-0qk2bNnjppZfQtq3\
-nXVx8zais2rZti9d\
-ffx3Hjh3D/PnzMXv\
-2bNNqJ7m5udZTagZ\
-0owAxUBGZmfbuuOy\
-yy9CvXz+kpaWhQ4c\
-O6NKlS1Bdc0beNlu\
-sUqUKxo8fj9atW2P\
-8+PE+TwrNzs5GVlY\
-WWrVqZSzuAWBOUI2\
-lYN1oPFiyZInPJ1a\
-uXBn33Xcfhg0b5nf\
-W7q/atWvjjjvuwB1\
-33IEdO3Zg+fLlyMr\
-KQvfu3a1Vd4a0IRY\
-MVEQGSqnlInIUQB3\
-AOaS3omG/ZbYCmAD\
-A5wUBNYHqTQD3GQu\
-GDh2Kli1b4qGHHvJ\
-5hNiaNWsYqKLP1ca\
-DpUuX+nRS7dq1MX3\
-6dOv302UXgDwAPo3\
-C0XT9zQKwH8AwXf0\
-WLVrg7rvv9nS5T3y\
-5p134jIrI3QQ/6i4\
-CcKdSqg0A34cIQhu\
-oXgHg9s5w+eWX46W\
-XXvL5upp1/27wp11\
-kr7Ilucqf6eTk5Pi\
-8M/S5557rKUi9AcD\
-9IZWflFLDAVwA4CU\
-Avm6KtUAp9VGw9/Y\
-HAxWRhVJqHIAnARR\
-5qLIFwAgADZVS1yi\
-lXFt1K2Olihax1Ty\
-jqqyUehdAJzgztHL\
-+DF1fu3atNfs6Q0Q\
-u8lSfQu4m48Hy5ct\
-9npvXpk0ba9FeAMO\
-VUsOVUiXw82dORym\
-1Tin1qFIqvaytnwL\
-w1C+9AMAAv28SJHb\
-9EWkopcaJyAdwrvv\
-XHM5saSeAtUqpjXb\
-cQ5NRJZfd+xsRuRB\
-AjuuFRo0aoVq1ajh\
-16lSF1y0oKMCKFSt\
-w3XWmVW4yAHwXdKM\
-pEKbnU4sXL/b5RE2\
-gelYp9abh2JRsBLv\
-ArVJqDoA5ZSu0XA+\
-gLZw//zsBzFdKue0\
-nEw4MVEQeKKV2A/h\
-PqK6v+VRd/vuolDo\
-uIpsAnF12jObNm2P\
-Tpk0+XfvLL7+0Bqp\
-bAIwMqsHkNxH5Kyw\
-r8Wu6Zj3SBCrrtru\
-m0RXeBuhosi2lqwc\
-ASqlCADPLviKOXX9\
-EEaJ5U7F+cDRtVHT\
-mmWf6fO2VK1eisLD\
-QWNRSRM7xp31kC1M\
-2tWbNGp+yYsD54UQ\
-zV8qaFZuGoPq73Fe\
-sYKAiihBNoLIuafG\
-78UA3wdOTkydP6j6\
-5Z/h8AbLL7cYDX0f\
-7AUCDBg2s86L2KqX\
-yLdUYqIgodDRvKtY\
-JWgEHKsDZ/Wdxu64\
-ehYaINAJwluu4tLQ\
-Uy5cv9/n8M844w1q\
-0U1PN1PXnLVBF8w7\
-VFWGgIoqQoiK3QYV\
-eMyp/uv4A56d3yxv\
-XX0TEv4tQMEwbcK5\
-fv97rklxWroVmDbZ\
-rqpnew5lREZGtfMi\
-oNhsPWrRoYVqAtCI\
-5OTn47ju3gX7s/gu\
-fe4wH8+fP9+tkHwO\
-VzxlVLGOgIoqQip5\
-RKaWOwbCkU7Vq1dC\
-woX/bAGm6/+7y6wI\
-UEBE5H0D5ysLFxcW\
-YN2+eX9fQBKodmmr\
-BZFS+f+qJMAYqIvv\
-4NfnS0zwqC9Pag/4\
-+p1q8eLG1HWeX7TR\
-LoWXq9svMzMSxY8f\
-8uoDmGRUzKiIKL02\
-g0q04anpO1aJFC00\
-Vz7Kzs02rYJfpq6t\
-LtjINXJk9e7bfF+A\
-zqj8xUBFFiI+ByvS\
-cyt+MCtB2//E5VQi\
-JyNUAGruOc3NzsWz\
-ZMr+uUbVqVTRoYNo\
-a7ZRSSrcvSDCj/tj\
-1R0Te+TDhFwhyiDq\
-gDVSXi0gTvy9EvjJ\
-lrAsXLkRBQYFfF2j\
-SxO3bs9NDVc6jIqL\
-QCaTrT/MGVqE//vi\
-D3X9hIiJJAG42lgX\
-S7ad5PuU2kKLsXuX\
-iNUgBDFREEeNjRrX\
-HeHD66acjKcn/X9t\
-Zs2ZZi4b6fRHyxR0\
-AqrsO9u7di++//97\
-vi/j4fMr081LRgrT\
-s+iMiv+m2+bAWlC0\
-Our+8QuXKqFevnt/\
-3mj9/vnWCcSsR6eT\
-3hagipkx19uzZAa0\
-I4eOIP1O3n7cFaWM\
-dAxVRhGhWpvC0m4F\
-piHqjRo38vldOTo7\
-ugT67/2wkIg0BXGU\
-sC6TbDwhNRhXLGKi\
-I7GP6fQpk40QPVf8\
-wHgQSqABg5ky3HRv\
-6BHQh8sQU+H/55Rd\
-s366LLxULRUal+Xm\
-Mmff/mGkoUbzxcTA\
-FAOw2HgQaqFauXIm\
-jR48ai+qLSO+ALkY\
-69xkPNM8FfaYZNFN\
-hoGJGRUS283FlCsC\
-mjKqkpARz5861FrP\
-7zwZlz/tauY6Liop\
-0/9c+qVevHqpVq2Y\
-sOqCUOqmpaur64zM\
-qIrKdD/tRuQT9jMp\
-lxowZ1qJeIlIn4Au\
-SiyngL1++HDk5OQF\
-dSPN8apeuHvzMqDj\
-qj4j8Fu6MCgA2bty\
-IzZs3W4uZVQXP9H+\
-o+UDgMx+fTwF+bEM\
-f6xioiCLEj4zKtkA\
-FaAdV/COoCyY4Eek\
-LoHzOwJEjR7By5cq\
-Ar+fjiD/A8v7NZ1R\
-EZDtfMyql1BEADtd\
-x7dq1rc8w/DJnzhz\
-dhornBnxBcps7Fcw\
-qEcyo3DFQEUWIHxk\
-VYMmq/N2XyujQoUN\
-Ys2aNtZjdfwEomzt\
-1g7EsmG4/wK+Myq9\
-1/viMiogAP/ej0ry\
-xeJrwC9jc/ad5M+0\
-f1AUTlynAb9iwQfc\
-M0C9+ZFSmnxeu9Ud\
-EtvNjZQrAprlULku\
-XLkVubq6xqLGIXBb\
-URROTae7U559/HtT\
-FlFKoX7++tXiPri4\
-SZOV0gIGKKGL8WJk\
-CsDmjKigowOLFi63\
-FtwR10QRTtt28LXO\
-nXGrWrInkZFP8Oaa\
-U8jRKgl1/RBRaPq6\
-e7mKaS9O4cWNP9Xz\
-2xRdfWItuDPqiieU\
-248GKFSsCnjvlUrt\
-2bWvRIS/VOeGXiEL\
-LjyWUABsn/bqsWbM\
-GeXl5xqImInJJ0Bd\
-OHKZ9p+bPnx/0BTW\
-B6qiuXhkuoUREoeV\
-nRmVr1x/g7KrSrKj\
-O7j8fiMhfYOn2y8z\
-MDPq6aWlp1qIjXqp\
-zeDoR+c2v7Xf9zKh\
-Mb1iaT94B0XT/9bL\
-lwvHP1E369ddfW7P\
-TgGgC1WEv1YOd8Nv\
-G3xMihYGKyAYicia\
-A541lhw97e4/xL1A\
-ppY4DKD+hRo0a1of\
-uAVm9ejUcDoexqJm\
-IXBT0hePfQOPB0qV\
-LbblonTpuyy7allF\
-lZ2dbB1ycKSJj/Gl\
-fpDBQEdnDNJ9m//7\
-9mDRpktcT/Oz6Ayz\
-PK2rVquVr2zzKz8/\
-HihUrrMXs/vNCRKo\
-DONtwbFugCmVGtXn\
-zZrz11lvW4rt9bVs\
-kMVAR2aOl8WDSpEk\
-VdgX52fUHWAKV5k0\
-tIIsWLbIWMVB5Z/p\
-Q8uuvvyI7O9uWC/s\
-5mMLvZ1SvvvoqTp4\
-07RjSVERq+Nq+SGG\
-gIrJHc+PBrl2edmb\
-4k2beS0V9eSEJVCt\
-XrkR+fr6xqEXZHCH\
-Su8l4YFc2Bfg9PN3\
-vZ1SFhYU4cOCAtTj\
-4kTkhxkBFZA/T4nu\
-HDnl7f3HSrEzhba0\
-/wPK8wq5A5XA4sGr\
-VKmvx5bZcPD6ZhvB\
-rJk4HTBOovD2jCmg\
-e1cGDB61FDFRECeJ\
-044HmzcBNABlVSAI\
-VAKxdu9ZadKZtF48\
-jZavMl//HZ2dnY+v\
-WrbZdX/M99db1Zwp\
-Uvo76Y6AiSlymfn7\
-LSDotP1dPB4BjxgM\
-7A9Uff/xhLWph28X\
-jy4XGg19//dXWi/s\
-5mCKgjOrUqVPWouo\
-+nRhBDFRE9vC+VLq\
-GHzv8uoTkGRUA7Nn\
-jtu5pc9suHl8uMB7\
-88ssvtl7cz+Hpdq1\
-M4ffPbrgxUBHZw/Q\
-uoVTF630GkFGZPl3\
-bHagsi5aeZdvF44s\
-pUNmZUaWmpqJyZdN\
-AvlylVKGXU0yByte\
-MSvOzGfVrLzFQEdn\
-D9C4fYKCqKKMKWdd\
-fQUGB27MLEQl+5ds\
-4IiJJANoZy+zMqPw\
-cSAEEuB+V5meTGRV\
-RgrAjUFU0jypkGRW\
-g7f7jgAqzCwBUdR3\
-s3r076NXSjQIIVH4\
-NT/flZzJaMVARRUi\
-0TPh14YCKCpkCt93\
-PpzSByvsaXJau4oq\
-6/lyBihkVEQHw7dO\
-rZh6VX4HKjiWUjJh\
-RVaiZ8WD37t2e6gX\
-Ez6HpgOXnpbDQ2+O\
-sPzMuBiqixOV315/\
-D4bB219QUEW8nnjA\
-enHbaaf60r0LMqCp\
-kGpJnZ7cfEFBGFdA\
-2HwxURInL70AlItZ\
-11wCgppdTCowHVap\
-UNEjQP5qMqpmuXgK\
-razw4fvy4rRcP4Bm\
-VX11/LrH4rIqBiii\
-CcnNzrUXe+vNMC/K\
-lpKTY2pYjR9zeF9N\
-tvUHsC2lG5eemiYB\
-l1J+mKzluMFAR2cP\
-vjAoATpw4YS3yOEJ\
-CKVUKw55UycnJtux\
-J5eJn0ExEppQnDBm\
-VX4MpfA1U7PojSly\
-mPT2qVavm00kBBAd\
-T95+dWRUDVYVCGqg\
-0PzNuax1ZBNT1p7l\
-P8FsThxgDFZE9TPt\
-6nHmmbwPmAggOpu4\
-/O59TnTp1yvpmlyo\
-i9qVssc+0nqPm+WJ\
-QNN/LfF09g4C6/jQ\
-/mxXvSRNhDFRE9th\
-sPGjZsqWneibBBiq\
-7n1Np2mPvZK3YVtV\
-4UNFwcH9pvpcVBSq\
-/M6rk5GS0aOE2mHO\
-zrm40YaAisscm48H\
-ZZ5/tqZ6JJjB4G/U\
-HhDCj8tAedv/9yRS\
-oCgoKPNULSAAZld/\
-D01u0aGFdTzBLKcW\
-uP6IE8bPx4Prrr0d\
-6esWD5jSB4Q0R+Ze\
-XU0L2jMpDexioAIh\
-IfRhG/ZWWluq2ywi\
-K5nupjYQi0k5EPgB\
-wt7G8oq4/pRQGDRp\
-kLd7iXysjg4GKyAZ\
-KqYUAsl3HaWlpGDF\
-iRIXnaUb9AcCzIvK\
-7iNyjeS2kXX+a9ly\
-gq5eABhoPfvvtt4h\
-kVCLyCIDfAAywvlZ\
-RV2SHDh3Qp08fa/E\
-nfjUyQhioiOwzwXj\
-gyxD1uXPnYvny5bq\
-X/gJgsoi8IiJNDeX\
-hfkb1loeAmTBE5Go\
-A/zGWff3117bfx1t\
-GJSLdRGQVgBetlRw\
-OB5577jksWrTI6/U\
-1P4/fKaU+Cqy14cV\
-ARWSfA36fcOAAhgw\
-Zgvvuuw8HDmhPfwD\
-ANhF5oOw4pM+ovvn\
-mG13xZMP9E4qIXA/\
-gY2PZsWPH8P7779t\
-+L11GJSI1RGQMgOU\
-AulgrrFq1Ctdccw2\
-mTp3q8zYfBvamhCH\
-EQEUUIv4sVbN48WL\
-06NED7777ru4NpzK\
-AV0RkGUL8jOqDDz7\
-AuHHjrJsoouz+o2y\
-9WZQTkQwA02GZP/X\
-444+77d1lB833she\
-AbQCesr5w9OhRjBg\
-xAoMGDdItfaWl+Z7\
-GzPt/zDSUKAYENcP\
-f4XDg2WefxU033YS\
-ff/5ZV6U7gGuMBQF\
-8iq7Qe++9h5EjR+q\
-uPU5EXrD9hlFIRIY\
-C+AxAdWP5iy++6Km\
-rNmiajOp1APWthbN\
-mzUKPHj0wZ84cv66\
-vCVQxs+gfAxVRiAS\
-6+OfGjRtxyy23YPT\
-o0bpnRiahWt/t888\
-/xwMPPKC7/v+JyKs\
-huWmUEJFhAKbA8v7\
-4wgsv4M033wzZfSv\
-Kjnft2oU777wTjz7\
-6aEDrDDJQEZGtSkt\
-LMW3aNPTo0QPz5s3\
-zWM/uSadGixYtwpA\
-hQ+BwOKwv/UNE3gn\
-ZjSNIREbCmcmYPPP\
-MM3j77bdDdt+kpCS\
-P6zY6HA68+OKLuPr\
-qq7FmzRo7b8tARZS\
-AbF/c89ChQ3jooYc\
-wcOBA7NrlvtJNKAM\
-VAKxevRoDBgzQDVu\
-/W0SmhfTmYSYizwJ\
-43lhWWlqKUaNGhWT\
-whC/mz5+PHj164M0\
-33wz6e63JqGJGpYq\
-rEFGkrV69Gtdccw3\
-uu+8+3HvvveWrC9g\
-9l0dn/fr1uP322/H\
-++++jXr16xpduF5G\
-zQt6A8OlgPCguLsa\
-IESOwYMGCkN+4tLQ\
-UpaWlSEpy5g6bN2/\
-G2LFj8e2339p2j1j\
-u+mOgIrJPSD+yFhQ\
-UYOLEiZg7dy6eeeY\
-ZnHvuudixY0cob1l\
-u06ZNuO222/Df//4\
-XjRo1Mr7UwdM5sSw\
-/Px/Dhg1DZmZm2O5\
-ZUlKCvLw8TJgwAdO\
-mTbN9oAwDFRG5CdV\
-Oqtu3b0e/fv1w0UU\
-XhWTUnyc7d+5E796\
-98eGHH/q86G4sys3\
-NxeDBg/HDDz+E9b5\
-PPvkkli1bhqNHj4b\
-k+hyeTkRAmDeg++6\
-778J5OwDOCcp9+vT\
-Bxo0bw37vcDh69Ch\
-uv/32sAcpAPjss89\
-CFqQAZlREpBGqjCr\
-Sjh49ittuu023XUT\
-My87OxuHDFW2sG5s\
-YqIgIAEoj3YBwcTg\
-c2LBhQ6SbQX6I5UD\
-Frj+iEInXjIriRsz\
-8gDJQERElgFieR8V\
-ARWQf0zsBMyoiezB\
-QERFRVGOgIrJP7Pa\
-tEEUxBiqiEPGl669\
-Jkybo1KlTGFpD8ap\
-OnTq49tprI92MkGK\
-gIoqgxo0b46OPPsK\
-8efPQq1cvVKrEGSP\
-km9atW+O5557DmjV\
-r8Pzzz1dYn8PTici\
-NLxmVa2uHtm3b4sU\
-XX8SqVatw7733ola\
-tWqFuHsWorl274r3\
-33sOiRYtw2223ISU\
-lBdWrV/e4TUg84Mc\
-3ogiyvrmkp6fjscc\
-ew/DhwzFjxgy8995\
-72u09KLGkpKTgxht\
-vxF133YXWrVu7va6\
-UQlJSUljXfgwnBio\
-i+/g9mMLTp+DU1FT\
-ccccd6NevH5YtW4a\
-3334b69atC7qBFFt\
-q1KiBO+64AwMHDkT\
-dunW91i0uLg5Tq8K\
-PgYoogirqrklKSkK\
-PHj3Qo0cP/PTTT5g\
-6dSq+/PLLuP3kTE7\
-16tXDoEGD0L9/f5x\
-22mkV1i8pKYnpCb0\
-VYaAiso8dGdUsOPd\
-4amZ94bzzzsOkSZO\
-we/duvPvuu/j8889\
-128RTDGvSpAmGDBm\
-C3r17IyUlxVvVKQD\
-ucR3EczYFcDAFUcj\
-4M5jCoEQp1RzON6H\
-fdec0bdoUY8aMwZo\
-1a9CtW7cgW0nR4vL\
-LL8eXX36J/v37ewp\
-ShwE8CaAVgMeML/g\
-SqDjqj4iAAFZPd20\
-9blAMAEqpt5RSZwO\
-4HsA03bm1atWKy60\
-2ElHNmjXx5ptvomr\
-VqrqXtwEYCaCFUmq\
-cUmobLL1hRUVFYWh\
-l5DBQEYWILxmVZt6\
-U6eGTUmqBUqo/nN2\
-B4wGcMlXms6q4UFJ\
-SosuutwP4h1KqlVL\
-q30qpPMNrla3nxzM\
-+oyKKIE8ZlZVSaj2\
-A9SKSCmC4q7y0NGG\
-2wIprBQUF1qJCpVR\
-LL6dUMR4woyIiX/m\
-9enpFGZWG6WN3vH+\
-SThTFxcXWDx1VRMT\
-bD1A140F+fn5I2hU\
-tGKiIIiiAB9ym31l\
-mVPFDk1VpH1iV8Tt\
-QcTAFEQEBZFSFhYX\
-WIq9jkmHprmdGFT/\
-8DFSm1zTnxhUGKqI\
-I8vPNCbD8zjJQxY9\
-QZ1SxjIGKyD5+T/g\
-NIFCZHqLH+0TPRKL\
-JrplRlWGgIgqREHX\
-9JdQn6UTCrj/PGKi\
-IIiiAjIqBKk6x688\
-zBioi+4RjMEVCfZJ\
-OJKHOqDSj/mLm/T9\
-mGkoUjzRvMOz6S1D\
-MqDxjoCIKEV8yKs2\
-bUzVdPQNmVHGKgco\
-zBiqiCNJ0/VXR1TN\
-IqDeoRBJMoIr3Dyw\
-MVET2CcfwdAaqOMV\
-A5RkDFVEEBTCYItV\
-4wEAVP7iEkmcMVET\
-2CXtGFe+fpBMJ51F\
-5xkBFFCK+DKYoKiq\
-yftLlqL8ExcEUnjF\
-QEUWYtftPRLTBqqy\
-8PPoVFhbqunMoRjG\
-j8oyBisg+fk/4Bfx\
-6gzKVx/un6ETDjMo\
-zBiqiCPNjMdKE+hS\
-daCKQUXEwBVECCnV\
-GlVCfohMNu/48Y6A\
-iijA/hqhzxF8c83O\
-qQkJ9aGGgIrJPQPv\
-CM6MigBmVNwxURCH\
-ia9efH5+kOdk3jvm\
-5cWJCfWhhoCKKMGZ\
-UBHDUnzcMVET24WA\
-KClio1/rjEkpEFDA\
-OpiCAi9J6w0BFZB+\
-7MipPgSqhHqAnGg6\
-m8IyBiijCAp3wy66\
-/+OJroBKRygCSXcf\
-FxcUoKSkJYcsij4G\
-KKML8yKj4jCqO8Vm\
-lZwxURBHmx3b0Cfc\
-GlUgCXfPR126/WF7\
-AmIGKKML82I6egSq\
-OMaPyjIGKyD6hHp5\
-umvAb7w/QEw1X0fe\
-MgYoowgIdnp4Ib1C\
-JJNRdf7GMgYrIPqb\
-fp9JS35b+Y5cPAX7\
-t9pxQc6gABioiO6U\
-bD44cOeLTScyoyMU\
-adERE96EloIyqqKj\
-IWuRtdfaowkBFZB9\
-ToDp8+LBPJ7HLh1x\
-8/FkI6ANLbm6utai\
-Wr+2KNAYqIvswUFF\
-QwhyoavrarkhjoCK\
-yj2lU3qlTp3w6yY+\
-VKdj1F+cCCVS+fmA\
-pKSmxPgOr5E/bIom\
-Bisg+XD2dguLjz0L\
-Aw9N9/ZmMNgxURPY\
-JKFBxMAW5+JhdJ9x\
-8OgYqIvuEdcIvA1X\
-80XQXp2qqBfSsUvP\
-zGDNrKjFQEdnHNHE\
-q1BlVInySTjSaKQ0\
-NNNUCyqwZqIgoYHx\
-GRS6HDh2yFp2uqZZ\
-woz8ZqIjsE9AnVD8\
-CVe3yG4kgLy8vkNt\
-RFNNMaUjXVGNGRUQ\
-BC9lgChExTc7Mzc2\
-N+83yEpEmUFWYUQW\
-RWTNQESWgUA6mqGs\
-8yMnJ8addFCN8zKj\
-sGkzh22KUUSBmJnw\
-RxStdRiUi9wP4A8C\
-usq/6xgpHjx4NT+M\
-orHSBSkSaAWgO4G8\
-AzgbQ2lghEZ5RMVA\
-RhUgQGVU9AJMsZSe\
-MB8yo4pMmUP0FwE5\
-v5/AZFRH5w2E8qFb\
-N047yZqdOnfJluSX\
-TumzHjh3zq2EUGzS\
-Bqq6unpGvGVWVKm4\
-bR8dMKsZARWSfnca\
-Dxo0b+3SSiOCHH36\
-wrsPm1bp16/xqGMU\
-Gh8MBh8NRcUUAeXl\
-5+Omnn3DgwAGf6te\
-pU8da5NuqyVGAXX9\
-E2grNJAAAIABJREF\
-U9tlpPDjjjDN8PnH\
-gwIGoUaMG2rZti7Z\
-t2+KMM85Ao0aN0Kh\
-RIzRu3Bi1ajkH/R0\
-6dAjbt2/H0qVLbW0\
-4RY/nnnsO48aNKz8\
-+cuQIsrKysG3bNmz\
-duhXbtm1DVlYWsrO\
-z/bpujRo1rEUndPW\
-iEQMVkX1M7xyaT7B\
-e5ebm4ttvv8W3337\
-r9lr16tWhlOLcqQT\
-wySefYMGCBUhLS8O\
-JEydsex7JUX9EBFh\
-+8ZOS7OtZP3nypG3\
-Xouh34sQJnDhhb8L\
-DwRREBADFxgM7AxV\
-RsDQ/jzEzY5y/SUT\
-2MX1CZaCiaMKMiog\
-AS0aVnJwcqXYQuWG\
-gIiLA0pXCjIqiCQM\
-VEQHs+qMoxkBFRIA\
-lo2LXH0UTDqYgIsD\
-yi+/rWn9E4cCMiog\
-AyzwqZlQUTTQZVcx\
-M+GWgIrJPyCb8EiU\
-y/iYR2YcTfilqseu\
-PiAB2/VEUi+WuP67\
-1R2Qf27r+WrZsiV6\
-9eqFnz55IT0/Hd99\
-9h6FDh/qybxXFkRE\
-jRqB37944cOAAdu3\
-ahczMTMyZMwelpf7\
-HmFjOqBioiOwTdNd\
-feno6nn76aVxxxRW\
-m8s6dOyMjIwPTpk0\
-LroUUM5o2bYrhw4c\
-DABo0aIC//vWvuOG\
-GG3Dvvfdi4MCB2L9\
-/v1/X4/B0IgJsyKg\
-uvvhityDlcuaZZwb\
-WKopJLVq00Ja3atU\
-K1157rd/Xi+WMioG\
-KyD5BP6PKzc31+Br\
-nZSWWatWqeXztkks\
-u8ft6DFREBNgw4dd\
-boNq2bZv/LaKYtXX\
-rVluvx0BFRFBKBZ1\
-RedssLysry/9GUcz\
-atWsX8vPzta85HA6\
-/r8dARUQupl9+f7O\
-q7Oxsj68xo0osJSU\
-lHj+cHDp0yO/rcTA\
-FEbkEtdVHTk6O9tP\
-y8ePHcfjw4eBaRjF\
-n8+bN2vKdO3f6fS1\
-mVETkEvTmiXv37nU\
-rYzaVmH799Vdt+a5\
-du/y+FgMVEbkEvSe\
-VLlDx+VRiWrt2rba\
-cgYqIghH0pF9doPr\
-5558DbxHFrG3btrk\
-9tywpKcHu3bv9vlY\
-sL6HEQEVkr6An/e7\
-Zs8etbOXKlQE3iGK\
-bNavat28fiouLPdT\
-2jBkVEbkEPUTdmlF\
-t2rQJBw4cCK5VFLO\
-++uor03EgAykAbaB\
-iRkWUoEy//IFM+t2\
-3b5/peMWKFcG1iGK\
-aNaMK5PkUwEBFRH8\
-KetSfteuPgSqxZWd\
-nmwbT2JhRxQwGKiJ\
-7Bd31d/jwYRQWFgJ\
-wzqv66aef7GkZxSx\
-jVhVoRsXBFETkEnT\
-Xn4iUd/+tXLkyoL2\
-HKL4Yn1PZ2PXHwRR\
-ECSrorj/gzwEVwXb\
-79ejRAyNHjkT9+vW\
-Dug4Frl27dujdu3d\
-Q11i7di1OnDiB0tJ\
-S/PHHHwFdg0soEZF\
-L0BN+AedzKofDgdW\
-rVwfVmPvuuw9Dhgz\
-BqlWr8PTTT6NJkyZ\
-BXY98k5SUhCuuuAI\
-ff/wx5s6di7Fjx6J\
-u3boBX8/hcODTTz/\
-Fvn37UFRUZFczYya\
-j4g6/RPYKaq0/l0W\
-LFuHXX3/F8ePHA25\
-Ihw4dcO655wIAqlS\
-pgn79+qFPnz6YO3c\
-uJk+ezNUuQiA1NRU\
-333wzBg0ahGbNmpW\
-Xp6SkoF+/fnj11Vc\
-DvvYHH3yA1NTUgM+\
-P5a4/Bioie9kSqFa\
-tWhV0Q+6++263suT\
-kZPTq1Qs33XQTFi9\
-ejDfeeAO//fZb0Pd\
-KdOnp6bjzzjvRp08\
-f1KpVS1unf//+mDJ\
-lCgoKCgK6x/79+zF\
-69OiA26j5WYyZQMW\
-uPyJ7BT3qzw5NmjR\
-Bjx49PL6ulMJVV12\
-FOXPm4OOPP0aPHj0\
-CDqqJ7JxzzsGECRO\
-wevVq3HPPPR6DFAD\
-UrVsXN954YxhbZxb\
-LGRV/MonsZUtGFaw\
-777zTGiQ3A9iiq9u\
-xY0dMnjwZy5cvx6B\
-Bg3DaaaeFpY2xKik\
-pCT169MD06dMxZ84\
-c9OzZ09MHkkIApr4\
-+XZYbLhyeTkQuEQ9\
-U1atXx6233motnqC\
-U+guAoQA26c5r2rQ\
-pnnjiCaxduxZPPvk\
-kzjjjjFA3NaakpqZ\
-iwIABWLZsGSZPnow\
-LL7zQU9X9AB4HcCY\
-sgapVq1bo2rVriFu\
-qx5UpiMgl4l1/t9x\
-yizUr2qOUmgIASqm\
-3lVJtAdwCYIbu/Or\
-Vq2PgwIFYtmwZpky\
-Zgo4dO4a+0VGsYcO\
-GGDlyJL766iuMGTP\
-GWwDfAuB+pVQjpdR\
-4pdRepdQ2AFOMle6\
-6665QN1krljMqDqY\
-gslfQE36DoZTCnXf\
-eaS2eoKk3A8AMEbk\
-IQF8A9wCoZqzjGmJ\
-9xRVXYM+ePcjMzER\
-mZia+/vpr7S7E8aR\
-169a47LLL0K1bN1x\
-wwQUVfeCYAeCTsv9\
-TnU/g/P8FAHTp0gV\
-t2rTBli3antiQqVy\
-5srUosFEdEcBARWQ\
-vWyb8BurSSy81DYu\
-G8znJx57qK6W+A/C\
-diDwPoB+AhwE0tdZ\
-r0qQJ+vXrh379+qG\
-oqAjff/89MjMzsXL\
-lyrgY5l61alVcfPH\
-F6NatGy677DJf5ps\
-VAHgTzgD1nbeKSql\
-MEZkP4HpX2V133YW\
-RI0cG3W5/aAKV/3u\
-FRAgDFZG9gt6PKhi\
-abOodpVSFe4QopQ7\
-CmXlNEJGhcAass3R\
-1K1eujM6dO6Nz587\
-45z//iX379mHVqlV\
-Ys2YNtm3bht27d+P\
-UqVPB/lNCqk6dOmj\
-WrBnatWuHyy67DJ0\
-6dULVqlV9OXUfnP9\
-P05RS+/245ScwBKo\
-bb7wRL774Ig4fPux\
-fw4NQqZLb271tM4d\
-DjYGKyF4RC1QtW7Z\
-Ely5drMWf+HsdpdR\
-bAN4SkSvh7Ba8FYD\
-HmaaNGjVCnz590Kd\
-Pn/KygwcPYteuXfj\
-jjz+wa9cu09+DmcT\
-sjwYNGqBZs2amr+b\
-Nm6NZs2aBjGzcAmC\
-iUurNQNqilPpYRJ4\
-G0BJwTsDu378/Jk6\
-cGMjlAqIJVIVhu3m\
-QGKiI7BWxUX8DBgy\
-wPhPbpJRaE+j1lFK\
-LASwGMEhErgHg+mp\
-V0bkNGjRAgwYNtCP\
-jjh8/juPHj6OgoKD\
-8Kz8/33Rs/SotLUX\
-VqlV9/qpRowaqVau\
-maZnPHABWAFgIZ/f\
-esWAuVmYCgNdcB/3\
-798ebb74Z8ARgf1W\
-pUsVaxIyKKEGZAlW\
-4nlHVqFEDGRkZ1mK\
-3QRSBUkp9AeALABC\
-RlvgzaHUF4Fd6Uqt\
-WLa8TYyNoB5z/xgV\
-KqYUhuP5bAEYDaAA\
-AtWvXRq9evTB9+vQ\
-Q3MpdLHf9cXg6kb0\
-i0vV36623WteB26W\
-UejsU91JKbVNKvaa\
-Uuk4pVQPAVQBeBDA\
-fwEY4s5FodxDA93B\
-2jT4O4Byl1JlKqeE\
-hClJQShUBeMVYNmj\
-QINtGhlZ0HXb9EZG\
-Lz4Gqa9euSEtLw9y\
-5c4O6YVJSEu644w5\
-rsW3ZVEUMXYTlRKQ\
-pnM9jWpX96fp7cwC\
-1w9S0/QB2Asiyfim\
-ljoapDVafABgHQAH\
-OCcBdunQJem3Hhg0\
-bYvz48RgwYIDH/cs\
-46o+IXHwenj58+HC\
-kp6djwYIFKCkJfGu\
-g7t27o2lT04jyUwC\
-mBXxBGyildgPYDWC\
-l9TURSQNQB0BVw1e\
-1sq8Uw5+phteT4Px\
-3Ocq+Tnn4cr1+XCk\
-VdUMPlVI7ROQtGOZ\
-VDRo0KOhANXjwYHT\
-q1AmXXHKJx61hNIG\
-KGRVRgjIt9OmpO6Z\
-p06a44IILAAA33HA\
-DZs+eHfANNUPS31Z\
-KhW/cs5+UUjkAciL\
-djghymwDcsmVLbNu\
-2LaCLpaWllS+Z1at\
-XL4+BSjP8PuoCuSd\
-8RkVkL58yqiuvvLL\
-87/fdd1/AzynatGm\
-Dzp07W4v9HpJO4aO\
-UyoRhvUUPq4n4rF+\
-/fuXPJy+99FKP9Ro\
-1amQtCmxP+whgoCK\
-yl0/PqBo2bFj+91a\
-tWpkClz80b3DzlVL\
-fBHQxCifTM8RevXo\
-FNBIyJSUFAwcOLD9\
-OS0vzOHHZsmIJ4Hx\
-+FxMYqIjs5VOgqle\
-vnul4+PDhft+oVq1\
-auv2NmE3FgLIRmeU\
-ZTWpqqm7F+wrdcss\
-tqFOnjqmsfv36bvV\
-SUlKQnp5ubQMzKqI\
-EZZqbohkSDMA9ULV\
-r185rt43Orbfeap3\
-UulMp5XFdP4o6pqx\
-qwIABfs27S05OxuD\
-Bg93KTz/9dLeyJk2\
-aWLuXf/f5RlGAgYr\
-IXqZBAjVr1tRWqlu\
-3rlvZ/fff7/NNkpK\
-S0L9/f2tx2Iakky0\
-+BJDnOmjUqJFfXcB\
-XXXWVdssRXRavqbf\
-T5xtFAQYqInuZ5ue\
-kpaVpK9WoUcOtrEO\
-HDj7v/dS9e3frCt8\
-OAB/52kiKvLJlmSY\
-by3r27Onz+UOHDtW\
-W5+bmupVpAlVgQww\
-jhIGKyF6mYeGeAlV\
-eXp623NesysOQ9Eh\
-NYqXAmZ4pXnLJJbr\
-5Tm6uv/56tG/fXvv\
-aiRMn3MoYqIjI6Ij\
-xoHZt/SIMujcTAOj\
-cuTNuv/12rzdo2bI\
-lh6THCaXUj3BOjAb\
-g3F3Zyxb3AJyDJca\
-OHevxdR8zqu3+tDP\
-SGKiI7GUaSaUZEgw\
-AyMnxPN919OjROO+\
-88zy+3qFDB2vRdKX\
-Utz63kKKNafmpyy6\
-7zGvlZ5991mOmLiL\
-abJ0ZFREZmba7bd+\
-+vXbk34YNG6xF5RO\
-FK1eujNdff91t2LG\
-LZbkkAHD/CE2xxLQ\
-IbqdOnTxWvPnmm3H\
-55Zd7fP3gwYNuy3E\
-ppXQ/MwxURImqbI2\
-7Ha7jqlWrol27dm7\
-1fvjhB2vRDuPB6ae\
-fjldffVU7XHnz5s3\
-WoiEiMkNEvPcZUVQ\
-RkTQRuQ/ADGP5vn3\
-7tPXPO+88PP3009Z\
-i04rGuuWT2rRpg5S\
-UFGPR9mhcB9EbBio\
-i+31vPNB01WH9+vU\
-oLjatttQawHhjQad\
-OnfDII4+4nZuZmYm\
-dO3daizMAfCciL4t\
-I24BaTWEjIiPgzGr\
-esL62YsUKt/qNGzf\
-GlClTdKtO/MV4kJm\
-Z6XauJgNzS+ejHQM\
-Vkf3WGg8uvvhitwo\
-OhwNffPGFtbgpLJ+\
-u77nnHlx11VWmSnl\
-5eRgyZAgOHTqku/f\
-DADaIyPMi0sL/plM\
-oici9IrIZwEtwriB\
-v8tZbb7ltpFijRg1\
-MnTrVbZI4gAdgCFQ\
-lJSX46quv3O7ZvXt\
-3a9G8gBofQQxURPY\
-zfST+//buPbqq8k7\
-j+POaCypBIpBAo0F\
-UgpbK0mop8cYKhFt\
-WoDa1UKkOxbtgGUH\
-bcYBRsZRVWNYiM7G\
-MrQjeiuAoqDiEqOO\
-SuhZBBhhkVQVpuDi\
-UIAhIOpCEJL/5Yyf\
-xXPbJBUjOTvh+1tr\
-r5Ozz7rPfoCfP2Xu\
-/+/fm5OT4Xm96/vn\
-nI1fdUrdt2HWup55\
-6Kur+mtLSUuXl5am\
-4OOw6fKh/lvRXM5t\
-lZj1jNULbMLO7zew\
-TSQsl9Yt8fe/evZo\
-2bZrmzZsXtj4tLU1\
-LlixRVlZW5CZPSAo\
-73N6wYYO+/vrrsEb\
-du3fXlVdeGbltuxs\
-hSlABp5lz7mNJn9c\
-/T0xMVEFBQVS7zZs\
-3a+PGjZGrZ0maELo\
-iOTlZ8+fP19SpU8P\
-K4Bw+fFiTJk3SpEm\
-TtGPHDvlwkh6TF1g\
-zOMJqW2aWaGb3m9k\
-OedPQfzuyTXl5ueb\
-Nm6fhw4dHTaDZv39\
-/rVixwm8E6IuSUiQ\
-1DCmtrq7W7Nmzo/q\
-Qk5MTWaniM+ec/01\
-8AUZQAa3j30KfxCo\
-4OmPGDFVVhc1f10P\
-eDLBTI9tOmTJFCxY\
-siLwwruLiYuXl5em\
-hhx7Snj17/HbTWdI\
-ceYG10MwGt+QXQcu\
-YWaaZPSzpfyUVypv\
-dOExNTY1eeOEFDRk\
-yRH/4wx9UWVkZ9vq\
-wYcO0bNmysCr7dd6\
-SVCFpUujKZ555Rp9\
-9Fl2+7+abb45c9Up\
-Uo3aAoAJaR9jplb5\
-9++qaa66JarRjxw4\
-tWLAgcvVQSXdJiip\
-TkZ+fr5dffjnqekV\
-tba1WrlypYcOGaeb\
-MmSorK/Prk5N0n6Q\
-PzOwtM2v8zmK0iJl\
-938zmyxskMVdS1Cl\
-XM9M777yjkSNH6vH\
-HH9fhw4ej3ueee+7\
-RwoULG+aYCrFcXuW\
-Tu0NX7tixQ4WFhVH\
-v893vftevJFe7O+0\
-nEVRAq6ibYTdsOni\
-/EXySdwF91apVkau\
-vkPdtfLpCKhdI3h+\
-g119/XZdddlnkNqq\
-pqdErr7yiIUOGaPb\
-s2frqq6+i2tQZLel\
-lM9tRd3qqU6yGaJy\
-Z/cDMlkpaL+9IOHr\
-O96oqLVu2TKNGjdJ\
-9992nnTt3Rr1PUlK\
-SnnjiCT388MN+hWX\
-/VdIASbeHrjx48KB\
-+/vOfRx6VS/Im5Iy\
-w1Dm3vQW/WmAQVED\
-rCfv2OmjQIA0fPjy\
-qUW1trR588MFYAyN\
-+I+lcSe+Grrzgggv\
-06quvxqy2XVVVpSV\
-Llmjw4MGaOXNmrGt\
-YkndaqlDS/5rZ42Y\
-WdeUd0cysi5nda2a\
-fSXpD3kCYKEeOHFF\
-hYaFuvPFGzZgxI+Z\
-/h27duumll17Sj37\
-0I7+X35M3wi/sGtf\
-+/fs1fvx4ff7551E\
-bXHbZZX6j/drl0ZR\
-EUAGtxjn3tiIqmk+\
-fPt23UkVNTY2mTJm\
-iJUuW+L1Vd0nDIld\
-27txZCxcu1OLFi/1\
-GhUmSKioq9Morr2j\
-UqFG6/fbbfW8IrdN\
-D0qOS/sfMdprZ02Y\
-2qpFf74xjZt3qjj7\
-flXRUXuXz6MNaSbt\
-379ajjz6qG264QfP\
-nz9fBgwf9mikxMVE\
-TJkxQcXGxvve978X\
-addSNUHv37tUtt9y\
-i0lL/kn2TJ0+OnH/\
-qU+dcuxuWXo+gAlp\
-X2KCKiy66SHfccYd\
-vw/qRW3fccUfMP2x\
-+Bg8erLfffluzZ8+\
-OWXbJzLR27VpNnDh\
-ReXl5Wr58ue/pojp\
-9JE2WtNrMvjaz183\
-sdjPzn+O8AzOzXDN\
-7pG5o+Vfyjj5j1jD\
-auHGj7rvvPg0bNkw\
-vv/yyjh+PXQBixIg\
-RWrNmjR577LGYxYs\
-jVVdXa9GiRcrPz48\
-1cEYjRozQ6NGjI1e\
-367nKXNNNvmFmd0h\
-aVP980aJFvjNMhho\
-0aJBKSkpCV5U452I\
-XswI6GDObJul39c+\
-rq6s1fvx4bdq0KeY\
-2nTt31m233aY777z\
-Td5LFWMrLy/X0009\
-ryZIlOnHiRKNtu3f\
-vrltvvVW33XZbS/b\
-xqaTV8ibe2yZpW3u\
-a0jwWM3PyBj8MkXS\
-dvDCKGk7up6amRsX\
-FxVq0aJE2b97cZPu\
-rrrpK06dPb+wIytf\
-atWv161//Wn/9a+w\
-yfRkZGVq1apW6du0\
-auvo951zUEXl7QlA\
-BrczMUuWNBGs43Nm\
-/f7/GjBnT2GAHSV6\
-twDFjxmjo0KG64YY\
-b/EaC+friiy80d+5\
-cFRUVNdk2OTlZ+fn\
-5GjVqlK6//vrI6e2\
-b42t5VeO3ywuv+sd\
-D8k6RHXHOVcbevPW\
-ZWZqkC+VV/8is+7l\
-3yGOflr7ntm3bVFx\
-crNdee01ffPFFk+0\
-zMzP1y1/+Uvn5+c1\
-6/9raWm3atEnFxcV\
-65513Yh5B1UtISNC\
-f/vQnvwD8vnNug98\
-27QVBBbSBuuKjYXX\
-dSkpKNGHChKhq17E\
-kJSUpOztbeXl5Gjl\
-yZMypHkJt2LBBc+b\
-M0datW5u1j06dOun\
-aa69Vbm6uhg4dql6\
-9ejVru2aolFfl/ai\
-8YKtfjoasOyrphLy\
-/S2fVPYYuZ0U8KuL\
-1hJDXe8kLoPpQOuX\
-TlmamzZs3q7i4WGv\
-WrGkyOOp17dpV999\
-/vyZMmNDkpIi1tbX\
-asGGDVq1apeLi4ha\
-dAp42bZrfxJvTnHN\
-PNftNAoqgAtqImf1\
-GXmmjBitWrNDDDz/\
-c7LCql5iYqOuvv16\
-jR4/W8OHDfae2D9m\
-v3njjDT355JMxK3P\
-H0r9/f+Xm5io3N1d\
-XXHFF5AX6Ds3MVFp\
-aqo0bN2rTpk364IM\
-P9OWXXzZ7+06dOmn\
-ChAmaNGlS5Km4qP1\
-s3rxZq1at0urVq1u\
-0j3qTJ0/2u/3hJef\
-cP7T4zQKIoALakJm\
-9KunHoevWrFmjBx5\
-4oMlrSrEkJydr8OD\
-BGjdunIYMGeJ3D44\
-kqbKyUosXL9bChQt\
-9J9drSnp6uq644gp\
-dfPHFuuSSSxoe09L\
-STqrfQVJbW6uDBw9\
-q586d2rRpU8PS2AS\
-Xjbnpppv0i1/8Qhk\
-ZGTHb7N27V8uWLdO\
-KFSta/AWiXkJCgmb\
-NmuU3K/QeSZc656p\
-9Nmt3CCqgDZlZgqT\
-/khRWxmjt2rWaNGm\
-SKioqTun9MzIy9JO\
-f/ETjxo1Tenq6b5v\
-9+/drypQpfnUGT0p\
-KSkpUeGVmZuq8885\
-TSkqKunTpElX2qa0\
-dOnRI+/bti7mUlZV\
-FTrtyUs4991zNmTM\
-nqohwvZqaGr3//vt\
-aunSp1q5dq9ra2pP\
-e19lnn60FCxZo2LC\
-ocRJfShrnnIue86O\
-dIqiANmZmF0l6QRF\
-htXXrVj300EONjup\
-qroSEBA0fPlw//el\
-Pdd1110WdsqupqdH\
-cuXP13HPPnfK+miM\
-pKUkpKSkNwVW/hD5\
-PSUlRQkKCzEySd0q\
-strZWZtawSIpaF7n\
-U1NTowIEDYSEUWUu\
-vNVx44YV67rnndOm\
-lUaX9tH//fi1fvlz\
-Lli3Tvn37TnlfWVl\
-Zmjt3rl/B2i8lTXD\
-OrTnlnQRI9J2HAFq\
-Vc263md0sr1JAw9f\
-hAQMG6K233tKTTz6\
-pxYsXn9K37ZqaGhU\
-VFamoqEi9e/dWdna\
-2rrzySl111VXKysp\
-SQkKCZs6cqUOHDmn\
-lypWn4bdq3IkTJ3T\
-48GHf2nYdQXp6ul5\
-88UX17t1bknT06FF\
-t2bJFH3/8sTZu3Kg\
-PP/ywxdch/aSlpWn\
-q1KkaO3as3+zPG+W\
-F1CenvKOAIaiAOHD\
-OHTSzH0haIalhZsR\
-OnTppxowZGj58uB5\
-55BHf8jgttWfPHu3\
-Zs0fLly+X5J2eGjB\
-ggPr06dOiUWWILTU\
-1Vb///e9VVVWlLVu\
-2aPfu3Q1HgKfDOee\
-cozvvvFP33ntvrFs\
-U1ki6xTl3chfVAo6\
-gAuLEOXdc0igze0b\
-SPaGvDRw4UKtXr9Y\
-HH3ygZ599VuvWrTt\
-t+z127JjWr1+v9ev\
-Xn7b3PNNt375d27e\
-f/nqvSUlJKigo0NS\
-pU9WzZ8z5L591zt0\
-d68WOgKAC4sw5d6+\
-ZbZU3Z9R5IeuVk5O\
-jnJwcffLJJ3r++ed\
-VVFR0UiP20L706NF\
-D48eP16233trYqMp\
-tkuY7555pw67FBbX\
-+gABwztVPsPeC3+v\
-9+/fXvHnz9NFHH6m\
-wsFAjRoxQcnJy23Y\
-Sre473/mOfvvb3+r\
-DDz/U1KlTY4XUPkk\
-POOcuPxNCSuKICgi\
-MujmsfmZmH0qaJp9\
-ac506dVJeXp7y8vJ\
-UXl6uoqIivfnmmyo\
-pKTmlwReIn27dumn\
-kyJEqKCjwnVwzwiO\
-Snqw7bXzGIKiAgHH\
-O/VHSH81smKTxknz\
-LrXfp0kVjx47V2LF\
-jdeDAAb399tt6880\
-3tWXLljbtL1ru/PP\
-P18iRI5Wfn69Bgwb\
-5jeALdUhe9fOlzrl\
-Tv3ehHSKogIByzr0\
-r6V0zmysvsH4m6RK\
-/tmlpaZo4caImTpy\
-ogwcPqqSkROvWrVN\
-JSYl27drVhr2GH+e\
-c+vXrp+zsbOXm5io\
-7O7upcJKkHfIC6jn\
-n3KndCd7OEVRAwDn\
-nPpf0K0m/MrOB8kJ\
-rnKQL/Nr36NFDo0e\
-PbpiTqKysTOvWrWs\
-Irr1797ZV189offv\
-2VXZ2trKzszVo0KC\
-Yc4X5eF3e0dN/tGL\
-32hWCCmhH6qZr2CD\
-pQTPLlRdaBQqZQiR\
-Sr169VFBQoIKCAkn\
-eFCDr1q3T1q1btW3\
-bNm3fvl3l5eVt0f0\
-OqUuXLsrKylK/fv2\
-UlZWlrKwsXX755S2\
-aR0zeCL4l8gKq3c/\
-vdboRVEA75Zx7T9J\
-7ku4ysx/KC61ceVP\
-Xx5SZmanMzEyNGze\
-uYd3f/vY3bdu2LWw\
-pLS096UK5HVFKSkp\
-DENUv/fr1a+z+pqZ\
-sk/S8pOVn6rWn5iK\
-ogA7AObdS0kpJMrN\
-seTPVDpE0SCH3ZsW\
-SkZGhjIwMDRkypGF\
-ddXW1du7cqd27d6u\
-srKxhqa+fV1ZWdsp\
-FdIMiMTFRaWlpSkt\
-LU3p6unr06KH09HS\
-lp6frggsuUFZWlr7\
-1rW+d6m4OSCqR9L6\
-kt5xzO06542cIggr\
-oYJxzJfL+IP5Gksz\
-sRklD9U1wNWsSwcT\
-ExIYjh1iOHDnSEFx\
-HjhxRZWWljh8/roq\
-KCh0/flyVlZUNP1d\
-UVDTr9cZq4iUmJio\
-pKSlqSU5Obta61NR\
-Upaenh4VSWlqaUlN\
-TW2OurYPyTtO+L+l\
-959x/n+4dnCkIKqC\
-Dc879WdKfJT1uZmf\
-JC6xrJA2oWy6RFHv\
-mxUakpqYqNTVV3/5\
-21C1fJ+3EiROqqKh\
-QVVWVEhISwgInoL6\
-WtEvSX0IXjphOH4I\
-KOIM452rlXdd6L3S\
-9mfXXN8E1QN7NxrE\
-PpVpRgEOpXNJOSZ8\
-oPJBOf5E/hCGoAKh\
-uaohPJC2rX2dmneW\
-Vdeojbyh8ps/jOW3\
-d11a0R1KZvBJFoY+\
-7JO12zn0Wv66d2Qg\
-qAL6cc/8n6eO6xZe\
-ZdZMXWBfKGyJ/Tsh\
-ybt1S//PZdT93Dll\
-3Tt360HaN3QlbJam\
-67rGy7vFEyPP6n2O\
-9fljhQbRP0j7n3Ff\
-N/GdBHBBUAE6ac+6\
-QvBI/p61uk5klywu\
-tTvJC5oSkKudc1en\
-aB9oXggpAoNQFEqG\
-EBkzzAQAINIIKABB\
-oBBUAINAIKgBAoBF\
-UAIBAI6gAAIFGUAE\
-AAo2gAgAEGkEFAAg\
-0ggoAEGgEFQAg0Ag\
-qAECgEVQAgEAjqAA\
-AgUZQAQACjaACAAQ\
-aQQUACDSCCgAQaFF\
-T0ZtZT0nntuZOzez\
-iRl7e45yrac39AwD\
-aj4agMrN/kTRNUrd\
-W3me2pNLGGpjZdkn\
-znXP/3sp9AQAEXKL\
-UEFKz49yXUP0kLTQ\
-zEVYAcGY7y8yuVbB\
-CKtS0eHcAABBfiZL\
-Gh64oKyvTsWPHmrX\
-xsWPHlJmZ2Wibrl2\
-7qrS00TN9YXr37q3\
-ExIYzkv3MLIFrVgB\
-wBjOzNyzEmDFjTFL\
-clrKyMovQsw3+GQA\
-AAcXwdABAoBFUAIB\
-AI6gAAIFGUAEAAi1\
-R0u7QFX379tU111w\
-Tp+4odMRfvRPx6Ac\
-AIBicmf2jpAXx7kg\
-M+51zveLdCQBA/Jw\
-laamk8nh3JIb58e4\
-AACAAzOyHZnY08ga\
-mOPtdvP9dAADx5+p\
-/MLM0eVUqBkvqE68\
-OSdolaalz7rU49gE\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAADaeAT\
-AAAADdUlEQVQAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAAAAAAA\
-AAAAAAAAAAACtw8W\
-7A0BLmVmKpJSI1Ye\
-cc1Xx6A+Ak2dmaZI\
-SQlbVOue+jFd/gFN\
-iZlPNbLfF9rmZTY5\
-3PwE0zcymm9mXMT7\
-LB8xsRrz7CLRIXUg\
-1F2EFBJiZzW/mZ3l\
-JvPsKNJs1fiQV6fN\
-49xeAPzP7cQs+y2Z\
-mdyfGu9NAU8xsnKT\
-e9c///ve/q7y8PKx\
-N9+7dlZycXP+0r5m\
-lOecOtF0vATTT+NA\
-nBw4cUHV1dcPzhIQ\
-Epaenx2wPBJKZ/VP\
-o16t58+aZpLDlo48\
-+ivwWNjC+vQbgx8w\
-2hn5Qr7766rDP8sU\
-XXxz5WS49K859BgC\
-gUQQVACDQCCoAQKA\
-RVACAQCOoAACBRlA\
-BAAKN+6jQURWaWbz\
-7AOA0IKjQUX0/3h0\
-AcHpw6g8AEGgEFQA\
-g0Dj1hw5h1qxZOnC\
-A0n5Ae1NRUdFkG4I\
-KHcLOnTv16aefxrs\
-bAFro8ssvb7INp/4\
-AAIFGUAEAAo2gAgA\
-EGkEFAAg0ggoAEGg\
-EFQAg0AgqAECgcR8\
-VOoS77rpL559/fry\
-7AaCFnnrqqSbbEFT\
-oEG688UYNHDgw3t0\
-A0EKFhYVNtuHUHwA\
-g0AgqAECgceoPHdX\
-t8e4AAF9TJF3dkg0\
-IKnRUf3HObYh3JwC\
-EM7MpLd2GU38AgEA\
-jqAAAgUZQAQACjaA\
-CAAQaQQUACDRG/aE\
-92BX6pG/fvrrpppv\
-CGqSmpkZuc6R1uwT\
-gJO1SyPD0nJwcZWZ\
-mNrzYs2dPv/ZAsJn\
-Z1dYyVWaWFO9+A4h\
-mZlNa+HmeHu8+A81\
-iZv/Zgv+x58W7vwD\
-8mVkPM/u6mZ/lGjP\
-rE+8+A81S9z93c8K\
-KkAICzsxuakZY1Zj\
-ZrZLk4t1hoCXMbJC\
-k8ZIuinhpt6Slzrn\
-1bd8rAC1lZj3kfZY\
-vVfjneb+++TzvkqT\
-/BzhkXkXcOGalAAA\
-AAElFTkSuQmCC\x22/>\
-\x0a    </defs>\x0a</s\
-vg>\x0a\
-\x00\x00\xb4\xc4\
-<\
-?xml version=\x221.\
-0\x22 encoding=\x22UTF\
--8\x22 standalone=\x22\
-no\x22?>\x0a<!DOCTYPE \
-svg PUBLIC \x22-//W\
-3C//DTD SVG 1.1/\
-/EN\x22 \x22http://www\
-.w3.org/Graphics\
-/SVG/1.1/DTD/svg\
-11.dtd\x22>\x0a<svg wi\
-dth=\x22100%\x22 heigh\
-t=\x22100%\x22 viewBox\
-=\x220 0 958 814\x22 v\
-ersion=\x221.1\x22 xml\
-ns=\x22http://www.w\
-3.org/2000/svg\x22 \
-xmlns:xlink=\x22htt\
-p://www.w3.org/1\
-999/xlink\x22 xml:s\
-pace=\x22preserve\x22 \
-xmlns:serif=\x22htt\
-p://www.serif.co\
-m/\x22 style=\x22fill-\
-rule:evenodd;cli\
-p-rule:evenodd;s\
-troke-linejoin:r\
-ound;stroke-mite\
-rlimit:2;\x22>\x0a    \
-<use id=\x22layer1\x22\
- xlink:href=\x22#_I\
-mage1\x22 x=\x22324.81\
-1\x22 y=\x22105.903\x22 w\
-idth=\x22309px\x22 hei\
-ght=\x22603px\x22/>\x0a  \
-  <defs>\x0a       \
- <image id=\x22_Ima\
-ge1\x22 width=\x22309p\
-x\x22 height=\x22603px\
-\x22 xlink:href=\x22da\
-ta:image/png;bas\
-e64,iVBORw0KGgoA\
-AAANSUhEUgAAATUA\
-AAJbCAYAAACFCQOz\
-AAAACXBIWXMAAA7E\
-AAAOxAGVKw4bAAAg\
-AElEQVR4nOydd3gU\
-VffHvzehJdTQQnkp\
-Cq9SFEWlCIqUSFHQ\
-F0GQLiAK6k8U8UVQ\
-QbCBIKiACgjkpamI\
-gIBAKCJBkIAUqdKR\
-ACEmQIAkhEByfn9s\
-cWZyN9kyszO7ez7P\
-sw+5Z+7cOSS73z23\
-nSvABA1EFAGguv1V\
-CUBpAKUUL2W5BIAw\
-ALmKF0nKeR7jpi2/\
-umEAhOblrS3M3u4N\
-ABkA0u3/uvr5KoDz\
-AM4BOCeEyHDhOxOg\
-CLMdYDyDiBoAqA2g\
-Jv4RsOr2cjnTHAtc\
-0mAXOPvrrOLn0wCO\
-CCFumuYd4zEsahaF\
-iKIB3AOggf3ffwO4\
-G0CkmX6FIDcB7AVw\
-BMBuAHsA7BZCXDXV\
-K8YlLGoWgYiaAWgJ\
-4CEAdQDcZqpDTEHs\
-h03o9thfCUKIS+a6\
-xAAsaqZBRC0APAKg\
-DYB6ACr40t6tW7eQ\
-lJSE8+fP4/z580hN\
-TcW1a9dw7do1pKen\
-Iz09XfVzZmYmcnNz\
-ERYWBiGEy3+1uGvL\
-z05EeV65ubl5ruXm\
-5oKIVHaHTfkCgCJF\
-iiAiIgLFixdHREQE\
-IiMjnS+lvUSJEoiO\
-jkZ0dDQqVaqE6Oho\
-FC1a1KvfuYTfAKwE\
-sEIIcVCvRhnPYFHz\
-E0RUHUBnAE/BJmLl\
-PW0jMzMTR44cwZEj\
-R3D69GmngJ0/fx4p\
-KSlOYWA8o0yZMk6B\
-q1y5slP0br/9dtSr\
-Vw/Fixf3ptkDANbD\
-JnC/6Oowky8sagZC\
-RPVhE7InADTy5N7E\
-xEQcOXIEhw8fxp9/\
-/onDhw8jMTGRhcvP\
-CCFQvXp13HXXXahX\
-rx7q16+P+vXro2zZ\
-sp40cwHABgArhRCL\
-jfGUccCipjNE1BhA\
-FwAdYBvYL5CcnBwc\
-PnwYCQkJSEhIwO+/\
-/44rV64Y6ifjG5Uq\
-VUL9+vVRr1493Hvv\
-vWjatCmKFSvmzq2X\
-ABwCsAnAJiHEJkMd\
-DUFY1HSAiKoA6AGg\
-L2yzlfmSk5ODAwcO\
-qEQsPT3dcD8Z44iI\
-iEDz5s3Rpk0btGnT\
-BuXKub26JgU2kVsP\
-WyS3zzAnQwQWNR8g\
-oicAvAbbrGW+ZGRk\
-4JdffsG6devwyy+/\
-sIgFMWFhYbjnnnsQ\
-ExODmJgY1K5d25Pb\
-dwKYCeAbXhjsHSxq\
-HkJEdWCLynrCtgjW\
-JZcuXcKGDRuwbt06\
-bN26FdnZ2X7xkbEW\
-NWrUQJs2bRATE4P7\
-7rsPhQsXdue2DAAL\
-YRO3Xwx1MMhgUXMT\
-d6Oyy5cvY8WKFVi7\
-di127dqFnJwcv/jH\
-BAYRERG4//770bRp\
-Uzz44IO4++67ER4e\
-XtBtuwBME0LEGu9h\
-4MOiVgBE1BXAUNgW\
-xUrJzc3Fr7/+isWL\
-F2PDhg24eZN31TDu\
-UaJECTRu3Bht2rRB\
-p06dClo+shXARCHE\
-j35yLyBhUXMBEfWA\
-LTJzuRTj/Pnz+P77\
-77FkyRKcP3/ef84x\
-QUlkZCQ6duyI7t27\
-4957782v6iYAU4QQ\
-K/3kWkDBoqaBiAYB\
-eBkuZjFzc3OxYcMG\
-LFq0CFu3buV1Y4wh\
-1KlTB927d0fnzp1R\
-smRJV9U+BjBJCJHi\
-R9csD4uaHSJ6EsCb\
-AJrKrt+8eRNLly7F\
-rFmzcOrUKf86x4Qs\
-JUqUwJAhQ9C/f39X\
-27muAegrhFjuZ9cs\
-C4saACIaBuAT2bWM\
-jAwsWrQIc+fORXJy\
-sp89YxgbVatWxfDh\
-w9GpUydXe2o/EkKM\
-8rdfViSkRY2IOsE2\
-btZKe+3ixYuIjY3F\
-ggULcPWq51lmSpUq\
-hQoVKqB8+fIoXbo0\
-Ll68iKSkJCQnJ/OM\
-aIgQHh6O8uXLO/eS\
-Fi5cGKmpqc6XN++r\
-Bg0aYNSoUWjUSDrU\
-uw7AQCHEWV99D2RC\
-VtSI6HkAM7T2nJwc\
-fPXVV/jiiy+QlZXl\
-dnulSpVC69at0a5d\
-Ozz00EOIjJSnPcvN\
-zUVKSgp++OEHfPrp\
-pyxwQcgLL7yAfv36\
-oXz58vku1zh58iQ2\
-btyIjRs3Yvfu3R69\
-Fzp16oT3338fJUqU\
-0F7Khq07+p1XzgcB\
-ISdqRFQSwGwAT2uv\
-nTp1CsOHD8fevXvd\
-bq958+Z47rnn0KxZ\
-MxQqVMgjX15//XUs\
-X85DIcHGL7/8gmrV\
-qnl0z+XLlzF//nzE\
-xsa6ve+3evXqmDp1\
-Ku666y7Z5QlCiDc9\
-ciJICCu4SvBARF0A\
-nIBG0IgI8+bNQ8eO\
-Hd0WtIYNG2LhwoWY\
-N28eWrRo4bGgAXD1\
-ZmQCHEn0VCBRUVF4\
-5ZVXsGXLFgwfPhxR\
-UVEF3nPmzBl07doV\
-8+bNk10eQUQbiaim\
-x84EOCETqRHRcAAT\
-tfakpCT897//xbZt\
-29xqp27duhg2bBha\
-t25dUNU/YUs5cwHA\
-ZQAVAVQD0NhR4cMP\
-P8Ts2bPd+w8wAcOO\
-HTuUG9pzAfwE25kH\
-NwFEK151XLWRmZmJ\
-efPmYfr06cjMzCzw\
-me3atcOECRNkyz9y\
-YeuOLvT4PxKghESk\
-RkSfQyJoy5YtQ4cO\
-HdwStJIlS+KDDz7A\
-ypUr8xO0LbCtcasi\
-hKgrhGglhOghhHhR\
-CNEVtv18Ts6eDenx\
-3KBl3z5Voo0wAPOF\
-EEOEEK8IIboLIVoK\
-IeoCaAHb+/J3bRuR\
-kZEYPHgw1q9fj8ce\
-e6zAZ8bFxaFTp07a\
-Zzuev4CI8rz/g5Wg\
-FjUiqkBEawD8n9Ke\
-nZ2NESNGYPjw4bh2\
-7VqB7bRv3x7r1q3D\
-M88842o6fTKA+kKI\
-FkKI6UKIJBdN3a/w\
-Db//nue9zAQBv/32\
-m9bURlZPCLFFCPFf\
-IUQj2NJW5fl2rVSp\
-EqZOnYr//e9/uP32\
-2/N9bmJiIrp164Y5\
-c+bILg8nonj7jH9Q\
-E7TdT/v42ZfQ5P6/\
-cOEChgwZIvtGy0N0\
-dDTGjRuHmJgYV1Vm\
-AJgthNjphj/dAXzr\
-KO/fvx//+c9/CvSB\
-CTzq1q2LVatWKU37\
-hBD3uHMvEfUE8CKA\
-5tprN2/exNdff43p\
-06fj+vXr+bYTExOD\
-jz/+GKVLl5ZdflYI\
-8T93/AlEgjJSI6JX\
-ACyBRtB27tyJJ598\
-skBBE0Kgd+/eWLdu\
-nStB2wTgCSHEYHcE\
-zc7rysLmzZvdvI0J\
-NP78809cvnxZaWpA\
-ROPduVcIsUgI8RCA\
-gQBUylW4cGEMGTIE\
-q1evLmhvKDZs2ICO\
-HTtiz549ssuxwdwd\
-DTpRI6I3AXymtc+f\
-Px+9e/dGampqvvdX\
-q1YN3333HcaOHSub\
-xboB27dca082ExPR\
-fCg2xmdmZmL+/Pnu\
-3s4EGESEn376SWse\
-QUQvu9uGEGIOgFoA\
-Ptdeq169OhYvXoyX\
-X34533Vw58+fR/fu\
-3TFz5kznqVsKhhPR\
-FHf9CSSCqvtJRGMB\
-jFbasrOz8c4772DJ\
-kiUF3t+2bVtMmDAB\
-pUqVkl3+GsC7Qohz\
-HvhTFcD/oBlTmTp1\
-Kj799FN3m2ECkGLF\
-iuH7779HvXr1tJc+\
-EEK87UlbRNQOtvd1\
-M+21Xbt24fXXX0di\
-YmK+bbRs2RKTJk2S\
-LRWZKoR4xRN/rE7Q\
-iJo9vB+htF27dg0D\
-Bw7Erl278r23UKFC\
-GDlyJJ599lnZ5TMA\
-hgkhfvDQn24A5gFQ\
-7ULetGkThgwZwjnX\
-QoBq1aph+fLlKFOm\
-jPbSDCHEYE/bc7VH\
-OT09He+++y6WLVuW\
-7/1VqlTBggULUKNG\
-De2lL4QQL3nqj1UJ\
-ClGzh9GvKm2XLl1C\
-v379cOjQoXzvrVq1\
-KqZOnYp77pGO404A\
-8LYQ4paH/nwAIM/m\
-Yha00KNRo0aYMWOG\
-bMB+HWzrxzzKkkBE\
-/4EtamuovbZ8+XKM\
-GjUKN27ccHl/dHQ0\
-5s+fj1q1amkveSW0\
-ViTgRY2IpsM2W+Qk\
-OTkZffr0wYkTJ/K9\
-N58ZopuwveG+ldyW\
-ny+FYIvOemivzZ07\
-F+PHj8etWx7pIxME\
-1KxZE19//TVuu+02\
-7aV02N5n+YdYEmQ9\
-EwD4448/MHjwYPz9\
-998u7y1fvjwWLFiA\
-f//739pLs4QQz3vq\
-i9UIaFEjoi8ADFHa\
-EhMT0adPn3zHGAoV\
-KoT//ve/GDhwoOzy\
-BgADhBD5D1Lk9eU/\
-sC2kVB3Gkp6ejhEj\
-RmDt2rWeNMcEGaVL\
-l8a0adPQrFmeYTEA\
-GCuEeNfTNu3LP6YB\
-UA2UJScn44UXXsD+\
-/ftd3hsVFYV58+bJ\
-xvzmCCGkH4xAIWBF\
-jYg+gi2po5Pjx4+j\
-b9+++eY9q1KlCj7/\
-/HM0bJgnegds+d//\
-64UvQwB8obUfPnwY\
-L730Ev766y9Pm2SC\
-kPDwcLz99tvo27ev\
-7PJcIcQAT9skoijY\
-1mN2V9qzsrIwYsQI\
-7Xo5FaVLl8b//vc/\
-3H13njO3A7orGpCi\
-RkSvA5iktB08eBD9\
-+vXTrg9S0bJlS3zy\
-ySeygVuv98cR0QQA\
-eYRwxYoVGDVqVIGL\
-JJnQo2PHjvjoo49k\
-6am+EUL09KZNIvoU\
-tgOCVEyfPh1TpkyR\
-LekAYNv+N3fuXNmX\
-/DtCiPe98cVsAk7U\
-iKgXgAVK26lTp9C1\
-a1ekpaW5vO/xxx/H\
-lClTZOt6NsHW3Tzt\
-hS/vA3hLacvJycFH\
-H32EuXPnetocE0LU\
-rl0b06dPlx10vEgI\
-0cubNonoDdjOLVAR\
-FxeH1157zeUEQmRk\
-JObMmSNLPNnV01l/\
-KxBQomY/R0CVgOzi\
-xYvo0qVLvmNo+Qja\
-JCHEG1768hYA1TfZ\
-pUuX8PLLLyMhIcGb\
-JpkQIzIyEpMmTUK7\
-du20lxYKIXp70yYR\
-PQ1gDgDVyvHffvsN\
-zz//vMuMH6VLl8aP\
-P/6ozQOXCdue5tPe\
-+GIWASNq9rxQmwFU\
-d9iuX7+OXr164Y8/\
-/nB5Xz6C5vX+N9l6\
-oaSkJDzzzDOceYPx\
-iPDwcHz66aeyTBwL\
-hBB9vGmTiO6AbRa+\
-idK+Z88eDBw40GUS\
-yjvvvBNLlizRdou3\
-CCFaeOOHWQTSNql5\
-UAhaTk4OXn311XwF\
-rWPHjq4ErasPgvYM\
-NIKWmpqK3r17s6Ax\
-HuN4H8fFxWkv9Sai\
-SbJ7CkIIcVQI0RS2\
-z4yThg0bYtGiRShf\
-vrz0viNHjuDNN/Mk\
-y32YiL70xg+zCAhR\
-s/9SH1baxo0bhw0b\
-Nri8p2PHjpg8ebJM\
-0Lp4O05ARJVgSwXu\
-5MqVK+jXrx9Onz7t\
-TZMMg5ycHLzyyiuy\
-9/PrRORVNxQAhBD9\
-YOuKOqlTpw6+++47\
-VKlSRXrPTz/9hJkz\
-Z2rNg4koYE6qsnz3\
-k4j6wrZ/0snMmTMx\
-YcIEl/d06tQJn3zy\
-iStBW+qDL98B6OYo\
-Z2Zmok+fPh6dacAw\
-rihcuDAWLVqE++67\
-T2kmALWEEF4fNktE\
-XwF4QWlLSkpC7969\
-pV/G4eHhmDNnDh56\
-6CHtpe5CiMXe+uEv\
-LC1qRFQLwHGlbdOm\
-TRg0aJDLKep8BO0p\
-b1ZuK3x5GcBUpe2V\
-V16RZWNgGK+pXLky\
-Vq1apV12tEkIUWD+\
-+PywZ39WJUs9d+4c\
-unbtKt19UKZMGSxf\
-vlw7cZAMm8Bm5LnB\
-Qli9+6kSkYsXL2LE\
-iBEuBa1du3ZGCdoT\
-Wl+WLVvGgsbojuPM\
-DA2tiOg9X9q1Z+JQ\
-jdFVrVoVs2fPlh7n\
-mJaWhiFDhmjXWUZD\
-kwXHilhW1Ox50Too\
-bSNGjMDFixel9atW\
-rYoJEybIBK2zL4Lm\
-eLSycO7cObz77rs+\
-NskwcjZu3Cg7kOdt\
-IursS7v25UsfKG31\
-6tXD9OnTpXnZDh8+\
-jHHjxmnN//XVD6Ox\
-pKgR0VMAPlLaFixY\
-gE2bNknrh4eHY/Lk\
-ybKTdDoLIXw6WJOI\
-RkCRxyo3Nxevv/46\
-0tPTfWmWYfLl448/\
-lo3VerWmUok9l5sq\
-iWqLFi3w0UcfSet/\
-//332LkzT3Ln12V1\
-rYIlRQ2AKtQ+fvy4\
-y186AAwePBgPPPCA\
-1vyMDoLWAIAqDfOM\
-GTNkf2SG0ZVbt25h\
-xIgR2qwuDxLRIF/b\
-FkK8Cs2saJcuXTBk\
-yJA8dYkI77zzjtaP\
-5kT0nK9+GIXlRI2I\
-RgJwpg64efMmXnvt\
-NWRlZUnr33PPPRg6\
-NM+Wt4lCiO90cEfV\
-7Tx27BhnrGX8xvHj\
-x2XLK2YSUZ6cQZ5i\
-z8ShWto0dOhQ6YlV\
-x44dw9dff601zyKi\
-/I+3MglLiZr9j/Wh\
-0jZ58mSXiR4jIyNl\
-i2v/8CbThsSXrgBU\
-m4vHjBnD+dAYvzJ9\
-+nTZFkCP0oHnQ18A\
-zvxEhQsXxvvvy/ew\
-T5s2Tba4/C1ZXbOx\
-lKgBUKU7OXLkiOwb\
-wsno0aNlqYnf1ckX\
-1V935cqVvKeT8TtZ\
-WVkYM2aM1tzX/qXr\
-E0KITGjG6Zo0aYKn\
-nnoqT93r169j7Nix\
-WvMAK04aWEbU7Ies\
-DlPaJkyYgNzcXGn9\
-Dh064Omnn9aah/s6\
-jmb3ZQSAOx3ljIyM\
-fMf0GMZINm/ejNWr\
-V2vNbh25VxBCiDho\
-xrBHjRolS8+Fn3/+\
-GevWrdOa80yPmo1l\
-RA3Aa8rC9u3bXZ6N\
-GR0dLQuTlwkh8hxK\
-4SmyyYHPP/8838ST\
-DGM077//PjIyVGte\
-a9kzxejBJwCca6Wi\
-oqJke0AB2LYnajJ9\
-3OXLVi4jsISo2UPY\
-Vooyxo93/UU0dOhQ\
-7TdJFgC3z1QsANV4\
-3LFjxzg3GmM6ycnJ\
-mDx5stb8vr2H4xNC\
-iCvQJJjs2rWrLNU3\
-kpKSMH36dK35tTwV\
-TcQSogbNL2X16tUu\
-86tHR0fL+vx9hRDn\
-fXXCPk6hStA3ZswY\
-5OTk+No0w/jM/Pnz\
-cfjwYa1ZF0GxZ33e\
-pChj8GB5Ru/58+fj\
-6tWrStN9RNRdWtkE\
-TBc1eyofZwaOW7du\
-YdIk1xlX+vfvj8KF\
-CytNvwohvtfJHdVq\
-61WrVvHkAGMZcnJy\
-MHr0aO02wVb2A1j0\
-QHVie/v27WUTccjI\
-yMDChXky31vmQGTT\
-RQ2A6hDVRYsW4cyZ\
-M9KKpUqVQs+eef5+\
-n8nqeop9W9YdjnJG\
-RgY+/PDDfO5gGP+z\
-e/duLFmyRGueSETF\
-fG1bCLEStkSsAGw7\
-dZ5/Xn5iXmxsrDY9\
-eDP7HmnTMVXUiKg2\
-AGd+k5s3b2LatGku\
-6/fq1QvFixdXmnYK\
-IfL8hb3w415otmV9\
-9tlnPDnAWJIJEyZo\
-z+OoAv3WjKmitS5d\
-uiA6OjpPpdTUVCxd\
-mieLlyXG1syO1FSH\
-/m7cuNHlhvWiRYvi\
-2Wef1ZqnSKp6w0hl\
-4ejRo4iNjdWpaYbR\
-l8uXL2PixIla89t6\
-REpCiB8B/OooFy5c\
-GAMGyE/umzVrlnbJ\
-VUsiau6rD75itqip\
-+pLff+96aKxLly7a\
-NMQHhRDf+OqAfYCz\
-m9LGkwOM1Vm8eLFs\
-w7tekZJqSKdnz54o\
-UaJEnkp//fWX7JDu\
-Hnkq+hnTRI2IOgCo\
-4ygnJydjy5Yt0rrh\
-4eEYNCjPPl69ojTV\
-wNmyZcuwY8cOnZpm\
-GGPIzc3F6NGjZZFS\
-P1/btg/pOGfIIiMj\
-0bJlS2ndGTNmaE0v\
-EVF1WV1/YWakplL0\
-pUuXuoyO2rdvj+rV\
-Vb+nswDm++qAffGi\
-c1PutWvX8l0fxzBW\
-4uDBg1iwYIHW/CkR\
-ldWheVUvqG3bttJK\
-Bw4cwLZt27RmU6M1\
-U0SNiEoBeEZpk8zo\
-OOnePc8SmE+EENk+\
-+tAJmv2dU6ZMQWpq\
-qi/NMoxfmTx5svY9\
-WwaaMWIvUW03bNmy\
-JYoUKSKtOG/ePK2p\
-iw7P9xqzIrUeAJyL\
-zXbu3OnyNKbIyEg0\
-btxYa/Z5LA2a8YfD\
-hw/LvvUYxtJcu3ZN\
-ti95uA5Zcv8C4Ewc\
-WLx4cTz44IPSuvHx\
-8dotXI2I6DZfnu8L\
-ZomaKvTKb4LgoYce\
-ki229WmtBRH1gGZb\
-1ujRo3lygAlIli9f\
-LlskrsekwSplwVUX\
-9MaNG/j555+15jzZ\
-JvyFWaJW3/EDEWH9\
-+vUuK951111a00pf\
-HkxEhQGoztf74Ycf\
-sHv3bl+aZRhTGT16\
-tDbX38NENNDHZlVn\
-e8TExCAsTC4Zkiwi\
-pnVB/S5qRHQ3gIqO\
-8rFjx7T7yFT861//\
-0pp2+ejCKADOc7+u\
-XLmS7xmiDBMIHD9+\
-HHPmzNGavyCiPB8g\
-dxFC7Adw0FEuX748\
-6tatK627efNmbfaO\
-xkRU09tn+4IZkVoz\
-ZaGgCElz7iAAnPb2\
-wfbJgXeVtk8++QSX\
-Ll3ytkmGsQxTp05F\
-UlKS0lQEgDyHkPuo\
-PqBRUVHSSlbqglpe\
-1KpUqaI1/eXDs1Xj\
-DAcOHMA33+gx58Aw\
-5pOZmYn33stzPOhL\
-RPS4D82qjk2TnRHq\
-wCpdUDNE7R5loSBR\
-00wS5AohvDokgIh6\
-QTI54CqzLsMEInFx\
-cYiPj9ea3/WhSdW0\
-Zn6iJumCNiGivGk+\
-DMavokZEFaAQtbS0\
-NJw6dSrfezQDk14p\
-EBFFAFBtlvvuu+/w\
-xx9/eNMcw1iaMWPG\
-aDNoPEBE8nQbBaMS\
-tYiICJcVs7KyZGfz\
-dvTyuV7j70hN1fXc\
-tavgMX+NqHm75mIU\
-gMqOQlpammxDMMME\
-BWfOnJFtX5rh5dF6\
-qu6nJktOHiTjak28\
-eKZP+FvUVKto3VlG\
-4WukZs9coDpSbOLE\
-idrULQwTVHz11Vey\
-vITe7DRwO1IDINtk\
-X19Wz0j8LWp3Kwvu\
-dP906H6qJgf27t2L\
-777T45xjhrEuN27c\
-wLvvvqs19/dip4Hb\
-Y2qALXOHJNV3SQ+f\
-6RP+FrWaysKRI0cK\
-vMGX7icR9QHQ0lHO\
-zc3FmDFjtOmQGSYo\
-2bx5M+Li4rRm+WnF\
-rnF79hOwTcDt27dP\
-a86zz9FI/CZq9sF6\
-5/aAS5cuubU+zNtI\
-zf7toDoy75tvvsGB\
-AwfcbYJhAp733ntP\
-OyNZj4j+66q+BI8i\
-NUDaA2vkwfN8xp+R\
-Wn0AwlE4evSoWzf5\
-0P0cCaCCo3Dp0iV8\
-8onPx4IyTECRlJSE\
-qVOnas0T7OfbuoNK\
-EYsVK/gohJCJ1KAZ\
-MPRS1NzqfhLRk9AM\
-ik6YMAFXrlxx65kM\
-E0zMmTMHx48f15r1\
-SE8kRSJqeQ8QNRB/\
-ippqZ/qxY8fcusnL\
-SE01ObB792788MMP\
-bt7KMMHFrVu3MHr0\
-aK35GSLqJqvvK3//\
-/bf20KI7iaiyq/p6\
-Y/lITQihLBY4wm9P\
-Z/yIo+zirESGCSkS\
-EhKwfPlyrXkCERmi\
-AZJxtQeMeI4Mf4pa\
-TWXBnUgtPDxca8q3\
-+2lPY/yp0rZgwQLZ\
-qdYME3J89NFHuHbt\
-mtJUE/odradi//79\
-WlNNI54jwy+iZp+J\
-dOYs+fvvv90a39JE\
-aUDB3c83YUtnDABI\
-SUnBlCl6nc/CMIFN\
-amoqJk+erDWPs2ev\
-cYVKI9zt8Zw/f15r\
-8tthLP6K1PSYJADy\
-ETX7osI3lLbx48dr\
-v5kYJqRZuHAhDh06\
-pDXnlyVXNd2p2VPq\
-EslZH3lPRDYIU0TN\
-3UkCTSZPQHGugQTV\
-2psdO3bIxhAYJqTJ\
-ycnBO++8o424WhFR\
-bxe3eCVqKSkpWlMl\
-d330FX+J2p3Kgrui\
-lpubqz03QCpqRPQ6\
-gKaO8q1btzBmzBjP\
-vWSYEMDFVsFJRCTb\
-rc6RmgtqKgsnT550\
-+8abN28qi3nO6LKP\
-B0xS2mbMmOF2F5dh\
-QpGJEyfi8uXLSlM0\
-bNlstHglapcvX9YG\
-JEG3pEOVJ/3ChQtu\
-31iQqEEzHnDy5ElM\
-mzbNE98YJuRIS0vD\
-xx9/rDWPsi9cV+KV\
-qOXm5mq3QVZwVVdv\
-/CVqKpX++++/3b4x\
-P1EjomehyWY7atQo\
-ZGf7dM4xw4QE33//\
-Pfbs2aM1aycNvBI1\
-IO+4GhH5ZVzNX6Lm\
-PGggLS3No1+MRtTC\
-iSgcAOwn1cxWXvzm\
-m2+wc+dOMAxTMESE\
-d955R9tNfMQeLDgo\
-qrzoScBg1ria4aJG\
-ROWhiLA8idIA6S/R\
-0dZYKPxPTk7mo+4Y\
-xkMOHz6M+fPna82f\
-21PvAz5EahJRC5pI\
-TXUclGZPWIFoIjUA\
-KEJE3QH0VRpHjx6N\
-9PR0bV2GYQpgypQp\
-2mCjJP7Z8O61qEmy\
-S5f1wj2P8YeoVVUW\
-9BA1AKpcKqtXr8aG\
-DRu88Y1hQp709HR8\
-+OGHWvNrRPQUfBA1\
-D9eZ6oblIzVJ93MY\
-FDMpV65cwdixY731\
-jWEYACtXrsRvv/2m\
-Nb8OfUWtkDe+eYrf\
-Rc3TMTXNWhpAc+L0\
-hx9+KOu7MwzjIWPG\
-jNH2jJoBqKU0XLx4\
-0e32NBMQQLCKmqeR\
-Wn4iuG3bNixZssQ7\
-rxiGUXHixAl8/fXX\
-WnMbZcGdc0UccKTm\
-AlcimJGRgVGjZAug\
-GYbxlunTp+PcuXNK\
-kzP/17lz5zyajONI\
-zQWuRPDtt99GYmKi\
-914xDJOH69evY9y4\
-cdJrnkRpQHBHahWV\
-BU/65IBcBJcsWYIV\
-K1b45hXDMFI2bNgg\
-TX/vqagFc6TmnD3J\
-zc2VLdHIl7/++ktV\
-PnHiBM92MozBjB49\
-Oo+IcaT2D85z6rOy\
-sjy++ejRozh9+jQA\
-2/KOoUOHas8xZBhG\
-Z7KysvDCCy84P3vX\
-rl3Djh07PGrDrEjN\
-Hw9xRmrebjR/8cUX\
-cccdd2D79u2y5HMM\
-wxhAYmIinnrqKfTs\
-2RN79+71eDw8KEXN\
-vvncuYrYk4V7So4c\
-OeJx6MswjO9cuXIF\
-X375pVf3Bmv3M0JZ\
-8Kb7yTBMYBKsEwVe\
-b7FgGCaw4UiNYZig\
-giM1hmGCimCN1FjU\
-GCZECdZIjbufDBOi\
-SBbaB0U+NY7UGCZE\
-CdZITSVqfMoTw4QO\
-wTqmxt1PhglRQiJS\
-4+4nw4QOLGoMwwQV\
-3P1kGCao4EiNYZig\
-giM1hmGCCo7UGIYJ\
-KoI1UmNRY5gQJVgj\
-NVX3k0WNYUIHjtQY\
-hgkqgjVSY1FjmBAl\
-WCO1osoC7/1kmNAh\
-WCM1UhaEEAY/jmEY\
-qxCskZpKqsPC/HHM\
-KMMwViBYIzXV/yo8\
-PNzgxzEMYxWCNVLL\
-VT2MIzWGCRlCIlJj\
-UWOY0EIjbEEhahyp\
-MUwIo+mCBoWocaTG\
-MCEMR2oMwwQVQR+p\
-8ewnw4QWHKkxDBNU\
-BH2kxqLGMKGFdlkH\
-ERkubNz9ZBjGMMxY\
-gOvX7ifv/WSY0MKM\
-BbgcqTEMYxhBH6nx\
-mBrDhBZBH6mxqDFM\
-aMGRGsMwQYUZkZrR\
-D+AxtSCiSJEiKF68\
-OEqUKIHixYsjMjIS\
-hQoVghAC4eHhCA8P\
-R1hYGMLCwqQ/h4eH\
-QwgBIQRu3ryJ7Oxs\
-3LhxA9nZ2c5XfuXc\
-3NyCnWQshRmRml9F\
-jSM18wkPD0f58uVR\
-sWJFVKxYERUqVEDF\
-ihURFRWF4sWLO18O\
-4VKWCxXyy9pJl9y4\
-cQKbWtgAACAASURB\
-VANpaWm4cuWK89/L\
-ly87y9praWlpuHTp\
-Eh+ibSLBGKlx99OP\
-FC5cGLfddhtq1KiB\
-6Ohop3Apxats2bIB\
-+3coWrQooqOjER0d\
-7dF9Fy9exLlz53D2\
-7FmcO3fO+XKUMzIy\
-DPKYCUZR4+6nARQv\
-Xhy1a9dGrVq1VP9W\
-q1aNf8cSypUrh3Ll\
-yqFBgwbS62lpaTh/\
-/jzOnj2LU6dO4eDB\
-g9i/fz8SExNBRNJ7\
-GPe4efOm1lTY6Gf6\
-NVLjxbeeEx0djSZN\
-muDee+91ilelSpX8\
-7UY2gGsA0u3/XlOU\
-b8H2d85RvHJd/Owo\
-E4AisJ02Vsz+b1E3\
-ypEAyuj9nytTpgzK\
-lCmDevXqqezXrl3D\
-oUOHcODAARw4cAAH\
-Dx7EqVOneGzPAzhS\
-Y1CpUiU0adIETZo0\
-QdOmTVGjRg09mycA\
-KQASASRpXhehFizn\
-SwhhmQNbiSgMQFnF\
-q5ymrH1VAFADXsz0\
-lyxZ0vm3cJCZmYnD\
-hw9j9+7diI+Px86d\
-O2XRCGMn6CcKWNTy\
-UrlyZZWIVa9e3Zfm\
-UgAcAnAMwBkA56EQ\
-LiHEBZ8dNhkhRC6A\
-VPvLbYioGoCasAmc\
-9t8asEWOBRIZGYn7\
-778f999/PwYNGoTM\
-zExs374d8fHx2Lx5\
-M86cOeOJW0FPMEZq\
-qm9HDtttH4rmzZuj\
-VatWaNasGapVq+ZN\
-M8cAnAZwWPkSQvyt\
-n6fBhRAiEbYIdYvs\
-OhFVhk3kmgK4H0Ad\
-AA1RQIQXGRmJ1q1b\
-o3Xr1gCAM2fOYPPm\
-zYiPj8f27duRmZmp\
-338iAAnGSE01iBaq\
-g66VK1dG69at0aZN\
-Gzz44IMoUsStoMDB\
-GQA7ASyGXciEENcM\
-cDOkEUI4ItrfHDYi\
-KgbgPthE7j4AdQHc\
-C9v4npTq1aujT58+\
-6NOnD27evImdO3c6\
-o7ijR48a+5+wIByp\
-BQlCCDRo0ABt2rRB\
-69atUbduXU9u/ws2\
-EdsM4BchxAFDnGQK\
-RAiRBWCb/QUAIKJw\
-2KK4HgBiADSR321b\
-YtOsWTM0a9YMb775\
-JpKTkxEfH4/4+Hhs\
-3boVV65cMfq/YDoc\
-qQUwERERaN68Odq0\
-aYNWrVqhQoUK7t56\
-GmoRO2iUj4zvCCFy\
-ABwE8DaAt4moPID2\
-9tdDsI3PSYmOjsbT\
-Tz+Np59+Gjk5Odiz\
-Zw9++uknrF27Fn//\
-HZwjB0EfqQWbqEVF\
-RaFdu3Z49NFH8eCD\
-D6JoUZe9Ei1bAawE\
-8BNHYoGNECIVwAL7\
-C0R0P9QiJyU8PBwP\
-PPAAHnjgAbzzzjv4\
-/fffnQKXmurRHIil\
-4UgtAChVqhQeffRR\
-dOzYEc2bN3d3Rvci\
-gJ8BrAKwUghx2VAn\
-GdMQQuwCsAvAB0RU\
-HP8I3MMA7pTdExYW\
-hsaNG6Nx48YYM2YM\
-duzYgVWrViEuLg6X\
-Ll3yn/MGEPSRWqCO\
-qUVGRiImJgYdO3ZE\
-ixYtULiwW4uiDwHY\
-AJuIbTDWQ8aKCCEy\
-APxgf4GI6sEmcE8A\
-qAfbGjoVYWFhaNq0\
-KZo2bYqxY8di+/bt\
-WL16NdauXYu0tDR/\
-uq8LwShqARupFStW\
-DK1atcLjjz+OVq1a\
-oVixYu7ctg22buVK\
-HhtjtAghDsH2ZTeZ\
-iARskw2DYBO4itr6\
-4eHhaN68OZo3b45x\
-48Zh69at+Omnn7B+\
-/fqAmWQIxu5nQEVq\
-hQsXxiOPPILHH38c\
-MTExiIyMdOe2eACx\
-AH4UQgR2X4HxG0II\
-ArAIwCL7CUs9AAwA\
-8Ag0wQBgE7gWLVqg\
-RYsW+OCDD/Drr79i\
-xYoVWLNmDbKzs/3r\
-vAcEfaRmVWrUqIGe\
-PXuia9euKFPGra2F\
-v8I2MPytECIwvjIZ\
-yyKEuAVgPoD5RBQB\
-oDuAZ2ETuDwUKlQI\
-LVu2RMuWLTF69Gh8\
-//33WLRokSV3M0h6\
-Z4ZrQshGauHh4WjV\
-qhV69+6Nhx56yJ3N\
-9r8B+AY2IUsx3kMm\
-FBFCXIct8o8lohIA\
-ugHoB6CFrH6ZMmUw\
-aNAgPPfcc9iyZQsW\
-LlyITZs2ySIkU5B8\
-5g3PexVyY2oVKlRA\
-t27d0KNHD1SuXLmg\
-6jtgW8n/nRDirPHe\
-Mcw/CCHSAcwBMIeI\
-SsMWwfWGbSZVW9fZ\
-PU1KSsI333yDxYsX\
-IyXF3O9fjtQMpGHD\
-hujfvz/atWtXUAbX\
-vfhHyE76xzuGyR/7\
-MMdMADOJqBxsY3DP\
-AbhHW7dy5coYNmwY\
-XnnlFcTFxWHhwoVI\
-SEjws8c2OFIzgOrV\
-q+PNN99Eu3bt8quW\
-A9uA/xQhxEr/eMYw\
-3iGEuAhgGoBpRNQJ\
-wGuwjb+pBKNQoUJ4\
-/PHH8fjjj+P48eP4\
-+uuv8cMPP5g9DGR4\
-pGa0apq2oyAsLAzD\
-hg3DunXr8hO0YwBG\
-AqglhGjNgsYEGkKI\
-lUKI1gBqARgF23s6\
-D7Vr18b48eOxatUq\
-tGghHZ4zBDMiNaMf\
-YEqkFhERgS+++AIv\
-vfSSq4WyWwA8JYS4\
-QwgxXgjxl18cYxiD\
-EEKcFkJ8JIS4A8BT\
-cJFi6c4778TcuXPx\
-1VdfubuI3CfMGFPz\
-a6Tmr7B36NChePTR\
-R2WX5gJoLIRoIYRY\
-5hdnGMbPCCGWCSFa\
-wDbeNh5Ant3yjz76\
-KN577z3DfQnGSM3v\
-ohYeHo7u3btrzQkA\
-OgohBgghdhruBMNY\
-ACHEPiHESPzTNVXh\
-QQIGrwnG2U+/dz+J\
-CCVKlFCa/hZCNDX8\
-wQxjUexLQz4iogqw\
-TSoAAP744w/Dny35\
-zAdXpOYPUcvNzcXl\
-y6okGBWJqKThD2YY\
-63O/smCSqAX8mJop\
-EwWHDx/WmlxmJ2WY\
-EOJuxw85OTmyz4nu\
-8JiaTki+gVjUmJCG\
-iBoAiHKUjxw5gqys\
-LH88V2viSM0b9u7d\
-qzU19suDGca6qD4D\
-+/bt88tDgzFSM0XU\
-JJHaXX55MMNYl0bK\
-gj/G01wQXJGav7h4\
-8SLOnlXtP7+diHQ9\
-6pxhAowGygJHagEI\
-j6sxjA17Esr7HOXr\
-16/j2DHpbiojnq01\
-BXykZhqScTUWNSZU\
-aQzAeYL2wYMH/ZZv\
-jSM1HZGIWiNZPYYJ\
-AUwbT+NITUcOHjyo\
-PfShgau6DBPkmDLz\
-CQTnjgLTuHHjBv78\
-80+lqTQR3eeqPsME\
-MfWVBY7UfMPU/N08\
-rsaEOkRUBorsuGlp\
-aUhMTPTb83lMTWdY\
-1BjGvK4nEJyRmqlI\
-wuy7ZfUYJogxddEt\
-R2o6c+rUKVy9elVp\
-uo8zdjAhhkrU/B2p\
-SeBIzReISPZH5C4o\
-E0qoJgn8LWocqRkA\
-7yxgQhUi+heA2o7y\
-+fPnkZqa6m8ftCaO\
-1HyFJwuYEMb0TezB\
-GKmpZFoI/+9vl4ga\
-Z+xgQgVTZz4BjtQM\
-4dKlS9p1ObcRUU2T\
-3GEYf6I6m8OMSI13\
-FBgEj6sxIUo9xw+5\
-ubk4cOCA3x3gSM0g\
-eFyNCTWIqA6Aio7y\
-yZMnkZGR4Xc/gnFM\
-zRJIRO0BM/xgGD9i\
-+iQBwJGaYRw6dEib\
-seMeV3UZJkgwfZIA\
-4EjNMG7cuKE9DqwU\
-Ed3vqj7DBAH3KgsW\
-itQCXtRMX9LhgE+Y\
-YkIMp6jdvHlTm4bL\
-b3D300B4BpQJFey9\
-kBKO8qFDh3Dz5k1T\
-fOHup4Fwxg4mhLDE\
-eBrAkZqhuMjYUcos\
-fxjGQFSiZuIZnxyp\
-GQkRcReUCRVUWwEt\
-kG5ICUdqesKixgQ7\
-RBQJxTrM9PR0nDx5\
-0jR/OFIzGN5ZwIQA\
-qkW3+/fvl41r+Y1g\
-HFOzzJIOgDN2MCGB\
-ZSYJAI7UDOfy5cva\
-jB01ieg2s/xhGAOw\
-xPYoB8EYqVkO7oIy\
-QY6p6bu1BOOOAsvB\
-osYEK0RUAYp0Qykp\
-KUhKSjLRI47U/IIk\
-HOc9oEywYLWTo3hM\
-zR9wxg4miGmmLFhB\
-1DhS8wOcsYMJYh5S\
-Fnbv3m2WH06CMVKz\
-1JIOBzyuxgQpDRw/\
-5OTkyN7nVoAjNSPg\
-nQVMsEFEDwCIcpSP\
-HDmCzMxMEz2yEYyR\
-miWRfINxxg4m0FGN\
-p/3+++9m+aGCx9T8\
-xOnTp3HlyhWlqSER\
-RbmqzzABQHNlwQrj\
-aQBHan6DiGTR2oNm\
-+MIwOqGaxd+1a5dZ\
-fqjgSM2PSL7Jmsnq\
-MYzVIaLqAO50lJOT\
-k3H+/HkTPfoH3lHg\
-RySi9pCsHsMEAKqu\
-p1XG04DgjNQsuaQD\
-sM2A5uTkKE08WcAE\
-KqpehlW6ngCPqfmV\
-jIwMHDlyRGkqS0T3\
-meUPw/iA6nBuq0wS\
-AMEZqVkaHldjAh0i\
-KgZFDrXr16/j0KFD\
-JnqkhiM1P8OixgQB\
-zaH4HO/bt087rGI1\
-OFIzEomo8eZ2JtCw\
-7CQBEGSRGhF1BNDa\
-qPb1IDExESkpKUpT\
-PSKqYpY/DOMFLZUF\
-K00SANIxtbZENMTI\
-Z+ouakRUnoimA1gJ\
-wPID79wFZQIcZ1JI\
-F4vKTUUSqQHAF0R0\
-gIgeN+KZuooaEfUA\
-cALAi9priYmJOHr0\
-qJ6P0wUWNSZQIaK7\
-AUQ7ysePH9du/zOd\
-lJQUxMXFyS7VB7CK\
-iD60T3bohi6iRkTV\
-iWghgEUAVKee37hx\
-A59++inatWtnqVkZ\
-B5JwvbGsHsNYENV4\
-mtW6ngCQlpaGF198\
-EX369MGJEydkVUYC\
-OEFEXfR6ps+ipojO\
-emqvbd68Ge3atcPU\
-qVNx48YNXx9lCAcP\
-HkR2drbSdD8RhfQE\
-ChMwWF7UHGzbtg2P\
-PfYYPv74Y2RlZWkv\
-VwGwhIgm6/Esnz68\
-RPQxbNFZIaX98uXL\
-eO211zBgwADtkXSW\
-Izs7GwcOHFCaioG7\
-oExgcK+yYGVRA4Bb\
-t25hxowZ6NChAxIS\
-EmRVXiOiBCLq5Mtz\
-vBI1IqpMROsBvKG9\
-tnLlSrRt2xYrVqzw\
-xS+/InkzsKgxloaI\
-KkFxGPfFixfx119/\
-meiR+5w5cwa9evXC\
-W2+9hfT0dO3lxgBW\
-ENEAb9v3WNSIqDOA\
-owBilPa0tDQMHjwY\
-r776Ki5duuStP6Yg\
-mSzgNESM1VF98Vpp\
-a5Q7EBG+/fZbtG3b\
-Ftu3b5dVmU1En3jT\
-tkeiRkR9ACwFUEJp\
-/+OPP/DEE09g/fr1\
-3vhgOnv27NGa7pXV\
-YxgLETDjafmRnJyM\
-vn37Ytq0abI1bcOI\
-6AtP23Rb1Ozh4Dyt\
-PTY2Ft26dcO5c+c8\
-fbZlSElJ0Y791SSi\
-Wmb5wzBuoDpXI1BF\
-DbAdEjNlyhQMGDAA\
-ly9f1l4eQkQzPGnP\
-LVEjosEAZittt27d\
-wtChQ/Hee+9pz9EM\
-SHi9GhMo2Gfnncc6\
-Sia7ApL4+Hh07NhR\
-mz0HAJ4noq/dbadA\
-USOi/wPwpdKWnZ2N\
-IUOGYNWqVe4+x/Kw\
-qDEBRHPYZukBAAcO\
-HNAuSwpYLly4gJ49\
-e8rWtA4kojnutJGv\
-qBFRVwCfK21ZWVl4\
-4YUX8PPPP3vkrNWR\
-iJrlt3gxIYtlk0Lq\
-QVpaGnr16iU7yrI/\
-EX1W0P0uRY2IIqAR\
-tMzMTAwcOBDx8fFe\
-OWtlJOckNiai4mb5\
-wzD5ENSiBgBXr15F\
-nz59ZFlHXrEPh7kk\
-v0gtFkBlR+HGjRvo\
-37+/q+nXgMfFidbc\
-BWWsSENlIdCWc7hL\
-RkYG+vfvLxPtL4no\
-CVf3SUWNiMYC6Ka0\
-jRs3znK5mvSGx9UY\
-q0NEdwKo5iifPn0a\
-Fy9eNNEjY8nMzMRL\
-L72E1NRU7aWxru7J\
-I2pE1B3AaKVt2bJl\
-+Pbbb3Vx0spIvhEe\
-McMPhskHSx5abCQp\
-KSkYOnSoNo3RvfYU\
-Z3lQiRoRFQLwsdJ2\
-7NgxvPPOO7o7akX2\
-7t2rXQBYz1VdhjGJ\
-oFh06ynbt2/Hp59+\
-qjW/SER5EmloI7Vn\
-AVR3FByh3/Xr13V3\
-0opcvXpVO5UcTUQt\
-zPKHYSSoxtOCfUhI\
-yRdffCGbpHxVa9CK\
-2mvKwoQJE1zlQApa\
-tm7dqjXFyOoxjL8h\
-orJQiNqVK1dC6vNJ\
-RBg2bBgyMjKU5kba\
-XGxhiht6QNHdSklJ\
-weLFiw131GpIRM3S\
-5ywwIYVq4mrPnj2y\
-/ZJBzeXLl7Fo0SKt\
-WRWtKSM1VZQWGxsb\
-NKuUPeH333/X/r95\
-XI2xCiE3SSBj7ty5\
-uHnzptL0EBE1cBTC\
-AMC+ebuRw5iRkSFT\
-w5AgKytLO/gaRURP\
-muUPwyhQRWqhNJ6m\
-JDk5GT/++KPW3MPx\
-gyNS66C8umHDBly9\
-etVg16zLr7/+qjXx\
-uBpjBZwpsXJycrBv\
-3z4zfTGVpUuXak3O\
-YSKHqD2lvLp582aD\
-XbI2knG15rJ6DOMv\
-iKgJFIcaHTp0KGRW\
-JcjYtWuXbFtjNPCP\
-qDk3bxMRtmzZ4kf3\
-5Ahh+On0Ljl48KD2\
-qLGGRFTVLH8YBiGw\
-39MTbt26hW3btmnN\
-7QAgzD6eVtphPXjw\
-oCXScTdq1AjDhw9H\
-eHi435+dm5uL3377\
-TWvmLihjJpaYJLjt\
-tttMea4MyZq1OoAt\
-UquptBq17qVixYqo\
-Xbu22/Vzc3MxZMgQ\
-LF68GNWqVSv4Bp3h\
-9WqMxVClmPf3JIEQ\
-Av3798eqVatQpEgR\
-t+8rVaoUHn74YUN8\
-kmhVTcAmahWVVr03\
-xxYpUgSDBw/Gxo0b\
-cddddxV8g52cnBwA\
-wL333otVq1bhqaee\
-KuAOfZGIGm9uZ0yB\
-iG4D4Ewvf+7cOSQn\
-J/vt+dWqVcPChQvx\
-9ttvo1ixYihWzP0D\
-1SMiIhAbG4uZM2ei\
-Zs2auvol0aqKgE3U\
-KiitenU9w8LC0LFj\
-R6xbtw5vvPEGIiMj\
-PbpfmSK8RIkSmDhx\
-ImbMmIHy5cvr4l9B\
-/PXXXzh79qzSdDsR\
-ua/KDKMfpnU9n3nm\
-GaxevRpNmvxzJIIn\
-ouagTZs2WLt2LUaO\
-HImyZcvq4ptEqyoA\
-BkRq4eHheOKJJ7Bm\
-zRp89tlnXncdHZGa\
-kpiYGMTFxeGxxx7z\
-yUd34S4oYxH8PkkQ\
-HR2NuXPn4oMPPsgT\
-kHgjagBQuHBhPPfc\
-c4iPj8fIkSN9DlDS\
-0tK0mTsqATqKWnh4\
-ODp37oy4uDhMmTLF\
-o/EzGa4OcylTpgym\
-Tp2Kzz77DGXKlPHp\
-GQUhETWXiekYxkDu\
-VxaMFrUnn3wSa9as\
-QYsW8lwO3oqag4iI\
-CDz33HPYvHkz3nrr\
-LVSoUKHgmyTk5OQg\
-LS1NaSoH6ND9DA8P\
-R5cuXbB+/XpMmjRJ\
-t9kRWaSmpGPHjliz\
-Zg1atzZua+Zvv/3G\
-qYgYK+B832VmZspO\
-W9KFqKgoTJ8+HZMn\
-T0bp0qVd1ouIiNDl\
-ecWKFcOAAQOwefNm\
-jB49GtHR0R63odGr\
-cCIqmydSk2SYlBIZ\
-GYnu3btj48aN+Pjj\
-j1GjRg1ZNa+3JUgi\
-tV8BqFYbVqxYEbNm\
-zcL48eNRokQJbX2f\
-uXTpEg4fPqw0RRPR\
-Q7o/iGFcQEQdoDg8\
-fM+ePQV+4XtDTEwM\
-1q5di/bt28suf6cs\
-+Bip5RkQLFq0KPr1\
-64dffvkF7777rist\
-kSKbLAgDoOrDXbt2\
-zWUDYWFhePjhhzFp\
-0iQkJCTgww8/dDVm\
-dhnA6wBmuu2dBskf\
-rhBsM0ALtReefvpp\
-rFmzRjWYqReSLuij\
-uj+EYVyjGvLYuXOn\
-ro2XLFkyv0m4KwCe\
-hiaYKFq0qNvtS7KI\
-CADPAMizELRIkSLo\
-06cPfv75ZyxZsgS9\
-evUqcIhJImoVwgCc\
-VlqqVs27cL5u3boY\
-OXIktm7ditjYWHTu\
-3NnVbGYqbNk+agkh\
-Jtv/A14hidQKCSGS\
-hBC9AfTVXqxSpQoW\
-LFiAYcOG6bpgVyJq\
-bXRrnGEKRvUlunHj\
-Rt0afuihh7B69WpX\
-y6ViYfscLwGgijB8\
-/XwJIb4TQjQD0B1A\
-nm0BANCwYUOMGzcO\
-CQkJmDFjBtq3by9d\
-HyfpJl8uBI2ovffe\
-e5gzZw7KlCmDf//7\
-32jUqBHuvPPOgvy8\
-AOAjALFCCJddTk9y\
-P7mI1AAAQoj5RLQV\
-wCQAnR32sLAwvPTS\
-S2jWrBleffVV7ZIM\
-r3CkIlL8QnlcjfEL\
-RNQImvVpkkN+PaZM\
-mTJ46623XIlZLoC+\
-Qog8PSK9EUIsBrDY\
-fr7wq5DssS5UqBBi\
-YmIQExODq1evIj4+\
-HkePHsXx48fRtGlT\
-NG3aVHvL6UIAvgHw\
-osNyzz334LPPCjwv\
-1EECgFkAvhFCZBZU\
-2RNkkZqyIIQ4CeAp\
-InoRgOoAhoYNG2LV\
-qlV4/vnnsWPHDp/8\
-uH79Onbv3q385UUR\
-USchxEqfGmaYgvmP\
-sqBHlNaxY0eMHj0a\
-5cqVk11eAuANIcRp\
-nx9kx0X3U22wRYNL\
-iOgx2FIIdQGQZzai\
-VKlS6NixY36P2yyE\
-SA8TQvwK4D0P/DwM\
-YByAukKIpkKI2XoL\
-GpB/pKZECPEFgCdh\
-E1gnJUuWxMyZM1Gn\
-Th2ffeFxNcYkVCnB\
-1q1b51NjDzzwAD77\
-7DNXgjZICPG0noLm\
-KUKI1UKIPrDtRe8H\
-wNPMGlMAe5YOIcRo\
-2IQt3UXlFAAzALQU\
-QtQTQowRQvzpledu\
-UlCkpkQIsUII0RSa\
-k7Acg6C+Ismv1tbn\
-RhkmH4ioNjTnEfja\
-63AxjLQEQD0hxNc+\
-Na4jQoibQoh5QogW\
-AP4F4A1IZk0VbAbw\
-HyHEj4B6nGo0EU2D\
-LfyrCeASbONtB4UQ\
-fk8J4G6kpkQIMYKI\
-zgCY5rDVqlULYWFh\
-2pXHHrF//34kJycr\
-19HcSUQPCCFCM/Uo\
-4w9U2ZY3bdrk81KO\
-f//731pTPyHEPJ8a\
-LQB3up/5IYQ4B9vY\
-+SQiqgngLgB1YdOo\
-0wA2aT+H2nGqvwG4\
-PaBmJJ5EakqEENPt\
-ZwE2A2zTz1WrVkVi\
-YqLXvhAR4uLi0Lev\
-atL1KQAsaoxRdFYW\
-NmzY4HODd9xxh9Z0\
-wM1bVdOdvgQIvmDv\
-Gp8GsCq/enlOaNfb\
-D29vlHwreTKPfFpZ\
-uP322711w0lcXJzW\
-5J8NqEzIYT8KzzkT\
-mJ2drUs2ao2o5QA4\
-6OatlhA1dzFa1Hw6\
-v0sjbG5FanZU4321\
-atVyVc9tdu7cqd1n\
-dg8R1fW5YYbJi2rW\
-c9u2bdrU1R5Trlw5\
-REVFKU0HhRA33Lxd\
-9dlztS9bhq/dT28w\
-WtRUeHpGoeaXV9iD\
-W1Wb4/SI1HJycmRd\
-AP8meWNChd7Kwvr1\
-631uUNL1POXB7apI\
-zYhtWnriV1HzFL0i\
-NT1EDZB2QTlrB2ME\
-zgXeRKTL+jSJqLnb\
-9QQ0nz0fRS24IjVP\
-0RxY6kmk9idsK6MB\
-6NP9BGxLOyQn2Li/\
-+5ZhCoCI/gPAOc2+\
-d+9epKSk+Nyu5DPg\
-ySSX15GaGSfIW3ai\
-APA+UhNCZEPRBS1f\
-vny+qVTcJTs7G5s2\
-bdKauQvK6IlqKYce\
-XU9AemDKaQ9u1zNS\
-M5xAitTCicgTf08r\
-CwZ2Qbvo0jDD2FDt\
-VtFjKQcgFbWjHtyu\
-55haaHc/vVmAq0A1\
-WaBX8spNmzYhOztb\
-aWpORN6l7mQYBUTU\
-AoAzTc7Jkyd1Od0t\
-IiIClSpVUpqShRAZ\
-HjThdaQWjN1Pn5BM\
-HXs6ruZEr3G1zMxM\
-2WHP3AVl9KCbsqBX\
-lFazZk3t4eCepvrg\
-2U+98HZXgR1DRA2Q\
-dkF76tY4E8qovhx/\
-+uknXRr1sesJ8Oyn\
-fugZqek1pgbYUsBo\
-/rAtiKi4bg9gQg4i\
-egJAZUf5+PHjOHDA\
-3V1M+aODqKkiNR8X\
-3xpOIC2+BTybAU0G\
-4Mz1W6NGDd0y4qal\
-pSEhIUFr5i4o4wuv\
-KgvLly/XrWG9I7VQ\
-3yblEz5GaoBi7KBQ\
-oUIeHehQEJIuaH/d\
-GmdCCiIqAeARRRk/\
-/vijbu1LRM3T46i8\
-jtQkhHb308fZTwA4\
-qSzo2QVdv349H5/H\
-6EUPKD6LO3bswPnz\
-53VrXCNqN4QQxzxs\
-giM1BT6psmadGuB5\
-pGbYuFpycjL27t2r\
-NEUTEa9ZY7xBFeUv\
-W7ZMt4bLli2rXXju\
-adcT0DdSM5xgj9RU\
-YbaeM6CAtAvaWVaP\
-YVxBRLUAPOgoZ2Vl\
-Yc2aNbq17+NOAgd6\
-Rmqh3f3UO1Lzg6hJ\
-T4JlmHzooSxs3LgR\
-6emusup7jg6TBADP\
-fuqHDhMFfwJw5ozS\
-s/sJAGfOnNGe4F7O\
-PjXPMO7SXVnQs+sJ\
-SN/z3ogaj6npha/d\
-TyEEQTFZULp0aV02\
-titZvXq11vSarg9g\
-ghYiagZbzn0AttPG\
-4+PjdX2GDjOfAM9+\
-6ocO3U8AUB1OULly\
-ZVf1vGLZsmXab66W\
-RBTlqj7DKFB1PVet\
-WqX7FiSdup9eR2rc\
-/dSgw0QBAJxRFqpU\
-qeK1PzKSkpKwfft2\
-rbmHrC7DaFAt2Na7\
-6wkA1atXVxbThBBJ\
-XjSj0gne+6lAhx0F\
-3kRqhooaACxdulRr\
-6qf7Q5iggog6AXC+\
-GU+cOIH9+/fr+oyy\
-ZcuiaNGiSpO3R6o5\
-gwkdBC20u58+bmh3\
-YLioxcXFyTLi3q37\
-g5hgQjX2qucOAgeS\
-9/oZWT03cI6peSpq\
-wdj99EmVAyVSy8zM\
-xNq1a7Vm7oIyUogo\
-EsDDirKuez0dVK1a\
-VWv6y8um9IzUDIcj\
-NZ344YcftKZusnoM\
-A9sXnvO9vHPnTpw7\
-d073h1ghUpPA3U8N\
-lozUACAhIUH7xqxF\
-RB0MeRgT6AxQFoyI\
-0gBdRc0pwJ4u5wjG\
-7qdP6BGpCSFuAnAe\
-x1OxYkXdUhApcdGF\
-4C4oo4KI7gDQzFG+\
-ceOGbK2jLhgRqVl9\
-4S0QeKLmTaQGKA5u\
-DQ8PR3R0dH51vUYy\
-C9qViIrK6jIhi+qL\
-bsOGDbh27ZohD9JD\
-1IhIQCFqOmxmD+3u\
-p07r1AA/dUFPnz6N\
-PXv2KE0R4GiNUfOM\
-srBkyRLDHqR5n5MQ\
-wpslHapujaeRGnc/\
-Nei0owDwk6gB0gmD\
-QYY9jAkoiOhRAHUc\
-5eTkZGzdutWQZxUt\
-WhTlypVTmv72silV\
-IGH1tEOAxRffBlqk\
-BtgOy7hx44bS1IyI\
-ahv2QCaQUEXty5cv\
-N2yJRKVKlbQnSHma\
-GNJBQG1mByweqek4\
-puY3Ubt69arsaDPu\
-goY4RFQEmmU+kjFY\
-3TBikgDQZfYz4MfU\
-9F58a/lIDZC+WbvL\
-6jEhRQ8AzhPH9u7d\
-i+PHjxv2MCOWcwAc\
-qflMIEZqALBlyxak\
-pqYqTfWJqKWhD2Ws\
-jmpsVTL2qitWidTM\
-INBEzatITQiRAuC6\
-o2y0qOXk5Mj28nEX\
-NESxr01r7ihnZ2dj\
-1apVhj7TwpFawHc/\
-fULHSA1QZCgoWbIk\
-SpQo4UNTBSNbs2bo\
-Axkro/pCW79+Pa5e\
-vWroA3Xc98mRmp7o\
-OKYG+LkL+ueff+LQ\
-oUNKU1ki4rG10MRv\
-a9McGBWp8YZ2UhF3\
-pgAAIABJREFUH9E5\
-UvOrqAHSaO1Fwx/K\
-WAp/rk1Tonl/pwkh\
-vA0NVZGaDqmHQrv7\
-qeM6NcAEUVuxYoX2\
-/9CCiIx/MGMl/LY2\
-zUFUVJQ2OeRZH5rj\
-SE1PdNxRAJggahcv\
-XsQvv/yiNfOEQYjg\
-77VpDipWrKg1eZPC\
-24FPkZoZWHqdWqBH\
-aoA073xPvzyYsQJ+\
-XZvmoHz58lpTsg/N\
-+RSpcfdTQ6CPqQG2\
-w2k1M133EVFDvzyc\
-MRu/rk1zoLOocaSm\
-J4E8++kgOztbli+L\
-u6BBDhFFw89r0xxY\
-KVIzg0ATNa8jNSHE\
-DQDOZf6VKlUyJFmk\
-DEnyyC5+eTBjJv9R\
-FuLj4w1fm+bASpEa\
-dz816BypAcBpxw/h\
-4eGoUKGCj825x++/\
-/46zZ1UTULcTUXu/\
-PJwxC1U0vm7dOr89\
-mCM1C6PzmBqgWVUt\
-WXVtCETE26ZCj3qO\
-H3JycvDzzz/77cFW\
-itTMINBEzddILUVZ\
-KFu2rI/NuY9kFvQp\
-WT0m8CGipwE4uwG7\
-du3C5cuX/fZ8K0Vq\
-wdj99GmWz4BI7ZKy\
-UKZMGR+bc59Tp07h\
-jz/+UJpKEBFHa8HJ\
-k8qCJL+eoWgy3gLW\
-itRqENEzBVfzHsNE\
-jYhehOLAVgAeHzBh\
-gKhdVBb8KWqA9BTu\
-jn51gPEXjyoL69ev\
-99uDhRDaSC1VCOFL\
-ag2fIrWcnBykpaVp\
-zSN98KdADBE1IooA\
-8LbSNnPmTMTHx3vU\
-jgHdT9MiNQCycZUW\
-fnWAMRwiagPAuaT/\
-6NGjOHPG273knlO6\
-dGntrL4vURrgY6SW\
-k5ODPn36IDMzU2lu\
-QESGHfZtVKTWA0Bl\
-R+H06dOYNGmSx40E\
-W6SWmJiIU6dOKU3/\
-IqLGfnWCMRrVUg5/\
-RmkAZDP6F3xs0ueD\
-Vw4dOoQvv/xSa37N\
-B5/yxShRa6kszJo1\
-y6u+uM7bpACTIzUA\
-smiVl3YEF6Z1PQHd\
-JwkAH4/IcxAbG4vr\
-168rTQ/Y98bqjlGi\
-VlNZ2L59u1eN6Lyh\
-HdBEalFRUT425zmb\
-N2/Wmtr53QnGEOzb\
-3+50lJOTk3HgwAG/\
-+mCAqOlyRF5mZib2\
-79+vbbeei+o+YZSo\
-1XX8kJOTg9OnT3vV\
-iNGRWunSpX1sznMS\
-EhJkR+j53xHGCFRd\
-zw0bNvj9MF+jIzVf\
-Zj8lm/lret1YPhgl\
-as5c2RkZGV43YkCk\
-Znr3MysrCwkJCVoz\
-d0GDgw7Kgr+7noDx\
-kZovoibRAkNy6usu\
-akRUCEAxR1kz6+ER\
-ekdqQohbAK44ymaI\
-GiAdV+PJggCHiEoA\
-aOQoZ2RkeD3s4gtW\
-jtQkWhAYogZF/ijA\
-N1EzYPYTAJxLu4sV\
-K6bNEOoXNItwAR8X\
-KTOWoJGysHfvXllP\
-w3CsHKkFsqipZjR8\
-+cNKfoF6pNUwdVkH\
-YFu7pBlrMWTAlPEr\
-KlHbt2+fKU5IJr9S\
-ZfU8QLdIzYDhJClG\
-iJrq0yqEb1u9NNGa\
-Hr8E08fV0tPTce7c\
-OaUpmojy5GBmAooH\
-lAWzRK1kyZJa0xVZ\
-PQ/QLVKTaIEhsyiB\
-Jmq+zn4CFojUANsR\
-ehruNsMPRjdU0bZm\
-+YLf0IqaEMJXUdMt\
-UmNRsxOMkRoAHDly\
-RGtqYIYfjO8QUXkA\
-9R3l1NRUJCX5ctaJ\
-92hEzVdBAzhS0x+j\
-IzUzFuACUlHjSC1w\
-scR4WqFChVCsWDGl\
-SY9Uu5xPDTqrr9GR\
-mhkLcAGpqNU0wQ1G\
-H4J1PA3gSA2Azt1P\
-zS9REJGvM6CWiNQ0\
-EwUAUMMMPxhdUEVq\
-VhlPgz6ixmNq0FnU\
-jN5VYFakdv36de26\
-HZ79DFxUkwRBFqn5\
-vKHdkQqJRc1OMGbq\
-cJCaqlpCVIKIiruq\
-y1gTIooCUMtRPnfu\
-HC5dupTPHcZhkKip\
-1p1mZ2fr0KSTgBE1\
-XTE6U4eZonbx4kWt\
-iaO1wKOmsuCPE9hd\
-YZCoqT5v3mTp8DZd\
-kbdYPlKTfDP4uq/J\
-EmNqQJ5IDQCizfCD\
-8QnVgQD+PGBFi1VF\
-zbF7hrufdjRpegAg\
-wqcGAVWqgIgIX5vz\
-Hha1oEB1JNmVK3ro\
-iHeUKJFnK6UeSzp0\
-636yqNnJysrSmnxS\
-ISGEqkEzNrQ74O5n\
-UKASNckhI37DqpGa\
-AxY1O5oUwAAQ6VOD\
-NpzCZqaocaQWFKi6\
-nyxqrglkUdMVvSM1\
-O84+bZEihqRJdwtJ\
-V8W8AT7GW0IqUjMj\
-nZKnWH5HgQFjaoBF\
-IjXJOaic1jvwCHZR\
-0y2VWCBHaoHQ/XQq\
-pRAChQsbktapQK5e\
-zTOOa976EsZbLDNR\
-wN1PG0aImmq1rOZg\
-VY8xqPtpickCjtSC\
-AstEaprN7ACQJyLw\
-At1ELSwsj9wYsjte\
-d1ETQtwE4Py0+roN\
-yehIDTBvXI1FLShQ\
-RdeS6NtvSN7HecZu\
-vEC3MTXJQndDtl4Y\
-NVGQ4vghMjLSp7Vg\
-Ro+pARypMT6h+pKV\
-9Cz8huR9rIczuo2p\
-lStXTmv62+vG8sEo\
-UVMddS85DMJtgrn7\
-mZGRod1CwmNqgYfq\
-zaPz3kiP8Eek5kv3\
-s0KFClrTBVk9XzFK\
-1E4rC40aNXJRrWCC\
-uftJREhPT1eaSpni\
-COMLTlHLyckxNYmi\
-QZGaLt3PIkWKoEED\
-VXJngkYn9MIoUdui\
-LLRq1crrhoxefAtY\
-allHMSIyzxnGG5x/\
-L8lQiV8xKFLTpfvZ\
-pEkTREaqPro7hBB6\
-TGTkwShR+0lZiImJ\
-QdmyZV3VzZcLF/JE\
-qNW99EmJVUUN4HG1\
-QMM55Whm1xPI8z6+\
-IYTQY8mELt3Pp59+\
-WmuK89KfAjFE1IQQ\
-iQC2OspFihTBxIkT\
-ZetoCiQxMVFrakpE\
-T/rmIYsa4ztE1AKK\
-D/3Zs2dN9CZPpOZz\
-lEZEIwDUUdq8EbVu\
-3bqhffv2WvM33nuW\
-P0Zuk5quLLRs2RJN\
-mjTxuJGkpCTtOEVN\
-AMuJ6GMi8lYALDGm\
-BvAC3ACntbKwbds2\
-s/wAkOfL2evxNCLq\
-RESHAYzXXvOm+zl2\
-7FjtetV4IUSeMyL1\
-wjBRE0J8A2CGr+3k\
-5ORg69atsktvADhB\
-RN29aNbKkVolM/xg\
-vOIZZeG3334zyw+E\
-h4drF7d63Bcmoigi\
-Gg9gBTQRWk5ODmbN\
-mqXX3s8pejTiCqM3\
-tOuyZWrgwIEYO3as\
-Nqc/YMuQ8C0RxRLR\
-vzxo0sqitkKH7jVj\
-MEQ0FcCdjnJ2djZ+\
-//130/zxdeaTiHoC\
-OAFghPbawYMH0blz\
-Z4wfnydwc7dtZTFN\
-CLHcq4bcxPJZOgBb\
-OuB58+ahffv22LJl\
-i6xKP9iitj5uNmmZ\
-7uehQ4dk5uVE1M3f\
-vjDuQUQvAXhZafvk\
-k09kX7p+w9uZTyK6\
-k4i+BbAQmiwx169f\
-x/jx49G5c2ccPHjQ\
-a980oubbZnA3CIhI\
-zcG5c+fw7LPP4o03\
-3pBtHC4CYB4R/UBE\
-dQtoyjKR2uLFi/HB\
-Bx9o//AA8B0RDTTD\
-J8Y1RPR/AKYpbfHx\
-8Zg9e7ZJHtnwJlKz\
-v7/+BJBnCOfXX39F\
-hw4dMGvWLJ/X3gWb\
-qBnC0qVL0bZtW6xZ\
-s0Z2+SkAh4jouXya\
-sEykBgBz5szBm2++\
-KXvzfE1EQ83wickL\
-Eb0K4HOl7eLFi3jj\
-jTdkX0p+xZNIjYja\
-EtEvAL7WXktLS8Pw\
-4cPRr18/2coDrwg2\
-UdM1UlOSmpqKl19+\
-GS+++CJSUlJkVWYR\
-0S9E1E5yTbf9bHqx\
-ZMkSvPLKKzJfPiWi\
-UWb4xPwDEQ2HZoA7\
-MzMTL7/8siyDsd9x\
-J1IjoupE9Dlsa8Qe\
-0V5fvnw5YmJisGzZ\
-MmOctBHwomY4cXFx\
-aNeuHZYsWSK7/AiA\
-tUQ0lYhqKuyWEzUA\
-WLt2LQYNGiTbRfEB\
-Eb1vhk8MQERvApio\
-tGVkZKB///7YsWOH\
-SV6pKShSI6LnYZsI\
-+D9txbNnz6J///54\
-/fXXDTkNK9giNb9w\
-5coVjBgxAv369XO1\
-APJl2CYSXrCXjTyg\
-1Se2bNmCvn37ytav\
-vUVEk8zwKZQhojEA\
-PlLarl27hn79+pk6\
-26nFVaRGRE8S0e+w\
-La9SHQR+69YtzJo1\
-Cx06dEB8fLxhvgWb\
-qBnW/ZShHNyUrHwO\
-A/AVEe2FhTIryNi9\
-ezd69uwpO23qdSKa\
-JruH0R/7mq13lbYr\
-V66gb9++2LNnjzlO\
-uUAWqRHRHADLAdyv\
-vbhlyxY89thjGD9+\
-vOGztsEman4nMzMT\
-48ePz+/b5x4AryoN\
-Vul+Kjl8+DC6deuG\
-8+fPay+9REQzzfAp\
-lCCiz6BZs5WWlobe\
-vXtj3759JnnlGklK\
-+mcA9Ncaz549i8GD\
-B+PZZ5/FiRMn/OJb\
-sImaXyM1JSdPnkT/\
-/v3xwgsvFDiLY7VI\
-zcHp06fRrVs3nDx5\
-UntpEBHFmuBSSEBE\
-XwF4RWlLTk5G9+7d\
-Xa0rNJ2Cll1kZWXh\
-s88+Q7t27bB+/Xo/\
-eWUj2ETNdDZs2IC2\
-bdti8uTJsgF4ANaM\
-1BwkJSW5+jD1I6IF\
-ZvgUzNi7bC8obWfO\
-nEH37t1x/Phxk7wq\
-mPw2msfFxaFt27b4\
-/PPPTcnMG2yiZlqk\
-piQ7OxvTp09HTEwM\
-Vq1alee6Fabk8+PS\
-pUvo2bOnbGC6FxEt\
-JyJOLqkDRDQPmi7b\
-kSNH0K1bN93WbBmF\
-TNROnDiBfv364cUX\
-X8S5c+dM8EqK4SJQ\
-qOAqwcOFCxcwdOhQ\
-LFy4EGPGjEGdOnWQ\
-kZGBo0ePmu1agThm\
-3L788ku0aNFCeelJ\
-2PaLjjbJtWDh/wB0\
-VRr27NmDgQMHmnrs\
-nbsou58ZGRn4/PPP\
-ERsb61P6bb3wd6Rm\
-tKhZIlLTsmPHDjzx\
-xBPo0aMHGjdurD0n\
-wLJkZWVh0KBBmDx5\
-Mh5//HHlpUcAbDbJ\
-raBk69atGDx4sKn7\
-OT3h77//RmZmJuLi\
-4jBhwgRXC9JNIdhE\
-zbLk5ORgwYIFWLhw\
-odmueMStW7fw6quv\
-Ij09Hd27e5N1iSmI\
-devWYejQoZadQJJx\
-4cIF3H333Wa7ISXY\
-xtQsj9l79rwhNzcX\
-o0aNwqxZs8x2JehY\
-unQpXn755YASNKsT\
-bJFa4ClGADF+/Hhc\
-uHAB9913n9muBAXH\
-jh3DtGnTAvKLjvmH\
-kO1+BguxsbGIjY01\
-2w2GcUmwdT8tOVHA\
-MIz/0Ea+RGSoEIT8\
-mBrDMMYi6c4HtKhx\
-pMYwjJaAFjWGYUKc\
-YIvUGIZh/Ap3PxmG\
-CSo4UmMYJqjgSI1h\
-mKCCIzWGYQwl2CYK\
-dInUIiIidHGGYRjv\
-CA8PD5ieVkBEamPG\
-jMGcOXPQvHlzs11h\
-mJCifPnyeO2115CQ\
-kIA2bdqY7Y5bBMTe\
-z+joaLRo0QKPPPII\
-/vzzT8yePRsrV660\
-dBpuhglk6tSpgwED\
-BqBTp07Ok6oqVKhg\
-slfuERDdz/Llyzt/\
-rlOnDiZOnIgtW7bg\
-pZdeQpkyZXzzkGEY\
-ALbP5yOPPIJ58+bh\
-p59+QpcuXVRH75Uq\
-FRhZ4wMiUpN9Q1So\
-UAHDhg3DkCFDsHTp\
-UsydOxenTp0ywTuG\
-CWyKFi2Kzp07o3//\
-/qhdu7bLet6Kmr8n\
-CgIin1p+EwURERHo\
-1asXevbsiZ9//hmz\
-Z89GQkKCHo9lmKCm\
-fPny6N27N3r37o2o\
-qCiz3dGNgIjUNGcI\
-ZAE4CaCe0iiEQJs2\
-bdCmTRscPHgQs2fP\
-xqpVqwo8D5FhQo3a\
-tWtj0KBBeOKJJ2Qn\
-uyuZCeB5R8EKh7i4\
-Q0CMqWlELVwIUR9A\
-dwDbZfXr16+PyZMn\
-Y/PmzXjuuedQokQJ\
-r57LMMHEPffcg6++\
-+gpr165F165dXQna\
-eQBjANwB4A/lhUCZ\
-mAuIJR2aaCscAIQQ\
-i4UQDwJ4AsAm2X2V\
-K1fGyJEjsXXrVowc\
-ORKVK1c23lmGsRjN\
-mzfHggULsHTpUjz6\
-6KOugot9AAYAqCWE\
-GCeEOAagsLICR2o2\
-jIjUVD4LIVb+f3tn\
-Hh9Fkf7/d2USCAmB\
-sEDQAMp9JOuBCIhg\
-EEEElkNABOUIS4Ko\
-uL8VL3BX+XruCllk\
-AUVddF3wyymKBvkK\
-qGDicgnIIaJAuAQC\
-yClHIEBSvz96MvZ0\
-eo4k3ZOZSb1fr37N\
-dE11V8FkPv1U1VPP\
-I4S4C7gJeA0olqSx\
-atWqpKenk5WVxZQp\
-U0hOTi5VPxSKUEEI\
-Qbdu3Vi8eDGzZ8+m\
-ffv2nqquBgYLIW4S\
-QrwvhNCncA9JUQvF\
-OTWklA4hhJv5JoTY\
-BmyTUv4DeAD4f0BT\
-fR2Hw0GfPn3o06cP\
-69atY+bMmWRlZalE\
-G4qwweFw0LdvX0aP\
-Hu11JRNtdDNFCLHE\
-Sx03USvt8DPctklZ\
-gslkv8NTXSHESSHE\
-G0KIZsAQYKNZvdtu\
-u4333nuPZcuW0a1b\
-N+s6q1CUE8nJyWRm\
-ZpKRkeFN0KYB7YUQ\
-d/kQNAhRSy0khp8l\
-ETVDe3OFEG2A/kC2\
-WZ0mTZrQv3//UvVL\
-oQgWmjRpwscff0yL\
-Fi3MPr4CvAIkCyH+\
-LIQwXWAzQYmaXZiY\
-ryXqtxBisRCiE3AH\
-MMP4uXL7UIQ6N9xw\
-A5GRxWaTTgLj0Cb/\
-nxdC7CjhbS0Zfgaa\
-gDrfBtpSMyKE+C/w\
-XynlAiDLy/0VipDC\
-JKP8NGCCEKLYwlkJ\
-UJaaXVglap6uNy5E\
-KBShRn5+vrEouoyC\
-BhaJWrgtFFhiqZV1\
-+GmCm6gpS00R6piJ\
-mgW3dfPONbEGgxJl\
-qaEsNUXoY5OoVdaf\
-KFGzEBPRsVTUlKWm\
-CHWUqP1GSAw/TVZd\
-oszqlQAlaoqwwiZR\
-c7uHSRtBSUhYajZ8\
-YWr4qQgrlKX2GyFh\
-qZn8Z1Y2q1cClKWm\
-CCuCWdTCbfXTEpSl\
-plB4J5hFLdAE1FIr\
-LXaLmrLUFKGOmlP7\
-jZCw1GwYfrr534TK\
-9g+FwhPKUvuNkBA1\
-G76wkPyyFApPXLly\
-xTh3VdYHf7F7hMrv\
-pKIuFChLTRF2GH4n\
-wSxqaqFAWWoKhW8M\
-vxNL59SklCHzOwkJ\
-S81uUQuVCVCFwhs2\
-iJprRBNKo5mQsNTU\
-8FOh8I3x4SyltOzh\
-HypWGihLDQitL0yh\
-8IQNvxPX9aE0mqmo\
-lpoSNUXYYaWoSSmj\
-0OlDWX4j4bajIFgt\
-NTX8VIQdFv9OQvbB\
-HxKWmhp+KhS+Mfk7\
-VqIWrKjhp0LhG4sf\
-/iG5RQrU8BNQw09F\
-eKCGnxrKUjO/v0IR\
-cihR06iolppyvlWE\
-HcEqauG2+mkJFk+A\
-ghp+KsIQNaemEarx\
-1NTwU6EwEKyWWqCp\
-qJZayH5hCoUnlKhp\
-hISo2WCpqeGnIuyw\
-U9TU8PM37Iqnpiw1\
-hcKAnXNqaqHAYtSO\
-AoXCN8pS0whVS00N\
-PxUKA2pOTaOiWmou\
-USsoKFDZpBRhgRI1\
-jZCw1EyEp5Knun4S\
-ksHvFApvKD81jZCw\
-1MDyUMUhGaZYofBG\
-sFpq4bZQYImlBsX+\
-UytkmGKFwhsq9JBG\
-qFpqUVLKUvVdSlkJ\
-3ZMilL4shcIbFvtz\
-quGn3Vj4FFIrn4qw\
-RFlqGiEz/LTwKRSy\
-X5ZC4Y1gnVMLNBXR\
-UgvZL0uh8IYSNY1Q\
-ttRK+4XF6k/y8vJK\
-eRuFIrgIVpeOcFv9\
-tAwLdxW4idrFixdL\
-eRuFIrhQlpqGstSU\
-paYIE5SoaShLTVlq\
-ijBBiZpGyIiastQU\
-Cu9YHPhB+al5wJJw\
-3mCfpaZETREuSCmt\
-3HmjtknZjV2Wmhp+\
-KsIJC/dIq+GnB9RC\
-gUIRQJSohZClphYK\
-FArfGERNSClL+ztR\
-c2oeUJaaQhFALPyd\
-KEvNbpSlplD4xkJR\
-cwV+uHr1qtlkv9+o\
-hQIPKEtNofCNHZZa\
-KFlpoIafylJThBUW\
-/k5c14XSfBqEkKWm\
-/NQUCt9YIWpSSgcQ\
-WXSuLDV3ovQnV69e\
-LfWNLHwCVdWfKFFT\
-hBMWhegK2UUCsF/U\
-EvQnJ0+eLPWNlKWm\
-UPjGooe/pe4chYWF\
-xiJHmW7oA7tF7Rr9\
-yfHjx0t9IzWnplD4\
-xqLfiaWW2vnz541F\
-1cp0Qx/YLWp19Ccn\
-Tpwo9Y3U6qdC4Rs7\
-RK2sltq5c+eMRdXL\
-dEMfhIylZuHwM6bo\
-TUFBgUq8oggr7Bh+\
-KkvNHZelJqXk9OnT\
-pb6RHZaastIU4YZF\
-D3+3xbQLFy6Uuj9g\
-aqmFtKi57l9YWGg2\
-Yeg3VnxZzlyhVYrO\
-lagpwg2LHv5x+pOy\
-iprJjgJbdSdk/NQs\
-+rLUIoEirLHod2Kp\
-pRZoArajoCy7CcAe\
-UVOWmiLcsEPUyvo7\
-MfntWxY81oyQETWL\
-5gqUpaYIa4JR1ExQ\
-ogbKUlMo/CEYh5/h\
-ZqlZhrLUFArfmPxN\
-x5rV84EafgYCO0RN\
-WWqKcMMiR1e1UOAF\
-y0IPFRYWGh1l1eqn\
-QmHADlFTlpo7loka\
-FLPWlKWmUBhQohZi\
-omZBppx4/cnZs2fL\
-1B+FItiwSNTcnG9N\
-tjmViLAWtbJisNQc\
-UspIT3U9UFN/cubM\
-mTL3SaEIJpSlFkIL\
-BWDJcrWbqJVlL6pC\
-EYzk5eVRUFCgLyp3\
-UQs0oTz8hDKKmrLU\
-FOGIwVorzeZx5afm\
-BTsXCqDkiwW19CfK\
-UlOEIwZRqySlrOKp\
-rgfUjgIvBLWlpkRN\
-EY5YMK/m8hIoLCzk\
-0qVLZeqPstS8YIGl\
-poafirAnNzfXWNSs\
-hLdwWWpWWGmBFrWS\
-rh6WKyaW2pNSys3A\
-d8BPQohTPm7xO/29\
-lPOtIhzZu3evsagF\
-kO3tGinlrUB75+GK\
-Dh1quwnAflFz+x+p\
-UqVKmeKd//LLL8ai\
-kfoTKeU54CDwM3BA\
-93oM7Yty+akpK00R\
-ruzZs8dY1NwpWnWB\
-+oajHnAdHkZtVlhq\
-lSpVMhbZmh3ZblHb\
-DyQXndSrV69MYmLy\
-BDISByQ5D6/k5OSU\
-uh8KRTBj8jt5wnmU\
-GCtErWbNmsaiYtaJ\
-ldg9p7Zff1K/fv0y\
-3WzDhg1s3rzZkmHj\
-8uXLy3wPhSIY2bt3\
-r1kI7RJx4sQJvvji\
-C2bNmlXm/gRa1Oy2\
-1PbpT8oqalu2bOG+\
-++7D4XDQsGFDkpOT\
-SU5OpmnTpiQmJpKY\
-mEhMTIzP+xQWFvLl\
-l1+WqS8KRbBy5swZ\
-MjMz6du3r1/1T548\
-yaFDh9i6dSubN29m\
-8+bNHDx40LL+VK1a\
-1VhUbHnWSuwWNTc7\
-uF69epbctKCggJyc\
-HHJycvj000/dPouP\
-j3cJXGJiInXr1qVW\
-rVpcunSJvLw8Dh8+\
-zPLlyzl27JglfVEo\
-gpFnn32WH3/8keuu\
-u474+Hiio6M5duwY\
-R44cITc3lyNHjnDk\
-yBGOHj1a5ryevjBZ\
-/Sx9BiY/sFvU3Bxc\
-KlcubapO/zlz5gxn\
-zpxhx44dtrelUAQr\
-+fn5zJw5s7y7ARQX\
-NSFESPupuW1Cczgc\
-NjenUCiCjYgIN5mx\
-1UoD+0XN7R9QVudb\
-hUIRehh+97ZaaaAs\
-NYVCYTNhbakZ/nEK\
-haLiEV6WmhI1haLi\
-EW7DT2WpKRQVnHAb\
-fqo5NYWighPWlppa\
-/VQoKh7KUlMoFOFM\
-eFlqak5Noah4hLWl\
-pkRNoah4hPWcmhp+\
-KhQVD4MxE/Kipiw1\
-haKCY7DU1PBToVCE\
-NmE9/FSiplBUPJSl\
-plAowgplqSkUirAi\
-3ERNOd8qFBWYQCcy\
-BvvDeQfcUouKiqJj\
-x44kJCQghGD58uWc\
-Pn3a9nYVimAnKiqK\
-Dh06cP78eQ4cOMDx\
-48dtb9PkNx/yohaw\
-ObUbb7yR/v3707t3\
-b+LjXTmL+etf/0pa\
-WhrffvutbW0rFMFO\
-YmIiixYtok6dOq6y\
-vLw89u/fz6JFi5g7\
-dy5XrlwJRFdsXyiw\
-dYe5lLIW4Hoc7N69\
-m+7du1vaRocOHfjr\
-X/9K8+bNPdbZsmUL\
-AwYMsLRdhSKUeOed\
-d+jatavHz3Nzc5k6\
-dSqLFi2ytN3IyEh2\
-7typLzoohLjO0kYM\
-BHROzeooHQ8//DCz\
-Z8/2KmgAN998s1/5\
-QBWKcKRSpUrccccd\
-XuskJiYyceJE7rnn\
-HkvbNhmdhbxLh63b\
-pGrVquXpo63Af/UF\
-tWvXtrRthSJUiIuL\
-M6an3AZswSSp8AMP\
-PGBp2+WxUBDSfmrn\
-zhX7TqYDtwshbgbc\
-VgeqV69uadsKRahQ\
-WFjMOIoQQrQSQlQD\
-xug/aNCggaVth72l\
-FgBROySEWOt8n6D/\
-4OTJk5a2rVCECqdP\
-n+bXX3/VF7WQUlYC\
-EELMQGc9ValSxdK2\
-laVWQkxETW+ONSh6\
-I6Xkl19+sbRthSKU\
-MEzWRwI3AEgpY9At\
-GF68eNHSdk1ELbws\
-Navn1M6ePWssite9\
-d024nT59OlDL1QpF\
-UGIQNYAbna+x+sK8\
-vDxL2w17S83q1U9P\
-oialrAO4FPTYsWOW\
-tqtQhBo//fSTsegG\
-56sStZIghChE94+w\
-2lIz8Yi+xvnaUV+4\
-Z88eS9tVKEINE0vt\
-ZufrtfpCq3cZhONC\
-Aej+EVaLmsk8WaLz\
-tbW+cPv27Za2q1CE\
-Grt27UJKNyMpyfnq\
-5gibm5trabthZ6k5\
-cQ1B7Rh+5ufn64uK\
-LLXb9IXff/+9pe0q\
-FKHGhQsXOHTokL6o\
-jpSyCnC9vvDw4cOW\
-thuOCwVgo6UGxay1\
-eOdqTtFTCCklP/zw\
-g+XtKhShhsnv4D4C\
-L2rhZanZsaHdZAh6\
-LeDatXvgwAEz1w+F\
-osKxdu1aY1FXbB5+\
-lsecmt1ROkD3j7BD\
-1ExWNuvrT9R8mkKh\
-sXr1amNRe+CSvkBZ\
-av5hq6Vmslrjtnlt\
-8+bNlrepUIQi+/bt\
-48iRI/qipugstUuX\
-LnHq1ClL2yyPeGrh\
-NqcGhkWCdevWWd6m\
-QhGqmFhrrl04Vg89\
-PRAWCwW2rX6C6fCz\
-yFOa06dPm/nnKBQV\
-ljVr1nj8zOqhJ4Tv\
-8NNWS82bs+DatWuN\
-vjkKRYXGm6jZYamF\
-vfMtWG+tHT161ONn\
-auipULhz/Phxdu3a\
-ZfqZstT8x9bwQwcP\
-HvRojZksYSsUFR5P\
-1pqy1PzH1jR5+fn5\
-pl/GsWPH2Lt3r6Vt\
-KRThgMliAWCPpWZC\
-WFhqtmeU2rdvX7Ey\
-NfRUKMxZv349BQUF\
-xcp3795teVth79IB\
-gRO1lStXWt6OQhEO\
-XLhwga1bt7qVHT9+\
-3Jb8uOG69zPgllpe\
-Xh5fffWV5e0oFOGC\
-cQjqafGgrFSIhQI7\
-3DqMovbFF19YHpZY\
-oQgnjKJmlz9nhVgo\
-sMMB1yhqS5YssbwN\
-I0899RTjxo3zlqZP\
-oSgxSUlJpKam2t7O\
-d9995+YOZZeoKUut\
-lOTm5rpyEJw5c4Zv\
-vvnG8jb0VKtWjdTU\
-VB566CGys7N54YUX\
-qFu3rq1tKsKXWrVq\
-MWrUKD4AqfP5AAAg\
-AElEQVT//HOWLFnC\
-hAkTaNmypa1tFhQU\
-MHv2bNd5AIef4Wep\
-2TGnVlBQwIEDBwD4\
-4IMPuHr1quVt6Bk8\
-eLAr43vlypUZNmwY\
-q1atIiMjg8aNG9va\
-tiJ8qFu3Li+++CLZ\
-2dmMHz+eZs2auT4b\
-OXKk7e3Pnz+fvLw8\
-pJS2rHxCBbHU7BA1\
-gG3btrFr1y7efPNN\
-W+5fhMPhMB0eOBwO\
-+vfvz7Jly3jjjTdI\
-Tk62tR+K0KVx48Zk\
-ZGSwatUqhg4dasye\
-DkDv3r1JSEgwudo6\
-fv31VxYtWsTBgwdt\
-m4MuD5eOQMRTs9X5\
-tohp06ZRuXJl21Ph\
-9ezZk2uuucbj5xER\
-EfTo0YMePXqQnZ3N\
-jBkz2LBhg619UoQG\
-ycnJPProo3Tr1s3n\
-wz0qKoqhQ4fy+uuv\
-29qnjIwMNm7caNv9\
-1fCzDBw8eJCcnBxb\
-7q3HZFjwZyDbrG5K\
-Sgrz589n/vz5pKSk\
-2N43RXDSpk0b3n//\
-fTIzM+nevbun38Aa\
-4H59wZAhQ4iOjra1\
-b3l5eSxdutS2+4er\
-qAVk+BkIbr31Vm68\
-8UZ90TlgnhCiE9AX\
-+NrsuqI/6mXLljFo\
-0CDT4YYivHA4HPzh\
-D3/go48+8vVQywb6\
-CSE6CCE+BFxesfHx\
-8fTr1y8Q3bWNcJ1T\
-C4ilFghMrLR3hBDH\
-AYQQmUKIzsAdwAyz\
-65s2bcrf/vY3Vq9e\
-zRNPPEGdOnXMqilC\
-mLi4ONLT0/n666+Z\
-Nm0aN998s6eqXwN9\
-hRCdhBCf6Mqn6CuN\
-HDnSFjeoQFEhRM2u\
-OTW7qV+/Pnfffbex\
-eJ6xQAjxXyHEGOAW\
-IMPsXjVq1GDMmDFk\
-Z2fz+uuvc8MNN5hV\
-U4QQ9evX5/nnn2f1\
-6tU8++yzJCYmeqo6\
-A7hDCNFZCJFp8vk8\
-wJXLrlGjRtx5553W\
-dzhAhKvzra3x1ALF\
-iBEjjF/Q10KI7zzV\
-F0JsFkI8AzQHXgCK\
-heiNjIykb9++fPLJ\
-JyxcuJAePXqErOhX\
-VFq3bs2bb77JV199\
-xYgRI4iNjTWrlof2\
-gLtFCDFGCPFfT/cT\
-QlwG3tGXpaWlWdrn\
-QFIellrYrH7aSWxs\
-LAMHDjQWTzGra0QI\
-sQt4UUqZgZYU5v+h\
-CzleROvWrWndujW5\
-ubnMnj2bBQsWcPbs\
-2bJ2XWEDDoeD7t27\
-k5aWxk033eStag6a\
-ZTZPCOE5mmlx5gEv\
-F520b9+epKQkduzY\
-UboOlyMVwlILxTm1\
-++67z/gE3uBh6OAR\
-IUSeEOI9IcRNwEDA\
-dNtDYmIi48ePZ/Xq\
-1bzwwgs0bNiw9B1X\
-WEpcXByjRo0iKyuL\
-adOmeRO0DcCDQoim\
-QogpJRQ0hBB7gLf1\
-ZYFwxrUDEyPGXs94\
-1EKBT4QQZs62fllp\
-Xu65SAiRAnQA3gDy\
-jXViYmIYNmwYX3zx\
-BbNmzWLw4MH87ne/\
-K0uzilLgcDjo0KED\
-r776KmvWrGH8+PFc\
-e+21nqpnAfcKIdoK\
-IYrNt5YQt+t79+4d\
-kgtLkZHFBoP2OpIS\
-4GTGEHqi1qlTJ66/\
-/np90c8W/MECIIRY\
-A6yRUv4dbWj6MNDE\
-UIeOHTvSsWNHXnrp\
-JTZu3MiyZctYvny5\
-WSYthQU4HA7at29P\
-jx49uOeee6hRo4a3\
-6hfQrKp5QohNVvVB\
-CJEtpfwGbTWdyMhI\
-hg4dyuTJk61qIiBU\
-qlTJWHTZ7jbVnJoP\
-TKy0d61uQwiRC0wG\
-JkspBwFjgXbGeg6H\
-g3bt2tGuXTsmTJjA\
-li1bWL58OevWrWPH\
-jh2m0UwV/lGtWjXa\
-tm1L586d6d69O/Hx\
-8b4u2c1v82V2PV2m\
-4RQ1gAcffJAZM2aE\
-VFgtZakFGY0bN+aO\
-O+4wFltipXlCCLEA\
-WCCl7I0mbp091KNV\
-q1a0atUKgPPnz7Np\
-0ybWr1/Pt99+y/ff\
-f2/7xv5QJi4ujrZt\
-29KuXTvat29PixYt\
-/P3b/BaYIoSYb3MX\
-EUIsklJuAW4GzRm3\
-f//+zJkzx+6mLSNc\
-RS1k59SGDx9uXJJe\
-JYSwfy8WIIRYAiyR\
-UsahLSwMR3tqm/4H\
-Vq1alU6dOtGpUydA\
-2/6yefNmtm/fzq5d\
-u9i1axd79uwhP7/Y\
-9F3YU7VqVZo3b07z\
-5s1p1qwZrVq1Iikp\
-qSR/i9uATGChEOJ7\
-+3pqyhRgVtHJyJEj\
-mTt3bsjks42KijIW\
-hZ+ohcrwMy4ujv79\
-+xuLy7RAUBqEEOeA\
-fwP/llJGAwOANCAJ\
-8DhzHBMTQ4cOHejQ\
-oYOrrChEU5HI5eTk\
-kJuby5EjRzh+/HhI\
-D18rV65MnTp1uPba\
-a0lMTKRJkyYuIfPi\
-COuNrWhC9mE5CJme\
-ecArQH2ABg0acNdd\
-d4VMuHoTUQuLObWQ\
-dL4dOHCgK2aak/VO\
-66ncEEJcAuY4D6SU\
-/dGGp7ehiVyM56u1\
-B0qjRo1o1KgR3bt3\
-d/ussLCQEydOcPTo\
-UY4dO+Z6PXv2LPn5\
-+eTn53Pp0iXXe+Oh\
-/6wkkVIiIyOpUqUK\
-0dHRxY4qVapQuXJl\
-1/vo6GgqV65MTEwM\
-tWvX5pprruGaa67h\
-2muv9WcOzBe/ADuA\
-5cDSchYyF0KIK1LK\
-t4FXi8rS0tJCRtQq\
-xPAzFCy1iIgIhg8f\
-biwOuJXmCyHEx8DH\
-RedSynuBTkB7TBYa\
-vBEREUFCQoIlMbwK\
-CwtNhS8iIqKYYJXj\
-38OvwGbgC7TdIeYZ\
-foODImtNALRr147k\
-5GR++OGH8u2VH4Sr\
-qIXcQsFdd91F/fr1\
-9UX7nBP4QY1zY/Qn\
-AFLKqkBr4PfOoyWa\
-NVfb7n5ERERQpUoV\
-qlSpYndT/pID7AW+\
-dx7brXS/sBshxD4p\
-5VvAo0VlI0eO5Mkn\
-nyzHXvlHhZhTCwVR\
-M3HjmFke/SgLQojz\
-aM6gWfpyKWVdNJFL\
-AhoA1wH1nK/2hlq1\
-jyvAYedxCPgZ2I82\
-nPxeCHGy/LpmGfPQ\
-iVqvXr2YNGlS0Psq\
-Vog5tWAXtaZNm3L7\
-7bcbi2114wgkQoii\
-H/9y42dSSoEmcHV1\
-RzwQ7TyqeHhvdl50\
-FPO+RPubyAMuApd0\
-7y/6+f4CcBRNwA7Z\
-6CcWNAgh/mt0xk1N\
-TWXSpEkB64PD4Sjx\
-YlK4Dj9LPacWHx/P\
-yJEjbQ9prGfEiBHG\
-oveEEPsD1oFyRAgh\
-gYPOwxKklA5+E7gC\
-4KIQouL5lVjDVHTO\
-uIMGDWL69OkBc8Yd\
-PXo0hYWFvP32274r\
-OymP4WdQb2gfN24c\
-jz76aMCSmMTHx9O3\
-b19jcdhYaeWBEKJA\
-CHFBCHFSCHFGCVrp\
-EUJ8BGwpOvfw92oL\
-0dHRpKen8/TTT9Og\
-QQO/rysPSy1oN7RH\
-R0fTs2dPhBA88sgj\
-tnTMyMCBA42T2+uE\
-EKGxdq6oKEzTn/zx\
-j38MSKM9e/akevXq\
-AGb+mx4pjzm1oI18\
-27VrV6pWrQpAt27d\
-bE8W7HA4GDZsmLE4\
-6Nw4FBWeeWjziQA0\
-adKEjh072t7ogw8+\
-6Hp/7733+u1vGq6W\
-Wqmcb/VPAw+CYyld\
-u3Y1CuceIcRCWxtV\
-KEqI0wHbbTXebmut\
-RYsWrj3GoCVhbtfO\
-PzfIIutOx2nremZO\
-UFpqUVFRxZ4+gwYN\
-Mnr4W4qJG8c7ZvUU\
-iiDAbZ63U6dONGrU\
-yLbGHnjggWJlrVu3\
-9uva2rWLuUWWKGBm\
-aQjKhYKaNWsWE79q\
-1aoxYMAAa3vmpGXL\
-lsYnTwFqgUARpAgh\
-fgRW6c7NdsBYQkxM\
-DPfee2+xchOxMqVW\
-rVrGItvdb4JyoaBm\
-zZqm5SNGjLBl76jJ\
-H8S7QohDZnUViiDB\
-bb53wIABVKtWzfJG\
-evXq5Zrb1uNvFF5l\
-qTkxUXdAi1Bgdbow\
-5cahCEWcwRXWF53H\
-xMRw//33e7mi5Dgc\
-DkaPHm36mT97hIUQ\
-xt/ySSFE+OUo8GdO\
-zZOoATz00ENl75GO\
-wYMHGzOmrxFCZHmq\
-r1AEEW7W2vDhwy0N\
-EDBw4ECPPmn+WGrV\
-q1c3rn7abqVBYETt\
-kv7EJGZ5MbyJWtu2\
-bV2BEMuKw+FgyJAh\
-xmLlxqEICZxBFvYU\
-ndetW5euXbtacu/K\
-lSvzpz/9yVh8ouhN\
-QkKCz6mg8hh6QmBE\
-7ZT+xJ+4Vyai5pbp\
-/JlnnrFkD2nXrl2N\
-AQRzhBCLynxjhSJw\
-uK3SW+XeMXToUK65\
-5hp90RF0elFYWOgz\
-+m44i5pbhAQfmXkA\
-U1Fbpj9p0aIFffr0\
-KXPHTNw4/lXmmyoU\
-gWUeOofWNm3a0Lx5\
-8zLdMDY21mwXzwto\
-wQ0A/Eq0Xa9ePWPR\
-/jJ1zE8CLmr+WGoe\
-UtX/VV8wduxYsy0Y\
-ftO8eXOjG0chaoFA\
-EWI4V+n/oy/r169f\
-me6Znp5uND52of02\
-XHpx7tw5n/dp0aKF\
-sWh/mTrmJ0EpaiZP\
-gXi03Ipnigrq1atn\
-Nh/mNyZuHO8pNw5F\
-iOL2MO7Tp0+pp2fq\
-169Penq6sfg1dFYa\
-+GepmViM20rVqRIS\
-lMPPX3/91VhUQwhx\
-CnheX/inP/3J66KC\
-J6pXr67cOBRhgxBi\
-FbCz6LxOnTq0b9++\
-NPdh0qRJxp07G4UQ\
-7wNu+51KYalJtKjD\
-thNKlhpCiDfQrfbE\
-x8fzt7/9rcQd6tev\
-n1k0jlWe6isUIcCH\
-+pOePXuW+AYjRoyg\
-bdu2xuIXna8lstTq\
-1Klj/K1vE0IEJPCb\
-7aLm/Ie4NrHWqVPH\
-51yYyVNA/7/jNrfW\
-pUuXEjsd3nTTTcYi\
-5cahCHXcRho33nhj\
-iS5u2LAhTz31lLE4\
-QwjxmfN9iSw1k6Hn\
-HrN6dhCo2No7it5U\
-qlSJ3//+914rHzhw\
-wFjkckxz+ua4rVI+\
-99xzxkQpXmncuLGx\
-aKPfFysUQYgQYgc6\
-96lmzZr55RMK2i6f\
-jIwMoqOj9cU5Qohn\
-dOclstRMRC1gKQcD\
-JWrf6k987fDfunWr\
-MRZ6K0OVJ9BtjI2N\
-jSUjI8PvyVGDb9pV\
-IcRevy5UKIKbH4ve\
-REZG+v2gHzVqlFto\
-ISd/MZy7uQocOuR9\
-Tc1k5TMgiwQQOFFz\
-y6l4yy23eK2cl5dn\
-zGkYJ6V0fUNCiAvA\
-WH2FNm3a8Pjjj/vV\
-GcO9I6WUL/l1oUIR\
-pEgp44Gbi84vX77M\
-zz//7PO6Tp06maXa\
-+5sQ4kNDmZvqbd26\
-1et9b775ZmNRxRY1\
-gI0bi40I3YI6CSHm\
-AW6pdMaMGcPgwYN9\
-3nvt2rXGouellE/4\
-vFChCEKklPWA2UBs\
-UdmOHTu4csV7kNnm\
-zZszffp0437RH4QQ\
-fzWpnlT05sqVK/z4\
-448mVTQaNmxo3DN6\
-UAiR47UzFhIQURNC\
-5KKbV6tdu7ZP03jD\
-hg3GomJOaUKIccA6\
-fdlLL71E586dvd57\
-/vz5ZvN2k6WUi5x5\
-MRWKkEBK+TjaJHxv\
-fflXX3lPrVG7dm3e\
-e+89YmNjjR8VEzQp\
-5QDgd0XnvgSzS5cu\
-xqKAehYEMgnnFv3J\
-rbfe6rVyVlYWp0+7\
-Rf69UUpZPFodDEfb\
-lwZom9SnTZvGDTfc\
-4PHeZ86cIT093Wyy\
-cwCwR0o5xpnaTaEI\
-SqSUw6WUe9BW7t1W\
-BObPn89bb73l8doq\
-Vaowc+ZMrr32WuNH\
-fxRCfGpyidvO9s8/\
-/9xr3+666y5j0RKv\
-F1hMIEVttf7k7rvv\
-9lo5Pz+f+fPnG4vH\
-GguEELsBt41qMTEx\
-vPfee15Tee3du5c/\
-/vGPZhOelYE30MRt\
-lNdOKhQBRkrZW0r5\
-NTALKBbDe9GiRTz3\
-3HMeN5tHRETw+uuv\
-mz30nxNC/MekvYHo\
-vA8KCgr45JNPPPav\
-evXqRoPlRKCDRARS\
-1Nz+J7p06eIxwm0R\
-c+bMMa6Cpkgpi+Xn\
-cj5d3Han16xZk/nz\
-55utwrjYsmULPXv2\
-5KOPPjL7+HrgX1LK\
-HVLKEV47qlDYjJSy\
-nZTyf4FMdCJTxIED\
-B3j00UcZN26cR0Fz\
-OBy8/vrrdOvWzfjR\
-NCHEqx6afkF/smrV\
-Ko4fP+6xnykpKcY5\
-uh2e6tpFwETNOa/2\
-TdF5ZGSkz423R44c\
-YcWKFcbi583qCiFm\
-A3q/GmrXrs3cuXPN\
-lqtdXLhwgWeeeYYx\
-Y8Zw+PBhsyotgfel\
-lBullEO9dlihsBgp\
-ZT0p5d/R5o6LzSuf\
-OXOGl156iW7durF8\
-+XKP94mOjuadd96h\
-d+/exo/+I4T4s4e2\
-/4JugeDSpUv8/e9/\
-99pfk/k0U4vBTqwP\
-+O8FKeV96LZz5OTk\
-cM8993i9plmzZmRm\
-Zhp3IUwQQrzsoY1X\
-MEx2Xrx4kUceeYRv\
-vvnG7BIXUVFRDB48\
-mDFjxnhLLPEN8IZK\
-n6ewEyllAtp88asY\
-5sxAc9mYNWsWM2bM\
-8OkIW7VqVWbOnGm2\
-BWq+EKJ4qiit/XuB\
-xfqyiRMn8q9/eY7O\
-5XA42LBhgzEtXiMh\
-xD6vHbSYQA4/cY6t\
-XZP6TZo08WpFAeza\
-tYvp06cbi1+SUpqa\
-eUKI54Dn9GVFE6M9\
-evTw2taVK1f44IMP\
-uPPOO3nttdc4c+aM\
-WbU7gAVSym/MhsIK\
-RVmQUiZKKZ9BW9HM\
-wETQPvvsM7p168Zr\
-r73mU9Bq1KjBnDlz\
-zARtLuBt5OE26tm+\
-fTvvvfee17a6d+9u\
-FLTNgRY0CLCoOXGb\
-/fdn3+bbb7/Njh3F\
-huYfSylNI0U65wfc\
-FhWioqKYOnWqX6nE\
-Ll26xMyZM+nUqRNT\
-p07l/PnzZtU6Ah9J\
-KddKKa3NeKGocEgp\
-60spn0UTs4lAsRRO\
-mzZtYsCAAfz5z3/m\
-4MGDPu9Zt25d5s+f\
-b7YtcZYQYogQosDs\
-OinlB4ArzEdBQQHj\
-x483zm8XwySw5Gyf\
-nbSBgA4/AaSUbdBt\
-m8rLy+OOO+7wZBW5\
-aNGiBZ9++qlZGvs+\
-zsw6Zm2lAe8ay5cu\
-Xcr48ePJy8vzq8/x\
-8fGMHj2aYcOGGaN7\
-6NkJvAnME0Kc8FRJ\
-odAjpWyAZjFNAEwj\
-PezZs4fJkyd7nTMz\
-0rVrVyZNmmSWIf1d\
-IYTHVX0p5RzgQX3Z\
-jBkzmDx5stf27rzz\
-TqMldwFoLISwPc+n\
-kYCLGoCUcj3gsodn\
-z57Niy++6OUKjV69\
-ejFlyhTjHs8TwBhP\
-c1zOJelin+3du5cx\
-Y8awa9cuv/tdu3Zt\
-Hn30UR544AFvkUbO\
-osWNnyeE2Oz3zRUV\
-CillUzTxmICHEVNO\
-Tg7Tp0/n//7v/ygs\
-LDSrUozIyEieeeYZ\
-0tLSzD6eIYQY46E/\
-ldEsK7dRR1ZWFg8/\
-/DCXL1/22u6CBQuM\
-rhwe573tprxEbQjw\
-v0XnBQUF9OjRgz17\
-fEcn6d+/P5MmTTIL\
-+f2yEGKCh/b6ojkp\
-NtSXX7x4keeff57F\
-ixebXeaRxMRERo8e\
-zYABA7xZbgBfA1OE\
-EJklakARtjinTMYC\
-d3qqs3PnTqZPn86y\
-Zct8JjfRk5iYyLRp\
-0zzNU2cYom7o+3QP\
-mldBB335l19+yWOP\
-PeZzu9Wtt97KggUL\
-jMVNA7k1Sk+5iBqA\
-lDILSCk6X7lyJaNG\
-+efr+uCDD/Lyy6YP\
-gSxgstlwVEop0J5E\
-xSZHP/zwQ1555RVP\
-c2ceqV69OoMHDyY1\
-NdVXHsRv0cStmDex\
-IvyRUtZB27ucBniM\
-u7Vjxw6mT5/OF198\
-USIxA82VIiMjw2y4\
-WQAMF0LMNelXI7SI\
-N8Wst6VLlzJ27Fif\
-82gA//73v41pK/8h\
-hHi6JP23kvIUtWJL\
-xsOHD2f16tUernBn\
-wIABvPjii54spVVo\
-ImImbs8DxaJy/PLL\
-L7zyyissXbrUr/b1\
-REZG0rNnT9LS0nzF\
-itsNzEAbmgZ8rkER\
-WKSUd6OJWSpeFuW2\
-b9/O9OnT+fLLL0vc\
-Rs2aNXn22Wc9+Xyu\
-Qtv6VGyjs5RyNFre\
-j2IsXryYcePG+SVo\
-SUlJLFlS7GfWWgjx\
-nc+LbaLcRA1ASvk2\
-4Mpr/9NPP9G7d2+/\
-5w8aNWrE1KlTSUpK\
-8lQlC3gLWCqEcJlh\
-ztXKt9Bt0i0iOzub\
-CRMm+LW6ZEabNm0Y\
-OXIkXbt29Rbf7QIw\
-E03cvvVUSRF6SCmv\
-A/qh+Zh5DEdTWFhI\
-dnY2s2fPJisrq8Tt\
-RERE8MADD/DUU09R\
-rVo1syrFrCWnG1Q/\
-oBtQbGhx9epV3n33\
-XSZPnuzXbzAiIoLZ\
-s2cb8yG8LYQotgwa\
-SMpb1JIAt+BmL774\
-IrNn+78SHBUVxZNP\
-Pkl6erqvjNH/BT5D\
-E7jtzvhT/0b7kt24\
-dOkSb775Jv/617+4\
-evWq333Rc9111zFi\
-xAgGDhxoTGRh5Afg\
-UzRHyIBFB1VYh5Qy\
-Ge3vqA/QxlvdkydP\
-snDhQhYsWFDqB2dy\
-cjIvv/yyWVh60BKc\
-DBdC/K+UsibQC81S\
-TMJEyIrIzs7m5Zdf\
-Zu9e/+OlPvLII2Yh\
-wDsJIbL9vokNlKuo\
-gWsrhmvf2eXLl7n/\
-/vv5/vuS/b6Tk5MZ\
-M2YM3bp18yVuoA0D\
-vwGWAzForhjFlCcn\
-J4dXX32V7OzSf0fV\
-qlVj0KBBpKammkVF\
-MLIVbUg+Xwix01dl\
-RfkhpWwH9Ad6AJ5D\
-wjhZv349c+bMYcWK\
-FT4n3j0RFxfHE088\
-wdChQz2NAhYC/3T2\
-6W7gNl/3/Pnnn3nl\
-lVd8hioy0qpVKxYs\
-WGDc5zlFCFHucQmD\
-QdQi0BwOGxSVHT58\
-mD59+vj0XTOjadOm\
-PPLII/Tq1cv4H+6N\
-NcBmTCZMQQtY+Y9/\
-/MMsxpvfOBwOunfv\
-TlpamqcnrJEf0Pb7\
-fQV8JYT4pdSNK8qM\
-M85eQ7Q5sm5AE1/X\
-nD17lo8//ph58+aR\
-k1P6hcDY2FhSU1NJ\
-S0vzlI3tILAUzVJM\
-NKtgZPfu3Xz00UfM\
-mjXLp7uGkbi4OD77\
-7DNjBvbvhRAly/Zi\
-E+UuauAKQucWniQ7\
-O5u0tDS/59eM1KtX\
-j7vvvpvOnTvTtm1b\
-f7O5n0b7AzH9crKz\
-s5k8eTLbt28vVZ+K\
-aNWqFX379qVHjx4l\
-yVu6CW0IPQ/Yoxx8\
-7UVK2QrNxeF24CZ0\
-G7u9ceHCBb7++mtW\
-rFjBV199xcWLpc8K\
-Fxsby/Dhw0lPT/eW\
-WnIDPoa8AFJKtmzZ\
-wooVK1ixYgX79+8v\
-db+mTZvGH/7wB2Nx\
-PyGE55hEASQoRA1A\
-Svk0hvDc06ZNY+rU\
-qWW+d0xMDB06dKBz\
-586kpKT4Mwz0iJSS\
-5cuXM2XKlDI9fUGz\
-3tq2bUuvXr3o3r27\
-XzlRdex2HluLDiHE\
-T2XqUAVFSlkbbVK/\
-A9re3hsA73GxdJw6\
-dYovv/ySFStWsHr1\
-6hJbPkZiYmJITU31\
-JWanAa+ZwS9evMi6\
-detYuXIlX375Jb/8\
-UnZjf9CgQWa5dp8Q\
-QgRNmsmgETUAKeUM\
-dAEfpZSkp6fz9ddf\
-W9pOkyZNSElJISUl\
-hbZt21K5cuUS36Ow\
-sJBPP/2U119/ndzc\
-3DL3yeFw0KFDB3r3\
-7k1KSkqpMs+j/aH/\
-BBwwO/QrwBUNKWUN\
-oJnhaOB8LdHTBCA3\
-N5cVK1awfPlyNm3a\
-5Jf7gy+io6NJTU3l\
-oYceKukDzsWePXvI\
-ysoiKyuLb7/9tswC\
-qycpKYmFCxca3ag+\
-EEL43lAdQIJK1ACk\
-lBsA136LvLw8Hnro\
-IbNkKZYQHR1Njx49\
-GDJkiM+IIWbk5+fz\
-/vvv89Zbb5XYedcb\
-TZs25fbbb+f222+n\
-Xbt2xMXFWXHbU8Bh\
-4Fe07VwlehVC5FvR\
-CatwzsfWBmo5X83e\
-X4s2dPQYS8ofjh8/\
-zqZNm9i0aRPr1683\
-ZiQrEw6Hg/79+zN2\
-7FhfTtymXLhwgU8/\
-/ZR58+aZBX6whPbt\
-2/P2229TtarbPvuj\
-aPs7/dtEHSCCUdR6\
-o0X3dHH58mUee+yx\
-Eq/QlJSkpCSGDBlC\
-3759fW1/KsapU6eY\
-Nm0ac+fOteSprcfh\
-cHDDDTfQvn17brnl\
-Flq2bFmmIXQZuIQm\
-ckVHkehdQPNcv6o7\
-jOeePotCC6FeGS3M\
-jq/3ldGGhrUw8TO0\
-gsLCQnbu3Ml3333H\
-pk2b+O6770rtfuGL\
-zp07M27cOJo2bVri\
-a3fs2MGcOXPIzMz0\
-OzhDaejTpw+TJk0y\
-m5ceFIxxBYNO1ACk\
-lKnAf/RlBQUFPPnk\
-k2bey5YTHx/PsGHD\
-SE1NpUYNr9MWxdi7\
-dy8TJ04slXd4SYiP\
-j6dFixa0bNnSdTRt\
-2tTfBRGFk/z8fPbv\
-38++ffvYtWsXmzZt\
-YsuWLZZa3WbUr1+f\
-iRMn0q5dO9+VdVy8\
-eJHPPvuMuXPnsm2b\
-/ak0R48ezdNPP23m\
-JvUXIYT3MLjlRFCK\
-Gphv4ygsLOT55583\
-S8hiC9HR0QwcOJC0\
-tDS/s10XsWjRIv7n\
-f/6HS5cu2dS74jgc\
-DhITE0lMTKRu3brF\
-jsTExAopegUFBRw+\
-fJh9+/YVO44ePVrq\
-FfbS0rVrVzIyMjzt\
-BDBl9+7dzJ07l8WL\
-F3Pu3Dkbe6cRERHB\
-hAkTGDZsmNnHDwsh\
-3rG9E6UkaEUNwJkT\
-4ANjeUZGBu+8806J\
-N/2WFofDQefOnbn3\
-3nvp0qULlSoVC0Zq\
-yk8//cRjjz3Gvn0B\
-D/5pihCCGjVqEBcX\
-R9WqVd1eiw5judmr\
-l+1fAePKlSucOnWK\
-U6dOcfr0add743Hi\
-xAl+/vnnUju8WonD\
-4eCZZ54hPT3dr/qX\
-L1/m888/Z+7cuWbJ\
-vW2jcuXK/POf/zRL\
-0AIwQAjxccA6UwqC\
-WtTAfOM7wOrVqxk3\
-bhxHjhwxuco+qlWr\
-Ro8ePejbty9t27b1\
-uXvhwoULPP7446xc\
-uTJAPbSfmJgYNxGs\
-UqUKDocDh8NBZGSk\
-673+XP8aERHhOr96\
-9SqXL18udly5csX0\
-/eXLlzl9+rTtw0Or\
-qVSpEu+++y4dOnTw\
-WXf//v3MmzePRYsW\
-lcoBvSykpKTw7LPP\
-0qxZM+NHPwDPegrI\
-GkwEvaiBKwbV22gr\
-WS7OnTvHK6+8wqJF\
-AU0r6KJu3bp06dKF\
-lJQU2rVr53GPZ15e\
-Hv369SuzX5siNHE4\
-HMyYMYOuXbt6rPPz\
-zz+TnZ3N8uXLWbt2\
-bcBGIUU0b96c8ePH\
-k5KSYvbxMrT9pJ5z\
-4wURISFq4PLwno1J\
-PKqVK1fyl7/8xWs+\
-QruJioqidevWpKSk\
-cMstt1CvXj0SEhJc\
-W7V27NjBgAEDLPUb\
-UoQGr776KoMHD3ad\
-X7lyhaNHj7Jz506y\
-s7PJzs62bXXVFwkJ\
-CYwdO5b77rvP07TC\
-bCFEqtkHwUrIiFoR\
-Usp/AsXyFJ45c4aJ\
-EyeyePHioJg/Ae0J\
-XadOHfLy8gI+jFAE\
-F1WrVqVWrVqcP3+e\
-kydPBtwSMxITE8Oo\
-UaNIT0/3FkXmWSHE\
-a4HslxWEnKiBKy7U\
-O3bG/10AAAUfSURB\
-VJg4VB47doxZs2Yx\
-b948n+nDFIqKRkRE\
-BAMHDuTxxx8nISHB\
-U7U30HLbhmSkmJAU\
-NQApZRxaXsTRZp/n\
-5eWxcOFC3n//fQ4d\
-OhTYzikUQUaVKlXo\
-168fI0aMoHHjxp6q\
-fU0Y5NQIWVErwhnF\
-dhoeAuAVFBSwbNky\
-Fi1axOrVqy339lco\
-gpm6desybNgw7r//\
-frP8BUVsBCYJIT4M\
-YNdsI+RFDUBKGQsM\
-QcvS08JTvVOnTrF0\
-6VIyMzPZvHlzuc9r\
-KBR20a5dO1JTU+na\
-tau3uIJHgeeEEN5T\
-r4cYYSFqeqSUg9HE\
-ra23eocOHWLJkiVk\
-ZmaWKPenQhGsVKpU\
-iT59+pCamuotbwdA\
-LlrKyBnBthndCsJO\
-1Ipw5vocC3TyVXfn\
-zp1kZmby2Wefqfk3\
-RUgRERFB69at6dmz\
-J7169eJ3v/O6x38z\
-MBUt4U/Y+haFragV\
-IaVshhaCeQA+YslL\
-Kdm8eTOZmZksXbqU\
-U6dOBaSPCkVJ0AtZ\
-9+7dva1iFpGFtgDw\
-aQC6V+6EvajpkVLe\
-iiZw9wKNvNUtKChg\
-9erVLFmyhG+++aZc\
-HXsVilII2Sl+S8O4\
-1f4eBg8VStT0SCnv\
-QhO4vvgRQDAnJ4d1\
-69axdu1a1q1bp5xp\
-FbYTFxdH27Zt6dix\
-I/fcc4+/ASS/R/Mz\
-myeEsD+cRxBSYUVN\
-j3P+7c/4yI2oq8/O\
-nTtdArd+/fqAhINR\
-hDcxMTG0adOG9u3b\
-c9ttt5GUlORvRrQf\
-0XLaLhRCBC6cR5Ci\
-RE2HlNKBZr2NAkx3\
-9ppRWFjIDz/8wLp1\
-61izZg0bN260NRKp\
-IjyIjo6mdevWLhG7\
-8cYbS5LWUQmZB5So\
-ecCZwX0wcA/QDkOE\
-EG8UFBSwbds21qxZ\
-w7Zt29i5cyeHDh1S\
-fnEVmJiYGFq2bEly\
-cjJJSUkkJyfTrFkz\
-IiMjS3Kbn4AlwIdC\
-iNInoQ1zlKj5iZTy\
-FuAuoCd+DlP15OXl\
-sWvXLnbu3Ol2nD59\
-2o7uKsqRGjVquIlX\
-cnIy119/fWmCax4H\
-dgArgBXKIvMPJWql\
-REp5G9AZLVt3EuBz\
-OcqM48ePFxO6nJyc\
-gIYBV5ScqlWrcv31\
-19OgQQMaNGhAw4YN\
-Xec+fMW8cQJNxL4C\
-VgkhvrGswxUIJWoW\
-IaW8A82SuwtN5EqV\
-uBO0OboDBw6Qk5PD\
-kSNHyM3N5ejRo25H\
-sIRXCkciIyOpVasW\
-CQkJ1K5dm9q1a5OQ\
-kED9+vVdwlWzpt+5\
-jr1xCi2ibBawUgix\
-yoqbVnSUqNmElLIL\
-0AbN4bcJkAzEWnRv\
-Tp486RK4I0eOFHs9\
-duwY+flBlaaz3ImN\
-jS0mVEWvRSKWkJBA\
-fHy8zzDtpeAXNCts\
-E5pn/2YhhD1JOis4\
-StQCiJTy92giV3Q0\
-QrPqbOH8+fOcO3eO\
-c+fOeXzv7fP8/HwK\
-Cgq4evUqBQUFli90\
-REREEBUV5ToqVark\
-dl6WstjYWDehqlWr\
-lrdgiFZSgLYyuR+n\
-eKEJ2P5ANK5Qolbu\
-OOPC6YUumTLM0dlJ\
-QUGBm8gVFBRw5coV\
-tzL9q8Ph8CpEJXBf\
-CDYKgRw04coBduuO\
-HCFEYHPuKdxQohak\
-SCmvARoA9Z1HPd3R\
-CE301PdnPVeBk8BB\
-4AhaeJ4jzmM/sA9N\
-uFRgviBF/ShCGCll\
-XdzFTi9+ddGELyBj\
-rhDgHL8JlF6o3MpC\
-JWOSwjNK1MIcKWUU\
-UB2o5nzVvzcr07+P\
-BiJ9HCVJ+V4AXNYd\
-VwznVh7n0YmXEOJC\
-CfqpCGGUqCnKjJTS\
-k+C5iZgasikCwf8H\
-M39JiWNpuMEAAAAA\
-SUVORK5CYII=\x22/>\x0a\
-    </defs>\x0a</sv\
-g>\x0a\
-"
-
-qt_resource_name = b"\
-\x00\x03\
-\x00\x00i\x82\
-\x00c\
-\x00a\x00r\
-\x00\x08\
-\x08UW\xe7\
-\x00c\
-\x00a\x00r\x002\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x09\x85Z\x07\
-\x00c\
-\x00a\x00r\x00.\x00s\x00v\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9a\xc6\x10\xb0\xd4\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x87\xe9\
-\x00\x00\x01\x9a\xc5\xa7*\x89\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
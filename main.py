@@ -1,83 +1,81 @@
-import json
-from dataclasses import dataclass, field
+import time
 from pathlib import Path
-from typing import List
 
-from PySide6.QtCore import QLocale, Signal
-from PySide6.QtGui import QDoubleValidator
+# Imported before everything else so the timing (when enabled) includes the imports
+from startup_timing import startup_timer
+
+from PySide6.QtCore import QLocale, Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QDoubleValidator, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
+    QCheckBox,
     QComboBox,
     QDialog,
     QFileDialog,
     QFormLayout,
     QHBoxLayout,
     QHeaderView,
+    QLabel,
     QLineEdit,
+    QListWidget,
+    QListWidgetItem,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QSpinBox,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+startup_timer.mark("import PySide6")
+
 # test altro commento
 import file_folder_manager
+from car_data import CarDimensions, CarInfo, build_car_dimensions
+from folder_worker import FolderCreationWorker
+from spec_cache import load_test_spec
+from test_builder import (
+    build_test,
+    count_test_matrix,
+    expand_template,
+    expand_test_matrix,
+    load_json,
+)
+from test_record import TestRecord
+from test_store import TestStore
+from test_table import DELETE_COLUMN, DeleteButtonDelegate, TestTableModel
+
+startup_timer.mark("import modules")
 
 # Imports the main UI from the window.py file that is generated from window.ui
 from window import Ui_MainWindow
 
-test_list = []
-
-
-# Data structure definition for easier management of the car dimensions to create the .mme file
-@dataclass
-class Point:
-    x: float
-    y: float
+startup_timer.mark("import window")
 
-
-@dataclass
-class CarProfile:
-    front: List[Point] = field(default_factory=list)
-    left: List[Point] = field(default_factory=list)
-    back: List[Point] = field(default_factory=list)
-    right: List[Point] = field(default_factory=list)
-
-
-@dataclass
-class CarDimensions:
-    length: float
-    width: float
-    overhang: float
-    profile: CarProfile
-
-
-@dataclass
-class CarInfo:
-    year: str
-    number: str
-    make: str
-    model: str
-    oem: str
-    vin: str
-    sw_version: str
+# All the tests added by the user, each one with its own id
+test_store = TestStore()
 
 
 # MainWindow class that manages the whole program
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        startup_timer.mark("QMainWindow")
+
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
         self.setFixedSize(self.size())
+        startup_timer.mark("setupUi")
+
+        # Thread and worker of the folder creation, only while it's running
+        self.creation_thread = None
+        self.creation_worker = None
 
         # Loading the json for the test names for the two combo boxes
-        with open("test_types.json", "r", encoding="utf-8") as f:
-            self.database_test_types = json.load(f)
+        self.database_test_types = load_json(Path("test_types.json"))
         # Populating the first combo box
         for entry in self.database_test_types["test_list"]:
             self.ui.combo_test_type.addItem(entry["type"], entry["tests"])
@@ -89,25 +87,60 @@ class MainWindow(QMainWindow):
         if self.ui.combo_test_type.count() > 0:
             self.test_type_selection(self.ui.combo_test_type.currentIndex())
 
-        table = self.ui.tableWidget
+        # The spec of a test is loaded only when the test is selected
+        self.ui.combo_test_name.currentTextChanged.connect(self.test_name_selection)
+        startup_timer.mark("test types combo boxes")
+
+        # The table shows the test list through a model, the delete buttons in the last
+        # column are drawn by a delegate
+        table = self.ui.tableView
+        self.test_model = TestTableModel(test_store, self)
+        table.setModel(self.test_model)
+
+        self.delete_delegate = DeleteButtonDelegate(table)
+        self.delete_delegate.delete_clicked.connect(self.delete_test)
+        table.setItemDelegateForColumn(DELETE_COLUMN, self.delete_delegate)
 
-        table.setEditTriggers(QTableWidget.EditTrigger.AllEditTriggers.NoEditTriggers)
+        table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         table.horizontalHeader().setVisible(False)
         table.verticalHeader().setVisible(False)
 
+        for col in range(DELETE_COLUMN):
+            table.horizontalHeader().setSectionResizeMode(
+                col, QHeaderView.ResizeMode.Stretch
+            )
+
+        # Set the last column to fixed width
+        table.horizontalHeader().setSectionResizeMode(
+            DELETE_COLUMN, QHeaderView.ResizeMode.Fixed
+        )
+        table.setColumnWidth(DELETE_COLUMN, 30)
+
         # Making the text boxes only accept floats values
         self.apply_float_validators()
-
-        # Loading the database with all the test spec in the folder /test_json
-        self.database_test_specs = test_json_loading(Path("test_json"))
+        startup_timer.mark("apply_float_validators")
 
         # Loading the robustness
-        with open("robustness.json", "r", encoding="utf-8") as f:
-            self.database_robustness = json.load(f)
+        self.database_robustness = load_json(Path("robustness.json"))
+        startup_timer.mark("robustness.json")
+
+        # The car image in the dimension tab is loaded from car2.svg only the first time
+        # the tab is shown, so the startup doesn't have to wait for it
+        self.ui.tabWidget.currentChanged.connect(self.tab_selection)
+        self.tab_selection(self.ui.tabWidget.currentIndex())
 
         # Conneting the clicking of the two buttons with the functions
         self.ui.button_add_new_test.clicked.connect(self.add_new_test_button_press)
+        self.ui.button_import_template.clicked.connect(self.import_template_press)
         self.ui.button_create_folders.clicked.connect(self.create_folder_press)
+        startup_timer.mark("signals")
+
+    def tab_selection(self, index):
+        if self.ui.tabWidget.widget(index) is not self.ui.tab_dimensions:
+            return
+
+        if self.ui.label.pixmap().isNull():
+            self.ui.label.setPixmap(QPixmap("car2.svg"))
 
     # Populating the second combo box everytime the first one is selected
     def test_type_selection(self, index):
@@ -117,6 +150,17 @@ class MainWindow(QMainWindow):
         for test_name in tests:
             self.ui.combo_test_name.addItem(test_name)
 
+    # Loading the spec of the selected test (from the test_json folder), the specs
+    # already loaded are kept in memory by load_test_spec
+    def test_name_selection(self, test_name):
+        if not test_name:
+            return
+
+        try:
+            load_test_spec(Path("test_json"), test_name)
+        except (OSError, ValueError) as error:
+            self.ui.statusbar.showMessage(str(error))
+
     # Creating the second window when you press the New Test Button
     def add_new_test_button_press(self):
         selected_test_name = self.ui.combo_test_name.currentText()
@@ -125,7 +169,11 @@ class MainWindow(QMainWindow):
         if not selected_test_name:
             return
 
-        spec = self.database_test_specs[selected_test_name]
+        try:
+            spec = load_test_spec(Path("test_json"), selected_test_name)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self, "Warning", str(error))
+            return
 
         # Destroy previous window if needed
         if hasattr(self, "test_window"):
@@ -136,62 +184,95 @@ class MainWindow(QMainWindow):
         )
 
         self.test_window.test_created.connect(self.on_test_created)
+        self.test_window.tests_created.connect(self.on_tests_created)
         self.test_window.exec()
 
-    # Appending the new test to the list and updating the table to show the new added test
-    def on_test_created(self, test: dict):
-        test_list.append(test)
-        self.refresh_table()
-
-    def refresh_table(self):
-        table = self.ui.tableWidget
-        table.clearContents()
-        # Max number of column in the table, 10 seemed like a good compromise, can be increased
-        max_cols = 10
-
-        table.setRowCount(len(test_list))
-        table.setColumnCount(max_cols)
-
-        # The list is reversed so the new tests are at the top
-        for row_index, test in enumerate(reversed(test_list)):
-            # In the test dictionary is present both the actual data that needs to be added
-            # and a "_ui" part that manages what is shown in the table
-            for col_index, column in enumerate(test["_ui"]["columns"]):
-                item = QTableWidgetItem(column[1])
-                table.setItem(row_index, col_index, item)
-
-            # Adding the delete button at the end and managing the deletion
-            button_delete_test = QPushButton("X")
-            button_delete_test.setFixedWidth(30)
-
-            button_delete_test.clicked.connect(
-                lambda _, btn=button_delete_test: self.delete_test(btn)
-            )
-
-            table.setCellWidget(row_index, max_cols - 1, button_delete_test)
+    # Appending the new test to the list, the model adds the row at the top of the table.
+    # If the same test is already in the list its runs can be added to that one instead
+    def on_test_created(self, test: TestRecord):
+        if test_store.find(test) is not None and self.ask_merge_duplicates(
+            "This test is already in the list."
+        ):
+            test_store.merge_duplicates([test])
+            self.test_model.repetitions_changed()
+            return
 
-        for col in range(max_cols - 1):
-            table.horizontalHeader().setSectionResizeMode(
-                col, QHeaderView.ResizeMode.Stretch
-            )
+        self.test_model.append_test(test)
+
+    # Inserting all the tests generated by the matrix mode of the dialog
+    def on_tests_created(self, tests):
+        self.add_tests(tests)
+
+    # Inserting many tests at once, the model is updated only once and the table is
+    # not repainted (or sorted) until the whole batch is inserted
+    def add_tests(self, tests) -> int:
+        # All the tests are needed to look for the duplicates
+        tests = list(tests)
+        duplicates = test_store.count_duplicates(tests)
+        if duplicates and self.ask_merge_duplicates(
+            f"{duplicates} of the {len(tests)} tests are already in the list "
+            "or repeated."
+        ):
+            tests, added_runs = test_store.merge_duplicates(tests)
+            if added_runs:
+                self.test_model.repetitions_changed()
+
+        table = self.ui.tableView
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+
+        try:
+            count = self.test_model.append_tests(tests)
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
+
+        return count
+
+    # The same test inserted more than once is created as more runs anyway ("_2", "_3"
+    # folders), merging it keeps the list shorter and shows the number of runs
+    def ask_merge_duplicates(self, message: str) -> bool:
+        answer = QMessageBox.question(
+            self,
+            "Duplicate tests",
+            f"{message}\nDo you want to add them as run repetitions of the test already "
+            "in the list instead of inserting them again?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        return answer == QMessageBox.StandardButton.Yes
 
-        # Set the last column to fixed width
-        table.horizontalHeader().setSectionResizeMode(
-            max_cols - 1, QHeaderView.ResizeMode.Fixed
+    # Adding all the tests of a campaign template (see the templates folder)
+    def import_template_press(self):
+        template_path, _ = QFileDialog.getOpenFileName(
+            self, "Select the campaign template", "templates", "Template (*.json)"
         )
-        table.setColumnWidth(max_cols - 1, 30)
+        if not template_path:
+            return
 
-    def delete_test(self, button: QPushButton):
-        table = self.ui.tableWidget
-        index_to_delete = table.indexAt(button.pos())
+        try:
+            template = load_json(Path(template_path))
+            # Loading only the specs used in the template
+            specs = {
+                entry["name"]: load_test_spec(Path("test_json"), entry["name"])
+                for entry in template["tests"]
+            }
+            tests = expand_template(
+                template, specs, self.database_robustness, self.database_test_types
+            )
+            count = self.add_tests(tests)
+        except (OSError, KeyError, TypeError, ValueError) as error:
+            QMessageBox.warning(
+                self, "Warning", f"The template could not be imported: {error}"
+            )
+            return
 
-        displayed_row = index_to_delete.row()
+        self.ui.statusbar.showMessage(
+            f"{count} tests imported from {Path(template_path).name}."
+        )
 
-        # The items are displayed backwards in the table but are "normal" in the data list
-        # so this is why we need to do this
-        data_row = len(test_list) - 1 - displayed_row
-        del test_list[data_row]
-        self.refresh_table()
+    def delete_test(self, row: int):
+        self.test_model.remove_row(row)
 
     def create_folder_press(self):
         for text_box in self.findChildren(QLineEdit):
@@ -210,71 +291,158 @@ class MainWindow(QMainWindow):
             return
         else:
             main_folder = Path(main_folder_string)
-            # Creation of the folders
-            file_folder_manager.folder_creations(
-                main_folder, test_list, self.loadDimensions(), self.loadInfo()
+            info = self.loadInfo()
+            # Creation of the folders, a new campaign is created in a temporary folder
+            # and renamed at the end so a failure doesn't leave half of the folders
+            staged = not file_folder_manager.campaign_folder(main_folder, info).exists()
+
+            # If the campaign already exists the tests can be matched with the folders
+            # created before (using the manifest of the campaign) instead of being
+            # created again with the _2, _3 suffixes
+            incremental = False
+            if not staged:
+                answer = QMessageBox.question(
+                    self,
+                    "Existing campaign",
+                    "The folder of this campaign already exists.\n"
+                    "Do you want to update it? Only the new or changed tests will be "
+                    "written.\nSelecting No creates all the tests again in new folders.",
+                    QMessageBox.StandardButton.Yes
+                    | QMessageBox.StandardButton.No
+                    | QMessageBox.StandardButton.Cancel,
+                )
+                if answer == QMessageBox.StandardButton.Cancel:
+                    return
+                incremental = answer == QMessageBox.StandardButton.Yes
+
+            # The folders are written by a worker thread so the window stays responsive,
+            # the list of tests is copied so the table can be changed in the meantime
+            self.start_folder_creation(
+                FolderCreationWorker(
+                    main_folder,
+                    list(test_store),
+                    self.loadDimensions(),
+                    info,
+                    staged=staged,
+                    incremental=incremental,
+                )
             )
-            QMessageBox.information(self, "Completed.", "The folders were created.")
 
-    def loadDimensions(self) -> CarDimensions:
-        profile = CarProfile()
-        SECTIONS = ("front", "side", "back")
+    def start_folder_creation(self, worker: FolderCreationWorker):
+        self.ui.button_create_folders.setEnabled(False)
 
-        # Parsing of the text in the dimension tab, the textboxes are named like
-        # x1Front,y1Front etc..., so that text is for that
+        self.creation_thread = QThread(self)
+        self.creation_worker = worker
+        worker.moveToThread(self.creation_thread)
 
-        # Front
-        front_profile = []
-        for i in range(1, 8):
-            x_text = getattr(self.ui, f"x{i}{'Front'}")
-            y_text = getattr(self.ui, f"y{i}{'Front'}")
-            x = float(x_text.text().strip()) * 1000.0
-            y = float(y_text.text().strip()) * 1000.0
-            front_profile.append(Point(x, y))
-
-        front_profile.reverse()
-        profile.front = front_profile
-
-        # Right
-        right_profile = []
-        for i in range(1, 6):
-            x_text = getattr(self.ui, f"x{i}{'Side'}")
-            y_text = getattr(self.ui, f"y{i}{'Side'}")
-            x = float(x_text.text().strip()) * 1000.0
-            y = float(y_text.text().strip()) * 1000.0
-            right_profile.append(Point(x, y))
-
-        right_profile.reverse()
-        profile.right = right_profile
-
-        # Left
-        left_profile = []
-        for point in profile.right:
-            left_profile.append(Point(point.x, -point.y))
-
-        left_profile.reverse()
-        profile.left = left_profile
-
-        # Back
-        back_profile = []
-        for i in range(1, 8):
-            x_text = getattr(self.ui, f"x{i}{'Back'}")
-            y_text = getattr(self.ui, f"y{i}{'Back'}")
-            x = float(x_text.text().strip()) * 1000.0
-            y = float(y_text.text().strip()) * 1000.0
-            back_profile.append(Point(x, y))
-
-        profile.back = back_profile
-
-        # Same thing for the other dimentions
-        output = CarDimensions(
-            length=float(self.ui.textLenght.text().strip()) * 1000.0,
-            width=float(self.ui.textWidth.text().strip()) * 1000.0,
-            overhang=float(self.ui.textOverhang.text().strip()) * 1000.0,
-            profile=profile,
+        # Every run of a test is a folder, and the progress is counted by folder
+        runs = sum(test.get("repetitions", 1) for test in worker.test_list)
+        self.creation_progress = QProgressDialog(
+            "Creating the folders...", "Cancel", 0, runs, self
+        )
+        self.creation_progress.setWindowTitle("Folder creation")
+        self.creation_progress.setMinimumDuration(0)
+        self.creation_progress.setAutoClose(False)
+        self.creation_progress.setAutoReset(False)
+        # The cancel button only asks the worker to stop, the creation ends after the
+        # test that is being written. The connection is direct because the thread of the
+        # worker is busy with the creation and would never receive a queued call
+        self.creation_progress.canceled.connect(
+            worker.cancel, Qt.ConnectionType.DirectConnection
         )
+        self.creation_progress.canceled.connect(
+            lambda: self.creation_progress.setLabelText("Cancelling...")
+        )
+        self.creation_start = time.monotonic()
 
-        return output
+        self.creation_thread.started.connect(worker.run)
+        worker.progress.connect(self.folder_creation_progress)
+        worker.completed.connect(self.folder_creation_completed)
+        worker.cancelled.connect(self.folder_creation_cancelled)
+        worker.failed.connect(self.folder_creation_failed)
+
+        self.creation_progress.show()
+        self.creation_thread.start()
+
+    def folder_creation_progress(self, done: int, total: int):
+        if self.creation_progress.wasCanceled():
+            return
+
+        self.creation_progress.setMaximum(total)
+        self.creation_progress.setValue(done)
+
+        # Estimating the remaining time with the average time of the tests done so far
+        elapsed = time.monotonic() - self.creation_start
+        remaining = round(elapsed / done * (total - done))
+        self.creation_progress.setLabelText(
+            f"Creating the folders... {done} of {total}\n"
+            f"Remaining time: {remaining // 60} min {remaining % 60:02d} s"
+        )
+
+    def folder_creation_completed(self, written: int):
+        self.finish_folder_creation()
+        QMessageBox.information(
+            self, "Completed.", f"The folders were created ({written} test folders written)."
+        )
+
+    def folder_creation_cancelled(self):
+        self.finish_folder_creation()
+        QMessageBox.information(
+            self, "Cancelled", "The creation of the folders was cancelled."
+        )
+
+    def folder_creation_failed(self, error: str):
+        self.finish_folder_creation()
+        QMessageBox.warning(self, "Warning", f"The folders were not created:\n{error}")
+
+    def finish_folder_creation(self):
+        self.creation_thread.quit()
+        self.creation_thread.wait()
+        self.creation_thread.deleteLater()
+        self.creation_worker.deleteLater()
+        self.creation_thread = None
+        self.creation_worker = None
+        self.creation_progress.close()
+        self.ui.button_create_folders.setEnabled(True)
+
+    # Closing the window during a creation stops it after the test that is being written
+    # and waits for the worker, so the manifest is saved and a staged campaign is removed
+    # (a QThread destroyed while running would abort the whole program)
+    def closeEvent(self, event):
+        if self.creation_thread is not None:
+            worker = self.creation_worker
+            # The window is closing, the messages at the end of the creation are not shown
+            for signal in (worker.progress, worker.completed, worker.cancelled, worker.failed):
+                signal.disconnect()
+            worker.cancel()
+            self.creation_thread.quit()
+            self.creation_thread.wait()
+            self.creation_progress.close()
+            self.creation_thread = None
+            self.creation_worker = None
+        super().closeEvent(event)
+
+    def loadDimensions(self) -> CarDimensions:
+        # Parsing of the text in the dimension tab, the textboxes are named like
+        # x1Front,y1Front etc..., so that text is for that
+        def read_points(section: str, count: int):
+            points = []
+            for i in range(1, count + 1):
+                x_text = getattr(self.ui, f"x{i}{section}")
+                y_text = getattr(self.ui, f"y{i}{section}")
+                points.append((float(x_text.text().strip()), float(y_text.text().strip())))
+            return points
+
+        # The conversion in mm and the ordering of the points is done in build_car_dimensions
+        # so it's the same for the GUI and for the campaign files
+        return build_car_dimensions(
+            length=float(self.ui.textLenght.text().strip()),
+            width=float(self.ui.textWidth.text().strip()),
+            overhang=float(self.ui.textOverhang.text().strip()),
+            front=read_points("Front", 7),
+            side=read_points("Side", 5),
+            back=read_points("Back", 7),
+        )
 
     # Loading the main car info
     def loadInfo(self) -> CarInfo:
@@ -300,7 +468,9 @@ class MainWindow(QMainWindow):
 
 # The class for the dialog window that pops-up when you press "Add a new test"
 class TestSpecWindow(QDialog):
-    test_created = Signal(dict)
+    test_created = Signal(object)
+    # In matrix mode a generator with all the tests is emitted instead
+    tests_created = Signal(object)
 
     def __init__(
         self, test_spec: dict, robustness_spec: dict, macro_type: str, parent=None
@@ -320,6 +490,8 @@ class TestSpecWindow(QDialog):
         self.setFixedSize(self.size())
 
         self.button_add_test.clicked.connect(self.insert_test_button_pressed)
+        self.check_matrix.toggled.connect(self.matrix_mode_toggled)
+        self.spin_repetitions.valueChanged.connect(self.update_matrix_count)
 
         # Update of the Robustness Type combobox and Robustness Layer combobox depending
         # on the selection
@@ -345,9 +517,6 @@ class TestSpecWindow(QDialog):
         parameters_layout = QFormLayout(self.parameter_widget)
         robustness_layout = QFormLayout(self.robustness_widget)
 
-        self.fixed_parameters = {"name": self.test_spec["name"]}
-        self.fixed_parameters["macro_type"] = self.macro_type
-
         # Assigning the data and label to the combo box
         for parameter in self.test_spec["test_variables"]:
             if parameter["user_input"]:
@@ -362,10 +531,35 @@ class TestSpecWindow(QDialog):
                 if idx >= 0:
                     combo.setCurrentIndex(idx)
 
-                # Adding the combo to the layout
-                parameters_layout.addRow(parameter["display_name"], combo)
-            else:
-                self.fixed_parameters[parameter["key"]] = parameter["value"]
+                # List used instead of the combo box in matrix mode, where more than one
+                # option can be selected (by checking it)
+                option_list = QListWidget()
+                option_list.setProperty("parameter_key", parameter["key"])
+                for option in parameter["options"]:
+                    item = QListWidgetItem(option["label"])
+                    item.setData(Qt.ItemDataRole.UserRole, option["value"])
+                    item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                    if option["value"] == parameter["default"]:
+                        item.setCheckState(Qt.CheckState.Checked)
+                    else:
+                        item.setCheckState(Qt.CheckState.Unchecked)
+                    option_list.addItem(item)
+
+                # Tall enough to show all the options without scrolling
+                option_list.setFixedHeight(
+                    option_list.sizeHintForRow(0) * option_list.count()
+                    + 2 * option_list.frameWidth()
+                )
+                option_list.setVisible(False)
+                option_list.itemChanged.connect(self.update_matrix_count)
+
+                # Adding the combo and the list to the layout, only one of them is visible
+                selector = QWidget()
+                selector_layout = QHBoxLayout(selector)
+                selector_layout.setContentsMargins(0, 0, 0, 0)
+                selector_layout.addWidget(combo)
+                selector_layout.addWidget(option_list)
+                parameters_layout.addRow(parameter["display_name"], selector)
 
         # Same stuff but for the robustness, in this case all the comboboxes are
         # created statically because we know that the maximum amount of "parameters" is
@@ -392,8 +586,22 @@ class TestSpecWindow(QDialog):
         columns_layout.addWidget(self.parameter_widget)
         columns_layout.addWidget(self.robustness_widget)
 
+        # Number of runs of the test, every run gets its own folder
+        self.spin_repetitions = QSpinBox()
+        self.spin_repetitions.setRange(1, 99)
+        repetitions_layout = QFormLayout()
+        repetitions_layout.addRow("Run repetitions", self.spin_repetitions)
+
+        # Matrix mode, all the combinations of the selected options are inserted together
+        self.check_matrix = QCheckBox("Matrix mode (insert all the combinations)")
+        self.label_matrix_count = QLabel()
+        self.label_matrix_count.setVisible(False)
+
         self.button_add_test = QPushButton("Insert Test")
         main_layout.addLayout(columns_layout)
+        main_layout.addLayout(repetitions_layout)
+        main_layout.addWidget(self.check_matrix)
+        main_layout.addWidget(self.label_matrix_count)
         main_layout.addWidget(self.button_add_test)
 
         if self.combo_robustness_type.count() > 0:
@@ -401,53 +609,99 @@ class TestSpecWindow(QDialog):
 
     # Method to manage the inserting the "insert button"
     def insert_test_button_pressed(self):
-        current_test_property = self.fixed_parameters.copy()
-        # Initializing the "_ui" part of the test that will be used in the
-        # table to display the parameters
-        current_test_property["_ui"] = {}
-        current_test_property["_ui"]["columns"] = []
-        current_test_property["_ui"]["columns"].append(
-            ("name", current_test_property["name"])
-        )
+        if self.check_matrix.isChecked():
+            # The generator builds the tests only while they are inserted in the list
+            self.tests_created.emit(
+                expand_test_matrix(
+                    self.test_spec,
+                    self.robustness_spec,
+                    self.macro_type,
+                    self.matrix_choices(),
+                    [self.selected_robustness()],
+                    self.spin_repetitions.value(),
+                )
+            )
+            return
 
-        # Filling the rest of the parameters
+        # Reading the selected values, the test dictionary is then built by build_test
+        # (the same function used by the campaign files)
+        parameters = {}
         for combo in self.parameter_widget.findChildren(QComboBox):
-            key = combo.property("parameter_key")
-            current_test_property[key] = combo.currentData()
-            current_test_property["_ui"]["columns"].append((key, combo.currentText()))
-
-        # Managing the robustness
-        type_key = self.combo_robustness_type.currentData()["key"]
-        current_test_property["robustness_type"] = type_key
-        current_test_property["_ui"]["columns"].append(
-            ("robustness_type", self.combo_robustness_type.currentText())
+            parameters[combo.property("parameter_key")] = combo.currentData()
+
+        current_test_property = build_test(
+            self.test_spec,
+            self.robustness_spec,
+            self.macro_type,
+            parameters,
+            self.selected_robustness(),
+            self.spin_repetitions.value(),
         )
 
-        # If it doesnt have a robustness layer, return early
-        if not self.combo_robustness_type.currentData()["layers"]:
-            self.test_created.emit(current_test_property)
-            return
+        # Emit the current_test_property that will get appended to the tests list
+        self.test_created.emit(current_test_property)
 
-        # Saving layer_key and display name (from the "currentText() of the comboBox")
-        layer_key = self.combo_robustness_layer.currentData()["key"]
-        current_test_property["robustness_layer"] = layer_key
-        current_test_property["_ui"]["columns"].append(
-            ("robustness_layer", self.combo_robustness_layer.currentText())
-        )
+    # Managing the robustness, the layer and the parameter are added only if
+    # the comboboxes are active
+    def selected_robustness(self) -> dict:
+        robustness = {"type": self.combo_robustness_type.currentData()["key"]}
+        if self.combo_robustness_layer.isEnabled():
+            robustness["layer"] = self.combo_robustness_layer.currentData()["key"]
+        if self.combo_robustness_parameter.isEnabled():
+            robustness["parameter"] = self.combo_robustness_parameter.currentData()
+
+        return robustness
+
+    # The values checked in the lists of the matrix mode, for each parameter
+    def matrix_choices(self) -> dict:
+        choices = {}
+        for option_list in self.parameter_widget.findChildren(QListWidget):
+            values = []
+            for row in range(option_list.count()):
+                item = option_list.item(row)
+                if item.checkState() == Qt.CheckState.Checked:
+                    values.append(item.data(Qt.ItemDataRole.UserRole))
+            choices[option_list.property("parameter_key")] = values
+
+        return choices
+
+    def matrix_mode_toggled(self, checked: bool):
+        # Showing the lists instead of the combo boxes
+        for combo in self.parameter_widget.findChildren(QComboBox):
+            combo.setVisible(not checked)
+        for option_list in self.parameter_widget.findChildren(QListWidget):
+            option_list.setVisible(checked)
+
+        self.label_matrix_count.setVisible(checked)
+        self.update_matrix_count()
+
+        # The dialog has a fixed size, so it needs to be resized to the new content
+        self.setMinimumSize(0, 0)
+        self.setMaximumSize(16777215, 16777215)
+        # The layouts are updated starting from the inner ones, otherwise the size of the
+        # hidden widgets is still counted
+        for selector in self.parameter_widget.findChildren(QWidget):
+            if selector.layout() is not None:
+                selector.layout().activate()
+        self.parameter_widget.layout().activate()
+        self.layout().activate()
+        self.adjustSize()
+        self.setFixedSize(self.size())
 
-        # If it doesnt have a robustness parameter, return early
-        if not self.combo_robustness_layer.currentData()["options"]:
-            self.test_created.emit(current_test_property)
+    # Preview of how many tests will be inserted in matrix mode
+    def update_matrix_count(self):
+        if not self.check_matrix.isChecked():
+            self.button_add_test.setEnabled(True)
+            self.button_add_test.setText("Insert Test")
             return
 
-        parameter_value = self.combo_robustness_parameter.currentData()
-        current_test_property["robustness_parameter"] = parameter_value
-        current_test_property["_ui"]["columns"].append(
-            ("robustness_parameter", self.combo_robustness_parameter.currentText())
+        count = count_test_matrix(self.matrix_choices())
+        runs = count * self.spin_repetitions.value()
+        self.label_matrix_count.setText(
+            f"{count} tests will be inserted ({runs} run folders)."
         )
-
-        # Emit the current_test_property that will get appended to the tests list
-        self.test_created.emit(current_test_property)
+        self.button_add_test.setEnabled(count > 0)
+        self.button_add_test.setText(f"Insert {count} Tests")
 
     # Method to manage the change of the robustness type
     def robustness_type_selection(self, index):
@@ -492,20 +746,17 @@ class TestSpecWindow(QDialog):
             self.combo_robustness_parameter.addItem(option["label"], option["value"])
 
 
-# Loading the json file in the test_json folder
-def test_json_loading(folder: Path) -> dict:
-    output = {}
-
-    for path in folder.glob("*.json"):
-        with open(path) as f:
-            spec = json.load(f)
-            output[spec["name"]] = spec
-
-    return output
+# Called by the event loop as soon as it starts, when the window is actually on screen
+def startup_completed():
+    startup_timer.mark("first event loop iteration")
+    startup_timer.write()
 
 
 if __name__ == "__main__":
     app = QApplication([])
+    startup_timer.mark("QApplication")
     w = MainWindow()
     w.show()
+    startup_timer.mark("show")
+    QTimer.singleShot(0, startup_completed)
     app.exec()
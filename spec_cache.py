@@ -0,0 +1,146 @@
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+
+from test_builder import load_json
+from test_record import option_tables, robustness_table
+
+# Name of the compiled cache, saved in the same folder of the json databases
+CACHE_NAME = ".spec_cache.pickle"
+# To be increased every time the structure of the bundle changes, so old caches are
+# not used anymore
+BUNDLE_VERSION = 3
+# How many specs loaded by load_test_spec are kept in memory
+SPEC_CACHE_SIZE = 16
+
+
+# Loading test_types.json, robustness.json and all the test_json/ specs in one go.
+# The first time the json are parsed, validated and saved in a single pickle file,
+# then that file is used as long as none of the json changed (the modification time
+# and the size of every file are saved in the cache)
+def load_spec_bundle(data_folder: Path) -> dict:
+    signature = sources_signature(data_folder)
+    cache_path = data_folder / CACHE_NAME
+
+    try:
+        with open(cache_path, "rb") as f:
+            bundle = pickle.load(f)
+        if (
+            bundle.get("version") == BUNDLE_VERSION
+            and bundle.get("signature") == signature
+        ):
+            register_spec_tables(bundle)
+            return bundle
+    except Exception:
+        # Missing or broken cache (a damaged pickle can fail in many different ways),
+        # it gets created again
+        pass
+
+    bundle = compile_spec_bundle(data_folder)
+    bundle["signature"] = signature
+    save_spec_bundle(cache_path, bundle)
+    register_spec_tables(bundle)
+    return bundle
+
+
+# The option tables of the specs are prepared when the bundle is loaded, so building the
+# tests is only a matter of codes
+def register_spec_tables(bundle: dict):
+    robustness_table(bundle["robustness"])
+    for spec in bundle["specs"].values():
+        option_tables(spec)
+
+
+# Loading a single test spec only when it's needed, the GUI works with only one test
+# at a time so there is no reason to parse the whole folder at startup.
+# The files are named like the test in lower case (ccrs.json for CCRs), if the file is
+# not found like that the whole folder is searched
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def load_test_spec(test_json_folder: Path, test_name: str) -> dict:
+    path = test_json_folder / f"{test_name.lower()}.json"
+    if path.exists():
+        spec = load_json(path)
+        if spec.get("name") == test_name:
+            validate_spec(spec, path)
+            option_tables(spec)
+            return spec
+
+    for path in sorted(test_json_folder.glob("*.json")):
+        spec = load_json(path)
+        if spec.get("name") == test_name:
+            validate_spec(spec, path)
+            option_tables(spec)
+            return spec
+
+    raise ValueError(f"The test '{test_name}' is not present in {test_json_folder}.")
+
+
+def compile_spec_bundle(data_folder: Path) -> dict:
+    specs = {}
+    for path in sorted((data_folder / "test_json").glob("*.json")):
+        spec = load_json(path)
+        validate_spec(spec, path)
+        specs[spec["name"]] = spec
+
+    return {
+        "version": BUNDLE_VERSION,
+        "test_types": load_json(data_folder / "test_types.json"),
+        "robustness": load_json(data_folder / "robustness.json"),
+        "specs": specs,
+    }
+
+
+def save_spec_bundle(cache_path: Path, bundle: dict):
+    # Writing a temporary file and replacing the old one, so two programs started at the
+    # same time never read a half written cache
+    temporary_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary_path, "wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        # The cache is only an optimization, if the folder is read only the json
+        # are just parsed every time
+        temporary_path.unlink(missing_ok=True)
+
+
+def sources_signature(data_folder: Path) -> tuple:
+    paths = [data_folder / "test_types.json", data_folder / "robustness.json"]
+    paths.extend(sorted((data_folder / "test_json").glob("*.json")))
+
+    signature = []
+    for path in paths:
+        stat = path.stat()
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+
+    return tuple(signature)
+
+
+# Checking that a test json has everything the program needs, so an error in the json is
+# found when loading it and not when the test is selected
+def validate_spec(spec: dict, path: Path):
+    if "name" not in spec or "test_variables" not in spec:
+        raise ValueError(f"{path.name}: 'name' and 'test_variables' are required.")
+
+    for variable in spec["test_variables"]:
+        if "key" not in variable or "user_input" not in variable:
+            raise ValueError(
+                f"{path.name}: every variable needs 'key' and 'user_input'."
+            )
+
+        key = variable["key"]
+        if not variable["user_input"]:
+            if "value" not in variable:
+                raise ValueError(f"{path.name}: the fixed variable '{key}' has no 'value'.")
+            continue
+
+        for required in ("display_name", "default", "options"):
+            if required not in variable:
+                raise ValueError(f"{path.name}: the variable '{key}' has no '{required}'.")
+
+        values = [option["value"] for option in variable["options"]]
+        if variable["default"] not in values:
+            raise ValueError(
+                f"{path.name}: the default of '{key}' is not one of its options."
+            )
@@ -0,0 +1,75 @@
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# The timing is active only if this environment variable is set (to the path of the log
+# file, or to 1 to use the default one) or if the program is started with
+# --profile-startup (or --profile-startup=path)
+PROFILE_ENV = "CREAZIONE_STARTUP_PROFILE"
+PROFILE_FLAG = "--profile-startup"
+DEFAULT_LOG = "startup_profile.jsonl"
+
+
+# Records how long every phase of the startup takes. Every call of mark() closes the
+# phase that started with the previous mark (or with the creation of the timer), at the
+# end write() appends everything as one json line to the log, so the different
+# versions can be compared on the same PC
+class StartupTimer:
+    def __init__(self, log_path: Path | None):
+        self.log_path = log_path
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    @classmethod
+    def from_environment(cls, argv=None) -> "StartupTimer":
+        argv = sys.argv[1:] if argv is None else argv
+        log_path = None
+
+        value = os.environ.get(PROFILE_ENV)
+        if value:
+            log_path = Path(DEFAULT_LOG if value == "1" else value)
+
+        for argument in argv:
+            if argument == PROFILE_FLAG:
+                log_path = Path(DEFAULT_LOG)
+            elif argument.startswith(PROFILE_FLAG + "="):
+                log_path = Path(argument.split("=", 1)[1])
+
+        return cls(log_path)
+
+    @property
+    def enabled(self) -> bool:
+        return self.log_path is not None
+
+    def mark(self, phase: str):
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        self.phases.append({"phase": phase, "ms": round((now - self.last) * 1000, 3)})
+        self.last = now
+
+    def write(self):
+        if not self.enabled:
+            return
+
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "total_ms": round((self.last - self.start) * 1000, 3),
+            "phases": self.phases,
+        }
+
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+# Created when the module is imported, so main.py imports it before everything else to
+# include also the time spent importing PySide6
+startup_timer = StartupTimer.from_environment()
@@ -0,0 +1,189 @@
+import json
+from itertools import product
+from math import prod
+from pathlib import Path
+
+from test_record import TestLayout, TestRecord, layout_for_spec
+
+
+def load_json(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Finding the "macro type" (AEBC, AEBP, etc...) of a test from the test_types.json database
+def find_macro_type(test_types: dict, test_name: str) -> str:
+    for entry in test_types["test_list"]:
+        if test_name in entry["tests"]:
+            return entry["type"]
+
+    raise ValueError(f"The test '{test_name}' is not present in any test type.")
+
+
+# Building the test in the same way the "Add a new test" dialog does it.
+# "parameters" contains the values selected for the user_input variables (the default
+# of the test json is used for the missing ones), "robustness" contains the keys
+# "type", "layer" and "parameter" (the first available entry is used for the missing ones,
+# like the comboboxes of the dialog).
+# "repetitions" is the number of runs of the test, every run gets its own folder.
+# The test is a TestRecord that keeps only the codes of the selected options in the
+# option tables of the spec (see test_record.py)
+def build_test(
+    spec: dict,
+    robustness_spec: dict,
+    macro_type: str,
+    parameters: dict | None = None,
+    robustness: dict | None = None,
+    repetitions: int = 1,
+) -> TestRecord:
+    parameters = parameters or {}
+    check_repetitions(repetitions)
+
+    layout = layout_for_spec(spec, robustness_spec, macro_type)
+    check_parameters(layout, spec, parameters)
+
+    codes = tuple(
+        table.code(parameters[table.key]) if table.key in parameters else table.default
+        for table in layout.tables
+    )
+    return TestRecord(
+        layout, codes + layout.robustness.encode(robustness or {}), repetitions
+    )
+
+
+def check_repetitions(repetitions: int):
+    if not isinstance(repetitions, int) or repetitions < 1:
+        raise ValueError(f"Invalid number of run repetitions '{repetitions}'.")
+
+
+def check_parameters(layout: TestLayout, spec: dict, parameters: dict):
+    unknown_keys = set(parameters) - set(layout.positions)
+    if unknown_keys:
+        raise ValueError(
+            f"Unknown parameters for the test '{spec['name']}': "
+            + ", ".join(sorted(unknown_keys))
+        )
+
+
+# Building all the combinations (the cartesian product) of the selected options.
+# "parameter_choices" contains, for each user_input variable, the list of values to use
+# (the default is used for the missing ones) and "robustness_choices" the list of
+# robustness selections, in the same format of build_test.
+# The values are converted to codes only once, then every combination is just a tuple
+# of codes. It's a generator, so the tests are built one at a time while they are
+# consumed and even huge sweeps are never all in memory at the same time
+def expand_test_matrix(
+    spec: dict,
+    robustness_spec: dict,
+    macro_type: str,
+    parameter_choices: dict,
+    robustness_choices: list | None = None,
+    repetitions: int = 1,
+):
+    check_repetitions(repetitions)
+
+    layout = layout_for_spec(spec, robustness_spec, macro_type)
+    check_parameters(layout, spec, parameter_choices)
+
+    keys = list(parameter_choices)
+    positions = [layout.positions[key] for key in keys]
+    choice_codes = [
+        [layout.tables[position].code(value) for value in parameter_choices[key]]
+        for key, position in zip(keys, positions)
+    ]
+    robustness_codes = [
+        layout.robustness.encode(robustness) for robustness in robustness_choices or [{}]
+    ]
+
+    codes = [table.default for table in layout.tables]
+    for combination in product(*choice_codes):
+        for position, code in zip(positions, combination):
+            codes[position] = code
+        parameter_codes = tuple(codes)
+
+        for robustness in robustness_codes:
+            yield TestRecord(layout, parameter_codes + robustness, repetitions)
+
+
+# Number of tests generated by expand_test_matrix, without building them
+def count_test_matrix(parameter_choices: dict, robustness_choices: list | None = None):
+    robustness_count = len(robustness_choices) if robustness_choices else 1
+    return prod(len(values) for values in parameter_choices.values()) * robustness_count
+
+
+# Choices for expand_test_matrix from the "parameters" of a campaign template: the listed
+# values for the parameters that are present, all the options for the missing ones.
+# A single value (like in the campaign files) is the same as a list with only that value
+def template_choices(spec: dict, parameters: dict | None = None) -> dict:
+    parameters = parameters or {}
+    if not isinstance(parameters, dict):
+        raise ValueError(
+            f"The parameters of the test '{spec['name']}' must be an object "
+            "with the values of every parameter."
+        )
+    choices = {}
+
+    for variable in spec["test_variables"]:
+        if not variable["user_input"]:
+            continue
+
+        key = variable["key"]
+        if key in parameters:
+            value = parameters[key]
+            choices[key] = list(value) if isinstance(value, list) else [value]
+        else:
+            choices[key] = [option["value"] for option in variable["options"]]
+
+    unknown_keys = set(parameters) - set(choices)
+    if unknown_keys:
+        raise ValueError(
+            f"Unknown parameters for the test '{spec['name']}': "
+            + ", ".join(sorted(unknown_keys))
+        )
+
+    return choices
+
+
+# Robustness selections for expand_test_matrix from the "robustness" of a campaign
+# template: a list of selections or a single one (like in the campaign files)
+def template_robustness(robustness) -> list | None:
+    if robustness is None or isinstance(robustness, list):
+        return robustness
+    if isinstance(robustness, dict):
+        return [robustness]
+
+    raise ValueError(
+        f"Invalid robustness '{robustness}', expected an object or a list of objects."
+    )
+
+
+# Campaign templates describe a whole protocol (or a part of it) with the tests and the
+# options to use, all the combinations of the options are generated:
+# {
+#   "name": "Euro NCAP AEB Car-to-Car",
+#   "tests": [{"name": "CCRs", "parameters": {"test_type": ["AEB"]},
+#              "robustness": [{"type": "NOVALUE"}, {"type": "VUT", "layer": "DI"}]}]
+# }
+# The parameters that are not in "parameters" get all their options, without
+# "robustness" only the tests without robustness are generated ("robustness" can also be
+# a single object). Every entry can also have "repetitions" (the number of runs of each
+# test, 1 if missing)
+def expand_template(template: dict, specs: dict, robustness_spec: dict, test_types: dict):
+    for entry in template["tests"]:
+        name = entry["name"]
+        spec = find_spec(specs, name)
+        yield from expand_test_matrix(
+            spec,
+            robustness_spec,
+            find_macro_type(test_types, name),
+            template_choices(spec, entry.get("parameters")),
+            template_robustness(entry.get("robustness")),
+            entry.get("repetitions", 1),
+        )
+
+
+def find_spec(specs: dict, name: str) -> dict:
+    if name not in specs:
+        raise ValueError(f"The test '{name}' is not present in the test_json folder.")
+
+    return specs[name]
@@ -0,0 +1,309 @@
+import re
+import sys
+from dataclasses import dataclass
+
+# Code of the robustness layer or parameter when the test doesn't have it
+NO_OPTION = -1
+# Label of the options that are not written in the folder names
+NO_VALUE_LABEL = "N/A"
+# Characters that can't be used in the name of a folder
+INVALID_FOLDER_CHARACTERS = re.compile(r"[^a-zA-Z0-9_-]")
+# Key of the spec (and of the robustness database) where its tables are kept
+COMPILED_KEY = "_compiled"
+_MISSING = object()
+
+
+def intern_text(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def sanitize_folder_name(name: str, replacement="_") -> str:
+    # Removes strange characters from the name that could lead to problems
+    # when creating a folder
+    name = INVALID_FOLDER_CHARACTERS.sub(replacement, name)
+    return name.strip()
+
+
+# Version of a label used in the folder name of a test
+def label_folder_name(label: str) -> str:
+    return sanitize_folder_name(label, "")
+
+
+# The options of one parameter as columns (value, label and label used in the folder
+# names), a test keeps only the code of the option: its position in the columns.
+# The strings are interned, so the same value or label used by many specs is saved once
+@dataclass(slots=True, eq=False)
+class OptionTable:
+    key: str
+    values: tuple
+    labels: tuple
+    folder_labels: tuple
+    # Code of every value
+    codes: dict
+    default: int = 0
+
+    @classmethod
+    def from_entries(
+        cls, key: str, values, labels, default_value=_MISSING
+    ) -> "OptionTable":
+        values = tuple(intern_text(value) for value in values)
+        labels = tuple(intern_text(label) for label in labels)
+        folder_labels = tuple(intern_text(label_folder_name(label)) for label in labels)
+        codes = {}
+        for code, value in enumerate(values):
+            codes.setdefault(value, code)
+
+        table = cls(key, values, labels, folder_labels, codes)
+        if default_value is not _MISSING:
+            table.default = table.code(default_value)
+        return table
+
+    def code(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            raise ValueError(f"The value '{value}' is not a valid option for '{self.key}'.")
+        return code
+
+
+# The robustness database as option tables: the types, the layers of every type and the
+# parameters of every layer (None when the type has no layers or the layer no parameters)
+@dataclass(slots=True, eq=False)
+class RobustnessTable:
+    types: OptionTable
+    layers: tuple
+    parameters: tuple
+
+    @classmethod
+    def from_spec(cls, robustness_spec: dict) -> "RobustnessTable":
+        robustness_types = robustness_spec["robustness"]
+        types = OptionTable.from_entries(
+            "robustness_type",
+            [entry["key"] for entry in robustness_types],
+            [entry["display_name"] for entry in robustness_types],
+        )
+
+        layers = []
+        parameters = []
+        for robustness_type in robustness_types:
+            type_layers = robustness_type["layers"] or []
+            layers.append(
+                OptionTable.from_entries(
+                    "robustness_layer",
+                    [layer["key"] for layer in type_layers],
+                    [layer["display_name"] for layer in type_layers],
+                )
+                if type_layers
+                else None
+            )
+            parameters.append(
+                tuple(
+                    OptionTable.from_entries(
+                        "robustness_parameter",
+                        [option["value"] for option in layer["options"]],
+                        [option["label"] for option in layer["options"]],
+                    )
+                    if layer["options"]
+                    else None
+                    for layer in type_layers
+                )
+            )
+
+        return cls(types, tuple(layers), tuple(parameters))
+
+    # Codes of a robustness selection with the keys "type", "layer" and "parameter"
+    # (the first available entry is used for the missing ones)
+    def encode(self, robustness: dict) -> tuple:
+        if not isinstance(robustness, dict):
+            raise ValueError(
+                f"Invalid robustness '{robustness}', expected an object with "
+                "'type', 'layer' and 'parameter'."
+            )
+
+        type_key = robustness.get("type", self.types.values[0])
+        type_code = self.types.codes.get(type_key)
+        if type_code is None:
+            raise ValueError(f"Unknown robustness type '{type_key}'.")
+
+        layers = self.layers[type_code]
+        if layers is None:
+            return type_code, NO_OPTION, NO_OPTION
+
+        layer_key = robustness.get("layer", layers.values[0])
+        layer_code = layers.codes.get(layer_key)
+        if layer_code is None:
+            raise ValueError(f"Unknown robustness layer '{layer_key}' for '{type_key}'.")
+
+        parameters = self.parameters[type_code][layer_code]
+        if parameters is None:
+            return type_code, layer_code, NO_OPTION
+
+        return (
+            type_code,
+            layer_code,
+            parameters.code(robustness.get("parameter", parameters.values[0])),
+        )
+
+    # The tables used by a test, with the code of the option selected in each one
+    def selected(self, codes: tuple):
+        type_code, layer_code, parameter_code = codes
+        selected = [(self.types, type_code)]
+        if layer_code != NO_OPTION:
+            selected.append((self.layers[type_code], layer_code))
+            if parameter_code != NO_OPTION:
+                selected.append(
+                    (self.parameters[type_code][layer_code], parameter_code)
+                )
+        return selected
+
+
+# The tables are built once for every spec (and for the robustness database) and kept
+# inside it, so all its tests share the same tables and they are freed together with
+# the spec when it leaves the cache of load_test_spec
+def _compiled(spec: dict) -> dict:
+    return spec.setdefault(COMPILED_KEY, {})
+
+
+# The option tables of the user_input variables of a spec, built when the spec is loaded
+def option_tables(spec: dict) -> tuple:
+    compiled = _compiled(spec)
+    tables = compiled.get("option_tables")
+    if tables is None:
+        tables = compiled["option_tables"] = tuple(
+            OptionTable.from_entries(
+                variable["key"],
+                [option["value"] for option in variable["options"]],
+                [option["label"] for option in variable["options"]],
+                variable["default"],
+            )
+            for variable in spec["test_variables"]
+            if variable["user_input"]
+        )
+    return tables
+
+
+def robustness_table(robustness_spec: dict) -> RobustnessTable:
+    compiled = _compiled(robustness_spec)
+    table = compiled.get("robustness_table")
+    if table is None:
+        table = compiled["robustness_table"] = RobustnessTable.from_spec(robustness_spec)
+    return table
+
+
+# What is shared by all the tests built from the same spec: the fixed values (with the
+# name and the macro type), the option tables of the user_input variables and of the
+# robustness. The tests only keep the codes of the selected options
+@dataclass(slots=True, eq=False)
+class TestLayout:
+    fixed: dict
+    tables: tuple
+    robustness: RobustnessTable
+    # Position of every user_input variable in "tables" (and in the codes of the test)
+    positions: dict
+    # The name of the test as used in the folder names
+    folder_name: str
+
+    @classmethod
+    def from_spec(
+        cls, spec: dict, robustness_spec: dict, macro_type: str
+    ) -> "TestLayout":
+        fixed = {"name": intern_text(spec["name"]), "macro_type": intern_text(macro_type)}
+        for variable in spec["test_variables"]:
+            if not variable["user_input"]:
+                fixed[variable["key"]] = intern_text(variable["value"])
+
+        tables = option_tables(spec)
+        positions = {table.key: position for position, table in enumerate(tables)}
+        return cls(
+            fixed,
+            tables,
+            robustness_table(robustness_spec),
+            positions,
+            intern_text(label_folder_name(spec["name"])),
+        )
+
+    @property
+    def name(self) -> str:
+        return self.fixed["name"]
+
+
+# The layouts are kept in the spec too, one for every macro type, and built again if the
+# robustness database is not the one they were built with
+def layout_for_spec(spec: dict, robustness_spec: dict, macro_type: str) -> TestLayout:
+    layouts = _compiled(spec).setdefault("layouts", {})
+    layout = layouts.get(macro_type)
+    if layout is None or layout.robustness is not robustness_table(robustness_spec):
+        layout = layouts[macro_type] = TestLayout.from_spec(
+            spec, robustness_spec, macro_type
+        )
+    return layout
+
+
+# A test added by the user. Instead of a dictionary with all the values and labels it
+# keeps only the layout of its spec and the codes of the selected options (one for every
+# user_input variable, then the robustness type, layer and parameter), the values and
+# the labels are read from the option tables when they are needed.
+# It can be read like the old dictionaries (test["name"], test.get("overlap")), "columns"
+# are the labels shown in the table and "id" is given by the TestStore
+@dataclass(slots=True, eq=False)
+class TestRecord:
+    layout: TestLayout
+    codes: tuple
+    repetitions: int = 1
+    id: int | None = None
+
+    # Two tests with the same key are the same test (same spec, macro type and options)
+    @property
+    def key(self) -> tuple:
+        return self.layout.fixed["name"], self.layout.fixed["macro_type"], self.codes
+
+    def get(self, key: str, default=None):
+        layout = self.layout
+
+        position = layout.positions.get(key)
+        if position is not None:
+            return layout.tables[position].values[self.codes[position]]
+
+        value = layout.fixed.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if key == "repetitions":
+            return self.repetitions
+
+        if key.startswith("robustness_"):
+            for table, code in self._robustness():
+                if table.key == key:
+                    return table.values[code]
+
+        return default
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    @property
+    def columns(self) -> list:
+        columns = [("name", self.layout.name)]
+        for table, code in self._selected():
+            columns.append((table.key, table.labels[code]))
+        return columns
+
+    # The labels that make the name of the test folder, already sanitized
+    @property
+    def folder_labels(self) -> list:
+        labels = [self.layout.folder_name]
+        for table, code in self._selected():
+            if table.labels[code] != NO_VALUE_LABEL:
+                labels.append(table.folder_labels[code])
+        return labels
+
+    def _selected(self):
+        tables = self.layout.tables
+        selected = list(zip(tables, self.codes))
+        selected.extend(self._robustness())
+        return selected
+
+    def _robustness(self):
+        return self.layout.robustness.selected(self.codes[len(self.layout.tables) :])
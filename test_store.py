@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from itertools import count
+
+from test_record import TestRecord
+
+
+# The list of the tests added by the user. Every test gets a stable id when it's added
+# (saved also in the test), so it can be found or removed without depending on its
+# position in the list or in the table.
+# The tests are kept in the order they were added, the order of the rows of the table
+# is kept by TestTableModel.
+# The ids are also indexed by the key of the test (spec, macro type and options), so a
+# test that is already in the list is found without looking at all the others
+class TestStore:
+    def __init__(self):
+        self._tests = OrderedDict()
+        self._next_id = count(1)
+        self._keys = {}
+
+    def add(self, test: TestRecord) -> int:
+        test_id = next(self._next_id)
+        test.id = test_id
+        self._tests[test_id] = test
+        # The ids of every key are the keys of a dict, so they keep the order of
+        # insertion and one can be removed without searching it
+        self._keys.setdefault(test.key, {})[test_id] = None
+        return test_id
+
+    def remove(self, test_id: int) -> TestRecord:
+        test = self._tests.pop(test_id)
+        ids = self._keys[test.key]
+        del ids[test_id]
+        if not ids:
+            del self._keys[test.key]
+        return test
+
+    # Id of the first test equal to "test" already in the list (None if it's not there)
+    def find(self, test: TestRecord) -> int | None:
+        ids = self._keys.get(test.key)
+        return next(iter(ids)) if ids else None
+
+    # Number of tests of the list that are already in the store or that are repeated
+    # in the list itself
+    def count_duplicates(self, tests: list) -> int:
+        seen = set()
+        duplicates = 0
+        for test in tests:
+            if test.key in seen or test.key in self._keys:
+                duplicates += 1
+            seen.add(test.key)
+        return duplicates
+
+    # Merging the duplicated tests in the runs of the first one: the tests already in the
+    # store get the runs of their copies (returned as {id: runs added}), the ones repeated
+    # in the list are merged in their first copy. Returns the tests that are really new
+    def merge_duplicates(self, tests: list) -> tuple[list, dict]:
+        new_tests = {}
+        added_runs = {}
+        for test in tests:
+            test_id = self.find(test)
+            if test_id is not None:
+                self._tests[test_id].repetitions += test.repetitions
+                added_runs[test_id] = added_runs.get(test_id, 0) + test.repetitions
+            elif test.key in new_tests:
+                new_tests[test.key].repetitions += test.repetitions
+            else:
+                new_tests[test.key] = test
+
+        return list(new_tests.values()), added_runs
+
+    def get(self, test_id: int) -> TestRecord:
+        return self._tests[test_id]
+
+    def ids(self):
+        return self._tests.keys()
+
+    def __iter__(self):
+        return iter(self._tests.values())
+
+    def __len__(self) -> int:
+        return len(self._tests)
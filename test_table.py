@@ -0,0 +1,118 @@
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt, Signal
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton
+
+from test_record import TestRecord
+from test_store import TestStore
+
+# Max number of column in the table, 10 seemed like a good compromise, can be increased.
+# The last one is used for the delete button
+MAX_COLUMNS = 10
+DELETE_COLUMN = MAX_COLUMNS - 1
+
+
+# Model of the test table, it reads the data directly from the test store (no copy of
+# the tests is made) and notifies the view only about the rows that are added or removed,
+# so the table doesn't have to be rebuilt at every change.
+# The tests are shown reversed so the new ones are at the top, "row_ids" has the ids of
+# the tests in the order they were added so a row is converted to its test in O(1).
+# Removing a row shifts the ids after it in "row_ids" (a single memmove, still fast with
+# thousands of tests), the test itself is removed from the store by id
+class TestTableModel(QAbstractTableModel):
+    def __init__(self, store: TestStore, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.row_ids = list(store.ids())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.row_ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else MAX_COLUMNS
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if index.column() == DELETE_COLUMN:
+            return None
+
+        # The labels of the test are read from its spec only for the visible cells
+        test = self.test_at(index.row())
+        columns = test.columns
+        if index.column() >= len(columns):
+            return None
+
+        # The number of runs is shown next to the name, when there is more than one
+        if index.column() == 0 and test.repetitions > 1:
+            return f"{columns[0][1]} (x{test.repetitions})"
+
+        return columns[index.column()][1]
+
+    # The items are displayed backwards in the table but are "normal" in the list of ids
+    def id_at(self, row: int) -> int:
+        return self.row_ids[len(self.row_ids) - 1 - row]
+
+    def test_at(self, row: int) -> TestRecord:
+        return self.store.get(self.id_at(row))
+
+    def append_test(self, test: TestRecord) -> int:
+        # The new test is shown in the first row
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        test_id = self.store.add(test)
+        self.row_ids.append(test_id)
+        self.endInsertRows()
+        return test_id
+
+    # Adding many tests with a single notification to the view, so the table is updated
+    # once for the whole batch instead of once per test
+    def append_tests(self, tests) -> int:
+        # The rows must be known before beginInsertRows, so the generators are consumed here
+        tests = list(tests)
+        if not tests:
+            return 0
+
+        self.beginInsertRows(QModelIndex(), 0, len(tests) - 1)
+        for test in tests:
+            self.row_ids.append(self.store.add(test))
+        self.endInsertRows()
+
+        return len(tests)
+
+    # The runs of the tests are already updated in the store, only the first column (where
+    # the runs are shown) is refreshed, the view redraws only the visible rows
+    def repetitions_changed(self):
+        if self.row_ids:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.row_ids) - 1, 0))
+
+    def remove_row(self, row: int):
+        test_id = self.id_at(row)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.store.remove(test_id)
+        del self.row_ids[len(self.row_ids) - 1 - row]
+        self.endRemoveRows()
+
+
+# Draws the "X" button in the last column of the table and reports the clicks, instead of
+# creating a real QPushButton for every row
+class DeleteButtonDelegate(QStyledItemDelegate):
+    delete_clicked = Signal(int)
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect
+        button.text = "X"
+        button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            self.delete_clicked.emit(index.row())
+            return True
+
+        return super().editorEvent(event, model, option, index)
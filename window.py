@@ -18,9 +18,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
 from PySide6.QtWidgets import (QApplication, QComboBox, QGridLayout, QGroupBox,
     QHBoxLayout, QHeaderView, QLabel, QLineEdit,
     QMainWindow, QPushButton, QRadioButton, QSizePolicy,
-    QSpacerItem, QStatusBar, QTabWidget, QTableWidget,
-    QTableWidgetItem, QVBoxLayout, QWidget)
-import images_rc
+    QSpacerItem, QStatusBar, QTabWidget, QTableView,
+    QVBoxLayout, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -35,9 +34,9 @@ class Ui_MainWindow(object):
         self.tabWidget.setObjectName(u"tabWidget")
         self.tab_tests = QWidget()
         self.tab_tests.setObjectName(u"tab_tests")
-        self.tableWidget = QTableWidget(self.tab_tests)
-        self.tableWidget.setObjectName(u"tableWidget")
-        self.tableWidget.setGeometry(QRect(40, 110, 871, 611))
+        self.tableView = QTableView(self.tab_tests)
+        self.tableView.setObjectName(u"tableView")
+        self.tableView.setGeometry(QRect(40, 110, 871, 611))
         self.layoutWidget = QWidget(self.tab_tests)
         self.layoutWidget.setObjectName(u"layoutWidget")
         self.layoutWidget.setGeometry(QRect(40, 30, 871, 61))
@@ -69,13 +68,17 @@ class Ui_MainWindow(object):
 
         self.gridLayout_5.addWidget(self.button_add_new_test, 1, 2, 1, 1)
 
+        self.button_import_template = QPushButton(self.layoutWidget)
+        self.button_import_template.setObjectName(u"button_import_template")
+
+        self.gridLayout_5.addWidget(self.button_import_template, 1, 3, 1, 1)
+
         self.tabWidget.addTab(self.tab_tests, "")
         self.tab_dimensions = QWidget()
         self.tab_dimensions.setObjectName(u"tab_dimensions")
         self.label = QLabel(self.tab_dimensions)
         self.label.setObjectName(u"label")
         self.label.setGeometry(QRect(9, 9, 958, 814))
-        self.label.setPixmap(QPixmap(u":/car/car2.svg"))
         self.label.setScaledContents(False)
         self.groupBox = QGroupBox(self.tab_dimensions)
         self.groupBox.setObjectName(u"groupBox")
@@ -582,9 +585,10 @@ class Ui_MainWindow(object):
         QWidget.setTabOrder(self.radio_car, self.radio_van)
         QWidget.setTabOrder(self.radio_van, self.radio_truck)
         QWidget.setTabOrder(self.radio_truck, self.button_create_folders)
-        QWidget.setTabOrder(self.button_create_folders, self.tableWidget)
-        QWidget.setTabOrder(self.tableWidget, self.button_add_new_test)
-        QWidget.setTabOrder(self.button_add_new_test, self.combo_test_type)
+        QWidget.setTabOrder(self.button_create_folders, self.tableView)
+        QWidget.setTabOrder(self.tableView, self.button_add_new_test)
+        QWidget.setTabOrder(self.button_add_new_test, self.button_import_template)
+        QWidget.setTabOrder(self.button_import_template, self.combo_test_type)
         QWidget.setTabOrder(self.combo_test_type, self.combo_test_name)
         QWidget.setTabOrder(self.combo_test_name, self.tabWidget)
         QWidget.setTabOrder(self.tabWidget, self.x1Front)
@@ -627,6 +631,7 @@ class Ui_MainWindow(object):
         self.label_15.setText(QCoreApplication.translate("MainWindow", u"Test Type", None))
         self.label_16.setText(QCoreApplication.translate("MainWindow", u"Test Name", None))
         self.button_add_new_test.setText(QCoreApplication.translate("MainWindow", u"Add New Test", None))
+        self.button_import_template.setText(QCoreApplication.translate("MainWindow", u"Import Template", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_tests), QCoreApplication.translate("MainWindow", u"Add Tests", None))
         self.label.setText("")
         self.groupBox.setTitle(QCoreApplication.translate("MainWindow", u"Back Profile", None))